@@ -0,0 +1,43 @@
+class ChunkStore:
+    """
+    Fixed-capacity ring of audio chunks backed by one preallocated bytearray.
+    Chunk n lives in slot n % capacity, so lookups are constant time and a
+    newer chunk simply overwrites the one capacity chunks behind it.
+    Attributes:
+        capacity (int): number of chunks kept.
+        chunk_size (int): bytes per chunk (the last chunk of a song may be shorter).
+    """
+
+    def __init__(self, capacity, chunk_size):
+        self.capacity = capacity
+        self.chunk_size = chunk_size
+        self._buffer = bytearray(capacity * chunk_size)
+        self._slots = [-1] * capacity  # chunk index held by each slot, -1 if empty
+        self._lengths = [0] * capacity
+
+    def reset(self):
+        """Forget every chunk without reallocating the buffer."""
+        for slot in range(self.capacity):
+            self._slots[slot] = -1
+
+    def put(self, chunk_index, data):
+        if len(data) > self.chunk_size:
+            raise ValueError(
+                f"Chunk of {len(data)} bytes exceeds chunk size {self.chunk_size}"
+            )
+        slot = chunk_index % self.capacity
+        start = slot * self.chunk_size
+        self._buffer[start : start + len(data)] = data
+        self._slots[slot] = chunk_index
+        self._lengths[slot] = len(data)
+
+    def get(self, chunk_index):
+        """Return the chunk as bytes, or None if it is not (or no longer) stored."""
+        slot = chunk_index % self.capacity
+        if self._slots[slot] != chunk_index:
+            return None
+        start = slot * self.chunk_size
+        return bytes(self._buffer[start : start + self._lengths[slot]])
+
+    def __contains__(self, chunk_index):
+        return self._slots[chunk_index % self.capacity] == chunk_index
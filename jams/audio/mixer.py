@@ -0,0 +1,101 @@
+import os
+
+MUSIC = "music"
+AMBIENCE = "ambience"
+
+
+class Mixer:
+    """
+    Sums the client's audio sources into the single output buffer.
+    Music comes in per callback from the stream's ring buffer; ambience is a
+    decoded PCM loop held in memory. Each source has its own gain, and the
+    ambience is ducked (faded down) while music is playing.
+    Attributes:
+        gains (dict): source name -> linear gain.
+        duck_gain (float): ambience multiplier while music plays.
+        duck_seconds (float): time the ambience takes to fade down or up.
+    """
+
+    def __init__(self, sample_rate, duck_gain=0.35, duck_seconds=0.3):
+        self.sample_rate = sample_rate
+        self.gains = {MUSIC: 1.0, AMBIENCE: 1.0}
+        self.duck_gain = duck_gain
+        self.duck_seconds = duck_seconds
+        self._ambience = None  # np.int16 loop, None when off
+        self._ambience_pos = 0
+        self._duck = 1.0  # current ambience duck level
+
+    def set_gain(self, source, gain):
+        self.gains[source] = max(0.0, float(gain))
+
+    def set_ambience(self, pcm):
+        """Loop pcm (int16 bytes) under the music, or stop it with None."""
+        import numpy as np
+
+        self._ambience_pos = 0
+        self._ambience = None if pcm is None else np.frombuffer(pcm, dtype=np.int16)
+
+    def has_ambience(self):
+        return self._ambience is not None and len(self._ambience) > 0
+
+    def mix(self, music_pcm, music_active):
+        """Mix one buffer; music_pcm is int16 bytes, silence-padded."""
+        ambience = self._ambience
+        if ambience is None or not len(ambience):
+            if self.gains[MUSIC] == 1.0:
+                return music_pcm
+            ambience = None
+
+        # Only reached once ambience or a gain is set; keeps numpy off startup
+        import numpy as np
+
+        out = np.frombuffer(music_pcm, dtype=np.int16).astype(np.float32)
+        out *= self.gains[MUSIC]
+
+        if ambience is not None:
+            frames = len(out)
+            indices = (self._ambience_pos + np.arange(frames)) % len(ambience)
+            self._ambience_pos = (self._ambience_pos + frames) % len(ambience)
+
+            # Ramp the duck level toward its target instead of jumping
+            target = self.duck_gain if music_active else 1.0
+            step = frames / (self.duck_seconds * self.sample_rate)
+            end = (
+                max(target, self._duck - step)
+                if target < self._duck
+                else min(target, self._duck + step)
+            )
+            duck = np.linspace(self._duck, end, frames, dtype=np.float32)
+            self._duck = end
+
+            out += ambience[indices] * (duck * self.gains[AMBIENCE])
+
+        np.clip(out, -32768, 32767, out=out)
+        return out.astype(np.int16).tobytes()
+
+
+def load_pcm_cached(path, sample_rate, channels=1, cache_dir="assets/.cache"):
+    """Decode an audio file to 16-bit PCM once and reuse it on later launches."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cache_path = os.path.join(cache_dir, f"{stem}-{sample_rate}-{channels}.pcm")
+    fresh = os.path.exists(cache_path) and (
+        os.path.getmtime(cache_path) >= os.path.getmtime(path)
+    )
+    if fresh:
+        with open(cache_path, "rb") as f:
+            return f.read()
+
+    # pydub is only needed the first time
+    from pydub import AudioSegment
+
+    sound = AudioSegment.from_file(path)
+    sound = sound.set_frame_rate(sample_rate).set_channels(channels)
+    pcm = sound.set_sample_width(2).raw_data
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            f.write(pcm)
+    except OSError as e:
+        print(f"Could not cache decoded audio {cache_path}: {e}")
+    return pcm
@@ -0,0 +1,118 @@
+import threading
+
+from jams.audio.mixer import Mixer
+from jams.audio.ring_buffer import PcmRingBuffer
+
+
+class AudioOutput:
+    """
+    Long-lived PyAudio output session for one client.
+    The stream runs in callback mode: PortAudio pulls fixed-size buffers
+    of music from a PcmRingBuffer (silence when it runs dry), and the
+    Mixer adds the campfire ambience. Output timing does not depend on
+    how chunks arrive, and one device stream serves both sources.
+    The engine and stream are opened on first use and kept across songs.
+    A song change only flushes the ring, the stream is reopened only
+    after the device fails, and close() releases everything when the
+    client exits.
+    Attributes:
+        sample_rate (int): frames per second of the PCM written.
+        channels (int): number of interleaved channels.
+        frames_per_buffer (int): frames PortAudio asks for per callback.
+        ring (PcmRingBuffer): music PCM waiting to be played.
+        mixer (Mixer): per-source gains and the ambience loop.
+    """
+
+    def __init__(
+        self, sample_rate, channels=1, frames_per_buffer=512, buffer_seconds=0.5
+    ):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.frames_per_buffer = frames_per_buffer
+        self.frame_bytes = 2 * channels  # 16-bit samples
+        self.ring = PcmRingBuffer(int(buffer_seconds * sample_rate) * self.frame_bytes)
+        self.mixer = Mixer(sample_rate)
+        self._pyaudio = None
+        self._pa_continue = None
+        self._stream = None
+        self._lock = threading.Lock()
+
+    @property
+    def underruns(self):
+        return self.ring.underruns
+
+    def frames_played(self):
+        """Music frames handed to the device since the session opened."""
+        return self.ring.consumed // self.frame_bytes
+
+    def open(self):
+        """Make sure the stream is open and running."""
+        with self._lock:
+            if self._stream is not None and self._stream.is_active():
+                return
+            # A stream that stopped without us asking means the device failed
+            self._drop_stream_locked()
+            if self._pyaudio is None:
+                # PortAudio is loaded on first playback, not at startup
+                import pyaudio
+
+                self._pa_continue = pyaudio.paContinue
+                self._pyaudio = pyaudio.PyAudio()
+                print("[CLIENT] PyAudio initialized")
+            self._stream = self._pyaudio.open(
+                format=self._pyaudio.get_format_from_width(2),
+                channels=self.channels,
+                rate=self.sample_rate,
+                output=True,
+                frames_per_buffer=self.frames_per_buffer,
+                stream_callback=self._callback,
+            )
+            self._stream.start_stream()
+            print("[CLIENT] Audio output opened")
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        music_active = self.ring.available() > 0
+        music = self.ring.read(frame_count * self.frame_bytes)
+        return self.mixer.mix(music, music_active), self._pa_continue
+
+    def start_ambience(self, pcm):
+        """Loop pcm under the music (same rate and channels as the output)."""
+        self.mixer.set_ambience(pcm)
+        try:
+            self.open()
+        except (IOError, OSError) as e:
+            print(f"[CLIENT] Audio output unavailable for ambience: {e}")
+
+    def stop_ambience(self):
+        self.mixer.set_ambience(None)
+
+    def write(self, pcm):
+        """Queue PCM for playback, waiting while the ring is full."""
+        try:
+            self.open()
+        except (IOError, OSError) as e:
+            print(f"[CLIENT] Audio output unavailable, skipping chunk: {e}")
+            return False
+        # Don't wait forever on a stream that died mid-song
+        return self.ring.write(pcm, timeout=1.0)
+
+    def flush(self):
+        """Discard queued audio; the stream keeps running (on silence)."""
+        self.ring.flush()
+
+    def close(self):
+        """Release the stream and the PortAudio engine."""
+        self.ring.flush()
+        with self._lock:
+            self._drop_stream_locked()
+            if self._pyaudio is not None:
+                self._pyaudio.terminate()
+                self._pyaudio = None
+
+    def _drop_stream_locked(self):
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except (IOError, OSError):
+                pass
+            self._stream = None
@@ -0,0 +1,94 @@
+import threading
+
+
+class PcmRingBuffer:
+    """
+    Single-producer, single-consumer byte ring for PCM audio.
+    The producer (network/replay thread) only moves the write position and
+    the consumer (PortAudio callback) only moves the read position, so the
+    two sides never take a lock. Positions are running byte counts; the
+    slot is position % capacity.
+    Attributes:
+        capacity (int): bytes the ring can hold.
+        underruns (int): times the consumer ran dry while audio was expected.
+        consumed (int): bytes of queued audio handed to the consumer so far.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._read_pos = 0  # written by the consumer only
+        self._write_pos = 0  # written by the producer only
+        # flush() records the write position to skip to, then bumps the
+        # request count; the consumer acks each request it has applied.
+        self._flush_to = 0  # written by flush() only
+        self._flush_requests = 0  # written by flush() only
+        self._flush_acked = 0  # written by the consumer only
+        self._epoch = 0  # bumped by flush() to abort a blocked write
+        self._idle = True  # nothing queued on purpose (paused, between songs)
+        self._space_available = threading.Event()
+        self.underruns = 0
+        self.consumed = 0
+
+    def available(self):
+        """Bytes queued for the consumer."""
+        read_pos = self._read_pos
+        if self._flush_requests != self._flush_acked:
+            read_pos = max(read_pos, self._flush_to)
+        return self._write_pos - read_pos
+
+    def write(self, data, timeout=None):
+        """Queue data, waiting for space. Returns False if a flush cut it short."""
+        epoch = self._epoch
+        self._idle = False
+        view = memoryview(data)
+        while len(view):
+            if epoch != self._epoch:
+                return False
+            self._space_available.clear()
+            free = self.capacity - self.available()
+            if free <= 0:
+                if not self._space_available.wait(timeout):
+                    return False
+                continue
+            count = min(free, len(view))
+            start = self._write_pos % self.capacity
+            first = min(count, self.capacity - start)
+            self._buffer[start : start + first] = view[:first]
+            self._buffer[: count - first] = view[first:count]
+            self._write_pos += count
+            view = view[count:]
+        return True
+
+    def read(self, size):
+        """Take size bytes, padding with silence if the ring runs dry."""
+        requests = self._flush_requests
+        if requests != self._flush_acked:
+            # A later flush only moves the target forward, never back
+            self._read_pos = max(self._read_pos, self._flush_to)
+            self._flush_acked = requests
+
+        count = min(size, self.available())
+        start = self._read_pos % self.capacity
+        first = min(count, self.capacity - start)
+        out = bytes(self._buffer[start : start + first]) + bytes(
+            self._buffer[: count - first]
+        )
+        self._read_pos += count
+        self.consumed += count
+        self._space_available.set()
+
+        if count < size:
+            if not self._idle:
+                self.underruns += 1
+                self._idle = True  # count each starvation once
+            out += bytes(size - count)
+        return out
+
+    def flush(self):
+        """Drop everything queued; the consumer skips it on its next read."""
+        self._epoch += 1
+        self._idle = True
+        self._flush_to = self._write_pos
+        self._flush_requests += 1
+        self._space_available.set()
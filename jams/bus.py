@@ -0,0 +1,206 @@
+"""
+Message bus for running the JamServer as several worker processes.
+
+Each worker owns its rooms, so an emit to a room (or to a client) that
+this worker holds is delivered directly, as with the default client
+manager. Anything else - a broadcast to every client, an emit to a sid
+on another worker, a server event such as a song added to the library -
+goes over the bus to every worker: UnixSocketBusManager, through a
+BusHub on a Unix socket, with no broker needed. Messages travel as JSON,
+so event data sent across workers must be JSON-serializable.
+"""
+
+import json
+import os
+import socket
+import struct
+import threading
+
+import socketio
+
+_FRAME = struct.Struct("<I")
+PUBLISHER = b"P"
+SUBSCRIBER = b"S"
+
+
+class BusManager(socketio.PubSubManager):
+    """
+    Client manager that keeps local emits local and publishes the rest.
+    Subclasses implement _publish(message) and _receive(), which yields
+    the message dicts published by any worker (this one included).
+    Attributes:
+        server_handlers (dict): {event name: handler(data)} for server events.
+    """
+
+    name = "bus"
+
+    def __init__(self, channel="socketio", write_only=False, logger=None):
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+        self.server_handlers = {}
+
+    def emit(self, event, data, namespace=None, room=None, skip_sid=None, **kwargs):
+        if room is not None and self._owns(namespace, room):
+            kwargs["ignore_queue"] = True
+        return super().emit(
+            event, data, namespace=namespace, room=room, skip_sid=skip_sid, **kwargs
+        )
+
+    def _owns(self, namespace, room):
+        # A sid is a room of its own, so this covers single clients too
+        return room in self.rooms.get(namespace or "/", {})
+
+    def on_server_event(self, name, handler):
+        """Call handler(data) when another worker publishes a server event."""
+        self.server_handlers[name] = handler
+
+    def publish_server_event(self, name, data):
+        self._publish(
+            {
+                "method": "server_event",
+                "name": name,
+                "data": data,
+                "host_id": self.host_id,
+            }
+        )
+
+    def _listen(self):
+        for message in self._receive():
+            if message.get("method") != "server_event":
+                yield message
+                continue
+            handler = self.server_handlers.get(message.get("name"))
+            if handler and message.get("host_id") != self.host_id:
+                try:
+                    handler(message.get("data"))
+                except Exception as e:
+                    print(f"[SERVER] Bus handler {message.get('name')} failed: {e}")
+
+    def _receive(self):
+        raise NotImplementedError
+
+
+def _send_frame(sock, payload):
+    sock.sendall(_FRAME.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock, size):
+    data = b""
+    while len(data) < size:
+        part = sock.recv(size - len(data))
+        if not part:
+            raise ConnectionError("bus connection closed")
+        data += part
+    return data
+
+
+def _recv_frame(sock):
+    (size,) = _FRAME.unpack(_recv_exact(sock, _FRAME.size))
+    return _recv_exact(sock, size)
+
+
+class UnixSocketBusManager(BusManager):
+    """
+    Bus between worker processes through a BusHub listening on path.
+    Publishing and receiving use separate connections, so a slow reader
+    never holds up a handler that emits.
+    Attributes:
+        path (str): the hub's Unix socket.
+    """
+
+    name = "unix"
+
+    def __init__(self, path, channel="socketio", write_only=False, logger=None):
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+        self.path = path
+        self._publisher = None
+        self._publish_lock = threading.Lock()
+
+    def _connect(self, role):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(self.path)
+        sock.sendall(role)
+        return sock
+
+    def _publish(self, data):
+        try:
+            payload = json.dumps(data).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            print(f"[SERVER] Bus message not JSON-serializable: {e}")
+            return
+        with self._publish_lock:
+            try:
+                if self._publisher is None:
+                    self._publisher = self._connect(PUBLISHER)
+                _send_frame(self._publisher, payload)
+            except OSError as e:
+                print(f"[SERVER] Bus publish failed: {e}")
+                self._publisher = None
+
+    def _receive(self):
+        sock = self._connect(SUBSCRIBER)
+        while True:
+            try:
+                yield json.loads(_recv_frame(sock).decode("utf-8"))
+            except ValueError as e:
+                print(f"[SERVER] Dropping malformed bus message: {e}")
+
+
+class BusHub:
+    """
+    Unix socket hub for UnixSocketBusManager: every frame a publisher
+    sends is forwarded to all subscribers. Runs on plain threads in the
+    front process.
+    Attributes:
+        path (str): socket path, removed again by close().
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.subscribers = []
+        self._lock = threading.Lock()
+        self._sock = None
+
+    def start(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(self.path)
+        self._sock.listen(64)
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _accept(self):
+        while self._sock is not None:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        try:
+            role = _recv_exact(conn, 1)
+            if role == SUBSCRIBER:
+                with self._lock:
+                    self.subscribers.append(conn)
+                return
+            while True:
+                payload = _recv_frame(conn)
+                with self._lock:
+                    subscribers = list(self.subscribers)
+                for subscriber in subscribers:
+                    try:
+                        _send_frame(subscriber, payload)
+                    except OSError:
+                        with self._lock:
+                            if subscriber in self.subscribers:
+                                self.subscribers.remove(subscriber)
+        except (ConnectionError, OSError):
+            pass
+        conn.close()
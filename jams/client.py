@@ -1,14 +1,13 @@
 import tkinter as tk
-from screens.audio_player_screen import AudioPlayerScreen
 from jams.shared.song_queue import SongQueue
+from jams.shared.queue_ops import make_remove_op
+from jams.audio.chunk_store import ChunkStore
+from jams.audio.output import AudioOutput
 import socketio
 import threading
-import pyaudio
 import base64
-import io
-import wave
-import time
-from screens.constants import LOCAL_IP, LOCAL_PORT
+from screens.constants import AUDIO_NAMESPACE, LOCAL_IP, LOCAL_PORT
+from utils.ui_dispatcher import UIDispatcher
 
 
 class Client:
@@ -22,6 +21,12 @@ class Client:
         self.metadata = metadata
         self.sio = socketio.Client()
         self.connected = False
+        # Audio chunks get a connection of their own once in a room, so
+        # pause/seek/queue events never wait behind a run of chunks
+        # It is per room, so it isn't reconnected; chunks fall back to sio
+        self.audio_sio = socketio.Client(reconnection=False)
+        self.audio_connected = False
+        self.server_url = None
         self.room_code = None
         self.username = None
         self.color = None
@@ -31,9 +36,13 @@ class Client:
         self._room_joined_processed = (
             False  # Track if room_joined event has been processed
         )
+        # Screens waiting for the host's room code; called with the reply
+        self.room_created_listeners = []
 
         # Thread safety
         self.socket_lock = threading.Lock()
+        # Socket handlers run off the Tk thread; UI work goes through here
+        self.ui = UIDispatcher(root)
 
         # Queue tracking
         self.previous_queue_length = (
@@ -41,12 +50,21 @@ class Client:
         )
 
         # Audio streaming settings
-        self.audio_stream = None
-        self.pyaudio_player = None
-        self.current_audio_chunks = {}
         self.is_streaming = False
         self.sample_rate = 44100
         self.chunk_size = 4096
+        # One callback-mode output session for the client's lifetime
+        self.audio_output = AudioOutput(self.sample_rate)
+        # Keep ~30s of played chunks so backward seeks can replay locally
+        self.chunk_store = ChunkStore(
+            30 * self.sample_rate * 2 // self.chunk_size, self.chunk_size
+        )
+        self.expected_chunk_index = None  # Only this chunk may be played next
+        self.stream_generation = 0  # Bumped on every seek to stop stale replays
+        # Playback clock: song frame at clock start + frames the device consumed since
+        self.stream_total_frames = 0
+        self._clock_song_frame = None
+        self._clock_output_frame = 0
         self.current_song_index = -1  # Track currently playing song index
         self.starting_new_stream = (
             False  # Flag to prevent stopping stream during startup
@@ -58,11 +76,13 @@ class Client:
         elif self.position > 0:
             self.rel_position = "R"
 
-        # Initialize audio player screen
-        self.audio_player = AudioPlayerScreen(root, metadata=metadata, client=self)
+        # The room's queue lives here; the player screen shows it
+        self.queue_manager = SongQueue([])
 
-        # Initialize queue manager
-        self.queue_manager = self.audio_player.queue_manager
+        # The player screen (with its microphone, fire sound and images) is
+        # only built once a room is entered; until then the root stays hidden
+        self.audio_player = None
+        self.root.withdraw()
 
         # Set up socket event handlers
         self.setup_socket_handlers()
@@ -83,6 +103,17 @@ class Client:
             )
             print(f"[CLIENT] Disconnect - sio.connected: {self.sio.connected}")
             self.connected = False
+            self.disconnect_audio()
+
+        @self.audio_sio.on("connect", namespace=AUDIO_NAMESPACE)
+        def audio_connect():
+            print("[CLIENT] Audio channel connected")
+            self.audio_connected = True
+
+        @self.audio_sio.on("disconnect", namespace=AUDIO_NAMESPACE)
+        def audio_disconnect():
+            print("[CLIENT] Audio channel disconnected")
+            self.audio_connected = False
 
         @self.sio.event
         def test_response(data):
@@ -96,9 +127,10 @@ class Client:
                 self.room_code = data.get("room_code")
                 print(f"Room created with code: {self.room_code}")
                 print(f"Room created data: {data}")
-                # Trigger the room_created event for any UI listeners
-                if hasattr(self, "sio"):
-                    self.sio.emit("room_created", data)
+                self.connect_audio_in_background()
+                # Let UI listeners know, now that room_code is set
+                for listener in list(self.room_created_listeners):
+                    listener(data)
             except Exception as e:
                 print(f"[CLIENT] Error in room_created: {e}")
                 import traceback
@@ -106,25 +138,28 @@ class Client:
                 traceback.print_exc()
 
         @self.sio.event
-        def room_joined(data):
-            """Called when successfully joining a room."""
+        def room_snapshot(data):
+            """Called once on join with the room's roster, queue and playhead."""
             try:
-                print(f"Joined room: {data.get('room_code')}")
-                print(f"Room joined data: {data}")
-
-                # Get initial players list
+                self.room_code = data.get("room_code", self.room_code)
+                self.connect_audio_in_background()
                 players_data = data.get("players", [])
-                print(f"Initial players data: {players_data}")
-                if players_data:
-                    print(f"Updating players with {len(players_data)} players")
-                    # Use after to ensure UI is ready
-                    self.root.after(
-                        100, lambda: self.audio_player.update_players(players_data)
-                    )
-                else:
-                    print("No players data received")
+                playhead = data.get("playhead", {})
+                print(
+                    f"Joined room: {self.room_code} (v{data.get('version', 0)}, {len(players_data)} players, {len(data.get('queue', []))} songs)"
+                )
+
+                self.queue_manager.set_snapshot(
+                    data.get("queue", []),
+                    data.get("version", 0),
+                    data.get("current_idx", 0),
+                )
+                self.fetch_missing_song_records()
+
+                # Render everything in a single pass on the Tk thread
+                self.ui.post(self._apply_room_snapshot, players_data, playhead)
             except Exception as e:
-                print(f"[CLIENT] Error in room_joined: {e}")
+                print(f"[CLIENT] Error in room_snapshot: {e}")
                 import traceback
 
                 traceback.print_exc()
@@ -134,13 +169,13 @@ class Client:
             """Called when a new user joins the room."""
             username = data.get("username")
             color_idx = data.get("color_idx")
-            position_idx = data.get("position_idx", len(self.audio_player.players))
+            position_idx = data.get("position_idx")
             print(
                 f"User {username} joined with color {color_idx} at position {position_idx}"
             )
 
             # Add player to audio player screen
-            self.audio_player.add_player(username, color_idx, position_idx)
+            self._post_player("add_player", username, color_idx, position_idx)
 
         @self.sio.event
         def user_left(data):
@@ -149,7 +184,7 @@ class Client:
             print(f"User {username} left the room")
 
             # Remove player from audio player screen
-            self.audio_player.remove_player(username)
+            self._post_player("remove_player", username)
 
         @self.sio.event
         def players_updated(data):
@@ -157,7 +192,7 @@ class Client:
             players_data = data.get("players", [])
             print(f"Players updated: {players_data}")
 
-            self.root.after(100, lambda: self.audio_player.update_players(players_data))
+            self._post_player("update_players", players_data, key="players")
 
         @self.sio.event
         def url_processing(data):
@@ -165,8 +200,7 @@ class Client:
             message = data.get("message", "Processing URL...")
             print(f"URL processing: {message}")
             # Set downloading state in the queue UI
-            if hasattr(self.audio_player, "queue_ui") and self.audio_player.queue_ui:
-                self.audio_player.queue_ui.set_downloading_state()
+            self.ui.post(self._update_queue_ui, "set_downloading_state")
 
         @self.sio.event
         def url_processed(data):
@@ -179,46 +213,68 @@ class Client:
             print(f"URL processed - Status: {status}, Message: {message}")
 
             # Reset the add button state regardless of success/failure
-            if hasattr(self.audio_player, "queue_ui") and self.audio_player.queue_ui:
-                self.audio_player.queue_ui.reset_add_button_state()
+            self.ui.post(self._update_queue_ui, "reset_add_button_state")
 
         @self.sio.event
-        def queue_synced(data):
-            """Called when the queue has been synced by another client."""
-            new_queue = data.get("queue", [])
+        def queue_delta(data):
+            """Called when the server applied a queue op for the room."""
+            version = data.get("version", 0)
+            op = data.get("op", {})
             updated_by = data.get("updated_by")
 
+            if version <= self.queue_manager.version:
+                # Already applied (e.g. a snapshot arrived first)
+                return
+            if version != self.queue_manager.version + 1:
+                print(
+                    f"[CLIENT] Queue version gap: have v{self.queue_manager.version}, got v{version}, requesting snapshot"
+                )
+                self.request_queue_snapshot()
+                return
+
+            try:
+                self.queue_manager.apply_op(op)
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"[CLIENT] Could not apply queue op v{version}: {e}")
+                self.request_queue_snapshot()
+                return
+
+            self.queue_manager.version = version
             print(
-                f"[CLIENT] Received queue_synced event from {updated_by}: {len(new_queue)} songs (was {self.previous_queue_length})"
+                f"[CLIENT] Applied queue_delta v{version} ({op.get('type')}) from {updated_by}"
             )
+            self._on_queue_changed(data.get("current_idx"))
 
-            # Update local queue
-            self.queue_manager.queue = new_queue
-            if hasattr(self.audio_player, "queue_ui") and self.audio_player.queue_ui:
-                self.audio_player.queue_ui.display_queue()
-                print("Updated UI for synced queue")
-            else:
-                print("Queue UI not open, queue updated in background")
-
-            # Always auto-play the first song if not already playing
-            should_autoplay = False
-            if len(new_queue) > 0:
-                # If nothing is playing or current_song_index is out of range, auto-play
-                if (
-                    not self.audio_player.is_playing
-                    or self.audio_player.current_song_index < 0
-                    or self.audio_player.current_song_index >= len(new_queue)
-                ):
-                    should_autoplay = True
-            if should_autoplay:
-                print("[CLIENT] Auto-playing first song from synced queue (force)")
-                self.audio_player.play_song_from_queue(0)
-            else:
-                print(
-                    f"[CLIENT] Not auto-playing: is_playing={self.audio_player.is_playing}, current_song_index={self.audio_player.current_song_index}, queue_len={len(new_queue)}"
-                )
+        @self.sio.event
+        def queue_snapshot(data):
+            """Called with the full queue on join or after a version gap."""
+            new_queue = data.get("queue", [])
+            version = data.get("version", 0)
+
+            print(
+                f"[CLIENT] Received queue_snapshot v{version}: {len(new_queue)} songs (was v{self.queue_manager.version})"
+            )
+            self.queue_manager.set_snapshot(new_queue, version)
+            self._on_queue_changed(data.get("current_idx"), autoplay=False)
+
+        @self.sio.event
+        def song_records(data):
+            """Called with song records requested via get_song_records."""
+            added = self.queue_manager.records.add(data.get("records", []))
+            print(f"[CLIENT] Cached {len(added)} song records")
+            self.refresh_queue_ui()
+
+        @self.sio.event
+        def covers(data):
+            """Called with cover images requested via get_covers."""
+            covers = data.get("covers", {})
+            self.queue_manager.records.add_covers(covers, data.get("hashes"))
+            print(f"[CLIENT] Cached {len(covers)} covers")
 
-            self.previous_queue_length = len(new_queue)
+            self.refresh_queue_ui()
+            current = getattr(self.audio_player, "metadata", None)
+            if current is not None and current.cover_hash in covers:
+                self._post_player("refresh_album_art", key="album_art")
 
         @self.sio.event
         def current_index_synced(data):
@@ -231,13 +287,12 @@ class Client:
             )
 
             # Update local current index
-            if hasattr(self.audio_player, "queue_manager"):
-                self.audio_player.queue_manager.current_idx = current_idx
+            self.queue_manager.current_idx = current_idx
+            if self.audio_player is not None:
                 self.audio_player.current_song_index = current_idx
 
             # Update UI to show current song
-            if hasattr(self.audio_player, "queue_ui") and self.audio_player.queue_ui:
-                self.audio_player.queue_ui.display_queue()
+            self.refresh_queue_ui()
 
         @self.sio.event
         def audio_stream_ready(data):
@@ -245,18 +300,42 @@ class Client:
             room_code = data.get("room_code")
             song = data.get("song", {})
             total_chunks = data.get("total_chunks", 0)
+            total_frames = data.get("total_frames", 0)
+            start_chunk = data.get("start_chunk", 0)
+
+            print(
+                f"Audio stream ready for song: {song.get('title', 'Unknown')} (from chunk {start_chunk})"
+            )
 
-            print(f"Audio stream ready for song: {song.get('name', 'Unknown')}")
+            if song.get("song_id"):
+                self.queue_manager.records.add([song])
 
-            # Set flag to prevent stopping stream during startup
-            self.starting_new_stream = True
+            # Set flag to prevent stopping stream during startup. A late join
+            # gets no song_started to clear it, so only set it for new songs.
+            if start_chunk == 0:
+                self.starting_new_stream = True
 
             # Stop any existing audio stream before starting new one
             if self.is_streaming:
                 print("Stopping existing audio stream")
                 self.stop_audio_stream()
 
-            self.start_audio_stream(room_code, total_chunks)
+            self.current_song_index = data.get("song_index", self.current_song_index)
+            self.start_audio_stream(
+                room_code,
+                total_chunks,
+                total_frames=total_frames,
+                start_chunk=start_chunk,
+                paused=data.get("is_paused", False),
+            )
+
+            # The exact length replaces the whole-second metadata length
+            if total_frames:
+                self._post_player(
+                    "update_progress_bar",
+                    total_frames / self.sample_rate,
+                    key="duration",
+                )
 
         @self.sio.event
         def audio_chunk(data):
@@ -265,6 +344,13 @@ class Client:
             chunk_index = data.get("chunk_index")
             audio_data_b64 = data.get("audio_data")
 
+            # Chunks requested before a seek arrive late; drop them
+            if chunk_index != self.expected_chunk_index:
+                print(f"Dropping stale audio chunk {chunk_index}")
+                return
+            # Accepted: the next chunk is the only one that may follow it
+            self.expected_chunk_index = chunk_index + 1
+
             if audio_data_b64:
                 # Decode audio chunk
                 audio_chunk = base64.b64decode(audio_data_b64)
@@ -275,13 +361,16 @@ class Client:
                 # Play the audio chunk immediately
                 self.play_audio_chunk(audio_chunk)
 
-                # Store chunk for potential future use
-                self.current_audio_chunks[chunk_index] = audio_chunk
+                # Keep it around for local backward seeks
+                self.buffer_chunk(chunk_index, audio_chunk)
 
-                # Request next chunk if streaming
-                if self.is_streaming:
+                # Request next chunk if streaming and no seek moved us meanwhile
+                if self.is_streaming and self.expected_chunk_index == chunk_index + 1:
                     self.request_next_chunk(room_code, chunk_index + 1)
 
+        # Chunks come over the audio channel, or this one until it is up
+        self.audio_sio.on("audio_chunk", audio_chunk, namespace=AUDIO_NAMESPACE)
+
         @self.sio.event
         def song_started(data):
             """Called when a song starts playing."""
@@ -289,7 +378,7 @@ class Client:
             song_index = data.get("song_index")
             song = data.get("song", {})
 
-            print(f"Song started: {song.get('name', 'Unknown')} at index {song_index}")
+            print(f"Song started: {song.get('title', 'Unknown')} at index {song_index}")
             print(
                 f"Debug - is_streaming: {self.is_streaming}, song_index: {song_index}, current_song_index: {getattr(self, 'current_song_index', -1)}, starting_new_stream: {self.starting_new_stream}"
             )
@@ -310,17 +399,24 @@ class Client:
             # Update current song index
             self.current_song_index = song_index
 
+            # The event carries the song's record, so the player never waits on it
+            if song.get("song_id"):
+                self.queue_manager.records.add([song])
+
             # Also update the audio player's current song index
-            if hasattr(self.audio_player, "queue_manager"):
-                self.audio_player.queue_manager.current_idx = song_index
+            self.queue_manager.current_idx = song_index
+            if self.audio_player is not None:
                 self.audio_player.current_song_index = song_index
-                self.audio_player._load_and_play_song(song_index)
+            self._post_player("_load_and_play_song", song_index)
 
-            if hasattr(self, "queue_ui") and self.audio_player.queue_ui:
-                self.audio_player.queue_ui.display_queue()
+            self.refresh_queue_ui()
 
             # Clear the starting flag after a short delay to ensure stream is fully established
-            self.root.after(2000, lambda: setattr(self, "starting_new_stream", False))
+            self.ui.post(
+                self.root.after,
+                2000,
+                lambda: setattr(self, "starting_new_stream", False),
+            )
 
         @self.sio.event
         def stream_paused(data):
@@ -331,23 +427,11 @@ class Client:
             print(f"Stream paused for song index: {song_index} at position: {position}")
 
             # Update audio player state
-            if hasattr(self.audio_player, "is_playing"):
-                self.audio_player.is_playing = False
-                if hasattr(self.audio_player, "play_btn"):
-                    self.audio_player.play_btn.config(text="▶")
-            if hasattr(self.audio_player, "paused_position"):
-                self.audio_player.paused_position = position
-            if hasattr(self.audio_player, "stream_start_time"):
-                self.audio_player.stream_start_time = None
-            if hasattr(self.audio_player, "progress"):
-                self.audio_player.progress.set(position)
-                if hasattr(self.audio_player, "time_label_start"):
-                    self.audio_player.time_label_start.config(
-                        text=self.audio_player.format_time(position)
-                    )
-
-            # Stop requesting audio chunks when paused
+            self._post_player("show_play_state", False, position, key="play_state")
+
+            # Stop requesting audio chunks when paused and silence what's queued
             self.is_streaming = False
+            self.audio_output.flush()
             print(f"Stopped requesting audio chunks for room {room_code}")
 
         @self.sio.event
@@ -361,107 +445,42 @@ class Client:
             )
 
             # Update audio player state
-            if hasattr(self.audio_player, "is_playing"):
-                self.audio_player.is_playing = True
-                if hasattr(self.audio_player, "play_btn"):
-                    self.audio_player.play_btn.config(text="⏸️")
-            if hasattr(self.audio_player, "paused_position"):
-                self.audio_player.paused_position = position
-            if hasattr(self.audio_player, "stream_start_time"):
-                self.audio_player.stream_start_time = time.time() - position
-            if hasattr(self.audio_player, "progress"):
-                self.audio_player.progress.set(position)
-                if hasattr(self.audio_player, "time_label_start"):
-                    self.audio_player.time_label_start.config(
-                        text=self.audio_player.format_time(position)
-                    )
+            self._post_player("show_play_state", True, position, key="play_state")
 
             # Check if audio stream is closed and reopen if necessary
-            if not self.audio_stream or not self.audio_stream.is_active():
-                print("Audio stream is closed, reopening...")
-                try:
-                    # Initialize PyAudio if needed
-                    if not self.pyaudio_player:
-                        self.pyaudio_player = pyaudio.PyAudio()
-
-                    # Open new audio stream
-                    self.audio_stream = self.pyaudio_player.open(
-                        format=pyaudio.paInt16,
-                        channels=1,
-                        rate=self.sample_rate,
-                        output=True,
-                        frames_per_buffer=self.chunk_size,
-                    )
-                    print("Audio stream reopened successfully")
-                except Exception as e:
-                    print(f"Error reopening audio stream: {e}")
-                    import traceback
-
-                    traceback.print_exc()
+            self.audio_output.open()
 
             # Resume requesting audio chunks
             self.is_streaming = True
 
             # Calculate the chunk index for the current paused position
-            samples_per_chunk = self.chunk_size // 2  # 2 bytes per sample
-            chunk_index = int(position * self.sample_rate / samples_per_chunk)
+            chunk_index = self.position_to_chunk(position)
             print(f"Resuming from chunk {chunk_index} (position: {position}s)")
-            self.request_next_chunk(room_code, chunk_index)
+            self.play_from_chunk(room_code, chunk_index)
 
         @self.sio.event
         def stream_seeked(data):
             """Called when audio stream is seeked to a new position."""
-            room_code = data.get("room_code")
-            song_index = data.get("song_index")
-            position = data.get("position", 0)
-            print(f"Stream seeked to {position}s for song index: {song_index}")
-
-            # Stop streaming temporarily to clear all pending requests
-            self.is_streaming = False
-            print(f"Stopped streaming temporarily for seek")
-
-            # Clear the audio buffer to prevent old audio from playing
-            self.current_audio_chunks = {}
-            print(f"Cleared audio buffer for seek to {position}s")
-
-            # Update audio player state
-            if hasattr(self.audio_player, "stream_start_time"):
-                # Adjust the stream start time to reflect the new position
-                self.audio_player.stream_start_time = time.time() - position
-                self.audio_player.paused_position = position
-
-            # Update progress bar
-            if hasattr(self.audio_player, "progress"):
-                self.audio_player.progress.set(position)
-                if hasattr(self.audio_player, "time_label_start"):
-                    self.audio_player.time_label_start.config(
-                        text=self.audio_player.format_time(position)
-                    )
-
-            # Restart streaming from new position
-            self.is_streaming = True
-            # Each sample is 2 bytes (16-bit), so we need to account for that
-            samples_per_chunk = self.chunk_size // 2  # 2 bytes per sample
-            chunk_index = int(position * self.sample_rate / samples_per_chunk)
-
-            # Debug: Calculate the actual time this chunk represents
-            actual_time = chunk_index * samples_per_chunk / self.sample_rate
-            print(
-                f"Client seek: {position}s -> chunk {chunk_index} -> actual time: {actual_time:.2f}s"
-            )
-
-            print(
-                f"Restarting streaming from chunk {chunk_index} for seek position {position}s"
+            # The seeking client already applied its own seek locally
+            if data.get("updated_by") == self.sio.sid:
+                return
+            self.apply_seek(
+                data.get("room_code"),
+                data.get("position", 0),
+                data.get("is_paused", False),
             )
-            self.request_next_chunk(room_code, chunk_index)
 
         @self.sio.event
         def user_talking_update(data):
             """Update a player's talking state in the UI when received from server."""
             username = data.get("username")
             is_talking = bool(data.get("is_talking", 0))
-            if hasattr(self.audio_player, "update_remote_talking_state"):
-                self.audio_player.update_remote_talking_state(username, is_talking)
+            self._post_player(
+                "update_remote_talking_state",
+                username,
+                is_talking,
+                key=f"talking:{username}",
+            )
 
     def create_room(self, username, color):
         """Create a new jam room as host."""
@@ -473,6 +492,7 @@ class Client:
             self.username = username
             self.color = color
             self.is_host = True
+            self.ui.post(self.open_audio_player)
 
             print(
                 f"Emitting create_room with username: {username}, color_idx: {color.color_index}"
@@ -493,6 +513,7 @@ class Client:
             self.username = username
             self.color = color
             self.is_host = False
+            self.ui.post(self.open_audio_player)
 
             self.sio.emit(
                 "join_room",
@@ -504,10 +525,27 @@ class Client:
             )
             return True
 
-    def connect_to_server(self, server_url=None):
-        """Connect to the socket server."""
+    def add_room_created_listener(self, listener):
+        """Call listener(data) after a room_created reply sets room_code."""
+        if listener not in self.room_created_listeners:
+            self.room_created_listeners.append(listener)
+
+    def connect_to_server(self, server_url=None, room_code=None):
+        """Connect to the socket server.
+
+        room_code, when joining, lets a multi-worker server route the
+        connection to the worker that owns the room (see jams.router).
+        """
         if server_url is None:
             server_url = f"http://{LOCAL_IP}:{LOCAL_PORT}"
+        self.server_url = server_url
+        if room_code:
+            server_url += f"?room={room_code}"
+        if self.sio.connected:
+            if self.sio.connection_url == server_url:
+                return True
+            # A multi-worker server may route the new URL elsewhere
+            self.sio.disconnect()
         try:
             self.sio.connect(server_url, wait_timeout=10)
             return True
@@ -515,18 +553,199 @@ class Client:
             print(f"Failed to connect to server: {e}")
             return False
 
-    def sync_queue_with_server(self, queue):
-        """Sync the local queue with the server."""
+    def connect_with_backoff(
+        self, server_url=None, timeout=5.0, first_delay=0.05, room_code=None
+    ):
+        """Connect, retrying with exponential backoff until timeout seconds pass."""
+        import time
+
+        deadline = time.monotonic() + timeout
+        delay = first_delay
+        while True:
+            if self.connect_to_server(server_url, room_code):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+
+    def connect_audio(self):
+        """Open the audio channel to the room's server (see AUDIO_NAMESPACE)."""
+        if self.audio_sio.connected or not self.server_url or not self.room_code:
+            return self.audio_connected
+        try:
+            # The room code routes it to the room's worker, like the join did
+            self.audio_sio.connect(
+                f"{self.server_url}?room={self.room_code}",
+                namespaces=[AUDIO_NAMESPACE],
+                wait_timeout=10,
+            )
+        except Exception as e:
+            print(f"[CLIENT] No audio channel, streaming over the main one: {e}")
+        return self.audio_connected
+
+    def connect_audio_in_background(self):
+        # Called from socket handlers, which must not block on a connect
+        threading.Thread(target=self.connect_audio, daemon=True).start()
+
+    def disconnect_audio(self):
+        if self.audio_sio.connected:
+            try:
+                self.audio_sio.disconnect()
+            except Exception as e:
+                print(f"[CLIENT] Error closing audio channel: {e}")
+        self.audio_connected = False
+
+    def on_server_restarted(self):
+        """The hosted server crashed and was restarted without its rooms."""
+        print("[CLIENT] Server restarted, leaving the room")
+        # sio reconnects by itself once the new server listens
+        self.disconnect_audio()
+        self.ui.post(
+            self.return_to_landing,
+            "The server restarted and the room was closed.",
+            key="return_to_landing",
+        )
+
+    def return_to_landing(self, message=None):
+        """Leave the room and show the landing screen again (Tk thread)."""
+        from tkinter import messagebox
+        from screens.landing import LandingScreen
+
+        self.stop_audio_stream()
+        self.room_code = None
+        self.is_host = False
+        self._room_joined_processed = False
+        self.current_song_index = -1
+        self.queue_manager.set_snapshot([], 0, 0)
+        self.refresh_queue_ui()
+        self.root.withdraw()
+        if message:
+            messagebox.showinfo("Fire Jams", message)
+        LandingScreen(self)
+
+    def send_queue_op(self, op):
+        """Send a queue op to the server, which applies and broadcasts it."""
         if self.connected and self.room_code:
             with self.socket_lock:
-                # Strip base64 data to reduce payload size
-                stripped_queue = self._strip_base64_from_queue(queue)
-                print(f"[CLIENT] About to emit sync_queue_with_friends event")
+                print(f"[CLIENT] About to emit queue_op ({op.get('type')})")
                 self.sio.emit(
-                    "sync_queue_with_friends",
-                    {"room_code": self.room_code, "queue": stripped_queue},
+                    "queue_op",
+                    {
+                        "room_code": self.room_code,
+                        "op": op,
+                        "base_version": self.queue_manager.version,
+                    },
                 )
                 return True
+        return False
+
+    def request_queue_snapshot(self):
+        """Ask the server for the full queue after missing a delta."""
+        if self.connected and self.room_code:
+            self.sio.emit("request_queue_snapshot", {"room_code": self.room_code})
+
+    def fetch_missing_song_records(self):
+        """Request records for queued song IDs we haven't cached yet."""
+        missing = self.queue_manager.records.missing(self.queue_manager.queue)
+        if missing and self.connected:
+            self.sio.emit("get_song_records", {"song_ids": missing})
+
+    def request_covers(self, cover_hashes):
+        """Fetch covers for on-screen songs that aren't cached yet."""
+        missing = self.queue_manager.records.missing_covers(cover_hashes)
+        if missing and self.connected:
+            self.sio.emit("get_covers", {"hashes": missing})
+
+    def open_audio_player(self):
+        """Build the player screen on first use and show it (Tk thread)."""
+        if self.audio_player is None:
+            from screens.audio_player_screen import AudioPlayerScreen
+
+            self.audio_player = AudioPlayerScreen(
+                self.root, metadata=self.metadata, client=self
+            )
+        self.root.deiconify()
+
+    def _post_player(self, method_name, *args, key=None):
+        """Call a player screen method on the Tk thread, once the screen exists."""
+        self.ui.post(self._call_player, method_name, *args, key=key)
+
+    def _call_player(self, method_name, *args):
+        if self.audio_player is not None:
+            getattr(self.audio_player, method_name)(*args)
+
+    def close_before_room(self):
+        """A pre-room screen was closed; with no player window, quit the app."""
+        if self.audio_player is None:
+            self.close_audio()
+            self.root.destroy()
+
+    def _apply_room_snapshot(self, players_data, playhead):
+        """Render a joined room's snapshot on the Tk thread."""
+        self.open_audio_player()
+        self.audio_player.update_players(players_data)
+
+        song_index = playhead.get("song_index", 0)
+        if playhead.get("is_playing") and song_index < len(self.queue_manager.queue):
+            self.current_song_index = song_index
+            self.audio_player.show_song_at(
+                song_index,
+                playhead.get("position", 0),
+                playhead.get("is_paused", False),
+            )
+
+        self._update_queue_ui("display_queue")
+
+    def _update_queue_ui(self, method_name):
+        """Call a queue UI method on the Tk thread, if the queue is open."""
+        queue_ui = getattr(self.audio_player, "queue_ui", None)
+        if queue_ui:
+            getattr(queue_ui, method_name)()
+
+    def refresh_queue_ui(self):
+        """Redraw the queue once per frame however many updates arrive."""
+        self.ui.post(self._update_queue_ui, "display_queue", key="display_queue")
+
+    def _on_queue_changed(self, current_idx=None, autoplay=True):
+        """Refresh the queue UI and auto-play after the queue changed."""
+        self.fetch_missing_song_records()
+
+        # Keep the current song index in line with the server's
+        if current_idx is not None:
+            self.queue_manager.current_idx = current_idx
+            if self.audio_player is not None:
+                self.audio_player.current_song_index = current_idx
+
+        self.refresh_queue_ui()
+        self.previous_queue_length = len(self.queue_manager.queue)
+        if autoplay:
+            self.ui.post(self._autoplay_if_idle, key="autoplay")
+
+    def _autoplay_if_idle(self):
+        """Start the first song if the queue has songs and nothing plays."""
+        new_queue = self.queue_manager.queue
+        if self.audio_player is None:
+            return
+
+        # Always auto-play the first song if not already playing
+        should_autoplay = False
+        if len(new_queue) > 0:
+            # If nothing is playing or current_song_index is out of range, auto-play
+            if (
+                not self.audio_player.is_playing
+                or self.audio_player.current_song_index < 0
+                or self.audio_player.current_song_index >= len(new_queue)
+            ):
+                should_autoplay = True
+        if should_autoplay:
+            print("[CLIENT] Auto-playing first song from synced queue (force)")
+            self.audio_player.play_song_from_queue(0)
+        else:
+            print(
+                f"[CLIENT] Not auto-playing: is_playing={self.audio_player.is_playing}, current_song_index={self.audio_player.current_song_index}, queue_len={len(new_queue)}"
+            )
 
     def sync_current_index_with_server(self, current_idx):
         """Sync the current song index with the server."""
@@ -539,75 +758,156 @@ class Client:
                 )
                 return True
 
-    def _strip_base64_from_queue(self, queue):
-        """Strip base64 cover_image data from queue to reduce payload size."""
-        stripped_queue = []
-        original_size = 0
-        stripped_size = 0
-
-        for song in queue:
-            # Create a copy without the base64 data
-            stripped_song = song.copy()
-            if "cover_image" in stripped_song:
-                # Keep a flag that cover image exists, but remove the actual data
-                original_size += len(stripped_song["cover_image"])
-                stripped_song["has_cover_image"] = True
-                del stripped_song["cover_image"]
-            else:
-                stripped_song["has_cover_image"] = False
-            stripped_queue.append(stripped_song)
-
-        # Calculate sizes for debugging
-        import json
-
-        original_payload = json.dumps(queue)
-        stripped_payload = json.dumps(stripped_queue)
-
-        print(
-            f"[CLIENT] Queue payload size: {len(original_payload)} -> {len(stripped_payload)} bytes"
-        )
-        print(f"[CLIENT] Base64 data removed: {original_size} bytes")
-
-        return stripped_queue
-
     def remove_song_from_queue(self, index):
         """Remove a song from the queue and sync with other clients."""
-        self.queue_manager.remove_from_queue(index)
         if 0 <= index < len(self.queue_manager.queue):
-            self.sync_queue_with_server(self.queue_manager.queue)
-            if hasattr(self.audio_player, "queue_ui") and self.audio_player.queue_ui:
-                self.audio_player.queue_ui.display_queue()
+            song_id = self.queue_manager.queue[index]
+            self.send_queue_op(make_remove_op(index, song_id))
 
     def get_queue(self):
         """Get the current queue."""
         return self.queue_manager.queue
 
-    def start_audio_stream(self, room_code: str, total_chunks: int):
-        """Start audio streaming for a room."""
+    def seek(self, position, resume):
+        """Seek the room (and resume/pause it) in one server op."""
+        if not self.connected or not self.room_code:
+            return
+        self.sio.emit(
+            "seek_stream",
+            {
+                "room_code": self.room_code,
+                "song_index": self.current_song_index,
+                "position": position,
+                "resume": resume,
+            },
+        )
+        # Apply right away instead of waiting for our own broadcast
+        self.apply_seek(self.room_code, position, not resume)
+
+    def apply_seek(self, room_code, position, is_paused):
+        """Move local playback to position, from the buffer when possible."""
+        print(f"Stream seeked to {position}s (paused: {is_paused})")
+
+        # Update audio player state and progress bar
+        self._post_player(
+            "show_play_state",
+            not is_paused,
+            position,
+            key="play_state",
+        )
+
+        # Whatever was queued belongs to the old position
+        self.audio_output.flush()
+
+        chunk_index = self.position_to_chunk(position)
+        if is_paused:
+            self.is_streaming = False
+            self.expected_chunk_index = None
+            return
+
+        self.audio_output.open()
+        self.is_streaming = True
+        self.play_from_chunk(room_code, chunk_index)
+
+    def position_to_chunk(self, position):
+        """Convert a position in seconds to an audio chunk index."""
+        # Each sample is 2 bytes (16-bit), so we need to account for that
+        samples_per_chunk = self.chunk_size // 2  # 2 bytes per sample
+        return int(position * self.sample_rate / samples_per_chunk)
+
+    def buffer_chunk(self, chunk_index, audio_chunk):
+        """Remember a played chunk; the store overwrites the oldest one."""
+        self.chunk_store.put(chunk_index, audio_chunk)
+
+    def play_from_chunk(self, room_code, chunk_index):
+        """Continue playback at chunk_index, replaying buffered chunks first."""
+        self.stream_generation += 1
+        self.start_clock(chunk_index)
+        if chunk_index in self.chunk_store:
+            print(f"Replaying from buffered chunk {chunk_index}")
+            # Network chunks are dropped until the replay catches up
+            self.expected_chunk_index = None
+            threading.Thread(
+                target=self._replay_buffered_chunks,
+                args=(room_code, chunk_index, self.stream_generation),
+                daemon=True,
+            ).start()
+        else:
+            self.expected_chunk_index = chunk_index
+            self.request_next_chunk(room_code, chunk_index)
+
+    def _replay_buffered_chunks(self, room_code, chunk_index, generation):
+        while self.is_streaming and generation == self.stream_generation:
+            audio_chunk = self.chunk_store.get(chunk_index)
+            if audio_chunk is None:
+                break
+            self.play_audio_chunk(audio_chunk)
+            chunk_index += 1
+
+        # Hand over to the server once the buffer runs out
+        if self.is_streaming and generation == self.stream_generation:
+            self.expected_chunk_index = chunk_index
+            self.request_next_chunk(room_code, chunk_index)
+
+    def start_clock(self, chunk_index):
+        """Anchor the playback clock at the start of chunk_index."""
+        self._clock_song_frame = chunk_index * (self.chunk_size // 2)
+        self._clock_output_frame = self.audio_output.frames_played()
+
+    def playback_position(self):
+        """Seconds of the song actually played, or None without a stream."""
+        if self._clock_song_frame is None:
+            return None
+        frames = self._clock_song_frame + (
+            self.audio_output.frames_played() - self._clock_output_frame
+        )
+        if self.stream_total_frames:
+            frames = min(frames, self.stream_total_frames)
+        return frames / self.sample_rate
+
+    def track_finished(self):
+        """True once the device has played the last frame of the song."""
+        position = self.playback_position()
+        return (
+            self.is_streaming
+            and position is not None
+            and self.stream_total_frames > 0
+            and position * self.sample_rate >= self.stream_total_frames
+        )
+
+    def start_audio_stream(
+        self,
+        room_code: str,
+        total_chunks: int,
+        total_frames=0,
+        start_chunk=0,
+        paused=False,
+    ):
+        """Start audio streaming for a room, from start_chunk for late joiners."""
         try:
             print(f"Starting audio stream for room {room_code}")
             print(f"Total chunks: " + str(total_chunks))
 
-            # Initialize PyAudio
-            self.pyaudio_player = pyaudio.PyAudio()
-            print("PyAudio initialized successfully")
-
-            # Open audio stream
-            self.audio_stream = self.pyaudio_player.open(
-                format=pyaudio.paInt16,
-                channels=1,
-                rate=self.sample_rate,
-                output=True,
-                frames_per_buffer=self.chunk_size,
-            )
-            print("Audio stream opened successfully")
+            # Reuse the output session; just drop the previous song's audio
+            self.audio_output.flush()
+            self.audio_output.open()
+
+            self.chunk_store.reset()
+            self.stream_generation += 1
+            self.stream_total_frames = total_frames
+            self.start_clock(start_chunk)
+
+            # A paused room starts streaming on stream_resumed instead
+            if paused:
+                print(f"Room {room_code} is paused, waiting for resume")
+                return
 
             self.is_streaming = True
-            self.current_audio_chunks = {}
 
             # Request first chunk
-            self.request_next_chunk(room_code, 0)
-            print(f"Requested first audio chunk for room {room_code}")
+            self.expected_chunk_index = start_chunk
+            self.request_next_chunk(room_code, start_chunk)
+            print(f"Requested audio chunk {start_chunk} for room {room_code}")
 
             # Don't clear the starting flag here - it will be cleared after song_started is processed
 
@@ -620,43 +920,33 @@ class Client:
     def request_next_chunk(self, room_code: str, chunk_index: int):
         """Request next audio chunk from server."""
         if self.connected and self.is_streaming:
-            self.sio.emit(
-                "request_audio_chunk",
-                {"room_code": room_code, "chunk_index": chunk_index},
-            )
+            data = {"room_code": room_code, "chunk_index": chunk_index}
+            if self.audio_connected:
+                self.audio_sio.emit(
+                    "request_audio_chunk", data, namespace=AUDIO_NAMESPACE
+                )
+            else:
+                self.sio.emit("request_audio_chunk", data)
 
     def play_audio_chunk(self, audio_chunk: bytes):
         """Play an audio chunk."""
-        if self.audio_stream:
-            try:
-                # Check if stream is active before writing
-                if self.audio_stream.is_active():
-                    # print(f"Playing audio chunk, size: {len(audio_chunk)} bytes")
-                    self.audio_stream.write(audio_chunk)
-                    # print("Audio chunk played successfully")
-                else:
-                    print("Audio stream is not active, skipping chunk")
-            except Exception as e:
-                print(f"Error playing audio chunk: {e}")
-                # If stream is closed, try to reopen it
-                if "Stream closed" in str(e) or "Stream not active" in str(e):
-                    print("Stream appears to be closed, will reopen on next resume")
-                    # Mark stream as None so it gets recreated
-                    self.audio_stream = None
-        else:
-            print(
-                f"Cannot play audio chunk - audio_stream: {self.audio_stream is not None}"
-            )
+        self.audio_output.write(audio_chunk)
 
     def stop_audio_stream(self):
-        """Stop audio streaming."""
+        """Stop audio streaming, keeping the output session open."""
+        self.is_streaming = False
+        self.audio_output.flush()
+        if self.audio_output.underruns:
+            print(f"[CLIENT] Audio underruns so far: {self.audio_output.underruns}")
+        self.chunk_store.reset()
+        self.expected_chunk_index = None
+        self.stream_total_frames = 0
+        self._clock_song_frame = None
+
+    def close_audio(self):
+        """Release the audio device when the client exits."""
         self.is_streaming = False
-        if self.audio_stream:
-            self.audio_stream.stop_stream()
-            self.audio_stream.close()
-        if self.pyaudio_player:
-            self.pyaudio_player.terminate()
-        self.current_audio_chunks = {}
+        self.audio_output.close()
 
     def is_connected(self):
         """Check if connected to server."""
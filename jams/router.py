@@ -0,0 +1,222 @@
+"""
+Multi-worker mode for the JamServer:
+
+    python -m jams.serve --workers N
+
+A front process (RoomRouter) listens on the public port and starts N
+worker processes, each a full JamServer on a private loopback port.
+Every room lives on exactly one worker, picked by hashing its code, so
+room state and broadcasts never leave that worker. Clients joining a
+room pass its code in the connection URL (?room=CODE); connections
+without one are routed by client address, and a room created on them
+gets a code that hashes back to that same worker. Events that do cross
+workers go over a jams.bus Unix socket hub run by the front process; the
+socket lives in a private (0700) temporary directory, removed on stop().
+"""
+
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import zlib
+from urllib.parse import parse_qs, urlsplit
+
+from jams.bus import BusHub
+
+MAX_HEAD = 64 * 1024  # Largest request head read before routing
+
+
+def room_worker(key, workers):
+    """Index of the worker that owns a room code (or other routing key)."""
+    return zlib.crc32(key.upper().encode("utf-8")) % workers
+
+
+def route_key(head, peer_ip):
+    """Routing key of a request: its ?room= code, else the client's address."""
+    request_line = head.split(b"\r\n", 1)[0].decode("latin-1")
+    parts = request_line.split(" ")
+    if len(parts) >= 2:
+        room = parse_qs(urlsplit(parts[1]).query).get("room")
+        if room and room[0]:
+            return room[0]
+    return peer_ip
+
+
+def _pipe(src, dst):
+    try:
+        while True:
+            data = src.recv(65536)
+            if not data:
+                break
+            dst.sendall(data)
+    except OSError:
+        pass
+    try:
+        dst.shutdown(socket.SHUT_WR)
+    except OSError:
+        pass
+
+
+class RoomRouter:
+    """
+    Front process of the multi-worker mode: starts the bus hub and the
+    workers, then forwards each connection to the worker owning its room.
+    Runs on eventlet, like the single-process server.
+    Attributes:
+        workers (int): number of worker processes.
+        addresses (list): (host, port) of each worker, once started.
+        failed (bool): set when a worker exited while serving.
+        bus_path (str): the bus socket; by default made by start_workers().
+    """
+
+    def __init__(self, workers, bus_path=None):
+        self.workers = workers
+        self.bus_path = bus_path
+        self.hub = None
+        self._bus_dir = None
+        self.addresses = [None] * workers
+        self.processes = []
+        self.failed = False
+        self._listener = None
+        self._stopping = False
+
+    def start_workers(self):
+        """Launch every worker and wait for each to listen; False on failure."""
+        import eventlet
+
+        if self.bus_path is None:
+            # Only this user may connect to the bus, and so inject events
+            self._bus_dir = tempfile.mkdtemp(prefix="jams-bus-")
+            os.chmod(self._bus_dir, 0o700)
+            self.bus_path = os.path.join(self._bus_dir, "bus.sock")
+        self.hub = BusHub(self.bus_path)
+        self.hub.start()
+        for index in range(self.workers):
+            cmd = [
+                sys.executable,
+                "-u",
+                "-m",
+                "jams.serve",
+                "--host",
+                "127.0.0.1",
+                "--port",
+                "0",
+                "--worker",
+                str(index),
+                "--workers",
+                str(self.workers),
+                "--bus",
+                self.bus_path,
+                "--exit-with-parent",
+            ]
+            # The worker exits when its stdin closes, i.e. when this process dies
+            self.processes.append(
+                subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                )
+            )
+
+        from jams.serve import READY_LINE
+
+        for index, process in enumerate(self.processes):
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                if line.startswith(READY_LINE):
+                    _, host, port = line.split()
+                    self.addresses[index] = (host, int(port))
+                    break
+                print(f"[worker {index}] {line}")
+            else:
+                print(f"[SERVER] Worker {index} exited before it was ready")
+                return False
+            eventlet.spawn_n(self._watch, index, process)
+        print(f"[SERVER] {self.workers} workers ready")
+        return True
+
+    def listen(self, host, port):
+        import eventlet
+
+        self._listener = eventlet.listen((host, port), reuse_port=False)
+        return self._listener
+
+    def serve(self, listener):
+        import eventlet
+
+        pool = eventlet.GreenPool()
+        while not self._stopping:
+            try:
+                conn, addr = listener.accept()
+            except OSError:
+                break
+            pool.spawn_n(self._route, conn, addr)
+
+    def stop(self):
+        self._stopping = True
+        for process in self.processes:
+            if process.poll() is None:
+                process.terminate()
+        for process in self.processes:
+            try:
+                process.wait(3.0)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self._remove_bus()
+
+    def abort(self):
+        """Stop without waiting on anything, so a signal handler can call it."""
+        self._stopping = True
+        for process in self.processes:
+            if process.poll() is None:
+                process.terminate()
+        self._remove_bus()
+
+    def _remove_bus(self):
+        if self.hub is not None:
+            self.hub.close()
+        if self._bus_dir is not None:
+            shutil.rmtree(self._bus_dir, ignore_errors=True)
+            self._bus_dir = None
+
+    def _route(self, conn, addr):
+        import eventlet
+
+        head = b""
+        try:
+            while b"\r\n\r\n" not in head and len(head) < MAX_HEAD:
+                data = conn.recv(4096)
+                if not data:
+                    conn.close()
+                    return
+                head += data
+            index = room_worker(route_key(head, addr[0]), self.workers)
+            upstream = socket.create_connection(self.addresses[index])
+            upstream.sendall(head)
+        except OSError:
+            conn.close()
+            return
+        replies = eventlet.spawn(_pipe, upstream, conn)
+        _pipe(conn, upstream)
+        replies.wait()
+        conn.close()
+        upstream.close()
+
+    def _watch(self, index, process):
+        # Forward the worker's log; if it dies, take the whole server down
+        for line in process.stdout:
+            print(f"[worker {index}] {line.rstrip()}")
+        returncode = process.wait()
+        if self._stopping:
+            return
+        print(f"[SERVER] Worker {index} exited ({returncode}), stopping")
+        self.failed = True
+        self._stopping = True
+        if self._listener is not None:
+            self._listener.close()
@@ -0,0 +1,133 @@
+"""
+Entry point for running the JamServer in its own process:
+
+    python -m jams.serve [--host HOST] [--port PORT] [--backend eventlet|asyncio]
+                         [--workers N]
+
+Prints a single READY line on stdout once the listen socket is bound,
+which the host's ServerSupervisor waits for. Exits with ADDRESS_IN_USE
+when the port is taken (most likely by another server already running).
+With --workers N > 1 this process routes connections to N worker
+processes by room code (see jams.router); eventlet backend only.
+"""
+
+import argparse
+import os
+import signal
+import sys
+
+READY_LINE = "READY"
+ADDRESS_IN_USE = 3
+WORKER_EXITED = 4
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a Fire Jams server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument(
+        "--backend",
+        choices=("eventlet", "asyncio"),
+        default=os.environ.get("JAMS_SERVER_BACKEND", "eventlet"),
+        help="event loop to serve with (default: $JAMS_SERVER_BACKEND or eventlet)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("JAMS_SERVER_WORKERS", "1")),
+        help="worker processes to spread rooms over (default: $JAMS_SERVER_WORKERS or 1)",
+    )
+    # Set by the router on the worker processes it starts
+    parser.add_argument("--worker", type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--bus", default=None, help=argparse.SUPPRESS)
+    # Set by whoever starts us with a stdin pipe: exit when it closes
+    parser.add_argument(
+        "--exit-with-parent", action="store_true", help=argparse.SUPPRESS
+    )
+    args = parser.parse_args(argv)
+    if args.workers > 1 and args.backend != "eventlet":
+        parser.error("--workers needs the eventlet backend")
+
+    if args.backend == "eventlet":
+        import eventlet
+
+        # The server owns this process, so let eventlet make blocking calls green
+        eventlet.monkey_patch()
+
+    from jams.server import JamServer
+    from screens.constants import LOCAL_PORT
+
+    if args.port is None:
+        args.port = LOCAL_PORT
+    if args.exit_with_parent:
+        _exit_with_parent(args.backend)
+    if args.workers > 1 and args.worker is None:
+        return run_router(args)
+
+    bus = None
+    if args.worker is not None:
+        from jams.bus import UnixSocketBusManager
+
+        bus = UnixSocketBusManager(args.bus)
+    server = JamServer(
+        args.backend,
+        bus=bus,
+        worker_index=args.worker or 0,
+        worker_count=args.workers if args.worker is not None else 1,
+    )
+    server.run(
+        host=args.host,
+        port=args.port,
+        on_ready=lambda: print(
+            f"{READY_LINE} {args.host} {server.address[1]}", flush=True
+        ),
+    )
+    if server.listen_error is not None:
+        return ADDRESS_IN_USE
+    return 0
+
+
+def run_router(args):
+    from jams.router import RoomRouter
+
+    router = RoomRouter(args.workers)
+    try:
+        listener = router.listen(args.host, args.port)
+    except OSError as e:
+        print(f"[SERVER] Could not listen on {args.host}:{args.port}: {e}")
+        return ADDRESS_IN_USE
+    signal.signal(signal.SIGTERM, lambda signum, frame: _terminate(router))
+    try:
+        if not router.start_workers():
+            return WORKER_EXITED
+        print(f"{READY_LINE} {args.host} {args.port}", flush=True)
+        router.serve(listener)
+    finally:
+        router.stop()
+    return WORKER_EXITED if router.failed else 0
+
+
+def _terminate(router):
+    # SIGTERM: the accept loop won't notice, so clean up and exit right here
+    router.abort()
+    os._exit(0)
+
+
+def _exit_with_parent(backend):
+    """Exit once stdin closes: the process that started us is gone."""
+    if backend == "eventlet":
+        from eventlet.patcher import original
+
+        threading = original("threading")  # A real thread may block on stdin
+    else:
+        import threading
+
+    def watch():
+        sys.stdin.read()
+        os._exit(0)
+
+    threading.Thread(target=watch, daemon=True).start()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,3 @@
-import socketio
-import eventlet
-from eventlet import wsgi
 import random
 import string
 from typing import Dict, Optional
@@ -8,13 +5,22 @@ import os
 import json
 import subprocess
 import base64
-from pydub import AudioSegment
 import sys
-import numpy as np
 
 sys.path.append(".")
 from utils.song import get_song_metadata
-from screens.constants import LOCAL_IP, LOCAL_PORT
+from screens.constants import AUDIO_NAMESPACE, LOCAL_IP, LOCAL_PORT
+from jams.shared.queue_ops import (
+    INSERT,
+    SHUFFLE,
+    apply_queue_op,
+    make_insert_op,
+    shift_current_index,
+)
+from jams.shared.song_record import SongRecord
+from jams.shared.playhead import Playhead
+from jams.transport import make_transport
+from jams.router import room_worker
 
 
 class JamServer:
@@ -23,25 +29,41 @@ class JamServer:
     Handles room creation, user management, and queue synchronization.
     """
 
-    def __init__(self):
-        self.sio = socketio.Server(cors_allowed_origins="*")
-        self.app = socketio.WSGIApp(self.sio)
+    def __init__(self, backend="eventlet", bus=None, worker_index=0, worker_count=1):
+        # Socket.IO server, event loop and background work (see jams.transport)
+        self.transport = make_transport(backend, client_manager=bus)
 
-        # Store room data: {room_code: {users: [], queue: [], host: str, current_idx: int}}
+        # Multi-worker mode (see jams.router): this worker only owns room
+        # codes that hash to worker_index, and shares library updates on bus
+        self.bus = bus
+        self.worker_index = worker_index
+        self.worker_count = worker_count
+
+        # Store room data: {room_code: {users: [], queue: [song_id], host: str, current_idx: int, queue_version: int}}
         self.rooms: Dict[str, Dict] = {}
 
         # Music download settings
         self.downloads_folder = "downloads"
         self.music_data_file = "music_data.json"
+        self.library_by_id: Dict[str, Dict] = {}  # {song_id: full metadata}
+        self.song_records: Dict[str, SongRecord] = {}  # {song_id: wire record}
+        self.covers: Dict[str, str] = {}  # {cover_hash: base64 cover}
         self.ensure_downloads_folder()
         self.load_music_library()
+        if hasattr(self.bus, "on_server_event"):
+            self.bus.on_server_event("library_added", self.on_library_added)
 
         # Audio streaming settings
         self.chunk_size = 4096
         self.sample_rate = 44100
         self.current_audio_data = {}  # {room_code: audio_data}
-        self.current_positions = {}  # {room_code: current_position}
-        self.paused_rooms = set()  # Track which rooms are paused
+        self.playheads: Dict[str, Playhead] = {}  # {room_code: Playhead}
+        self.staged_chunks = {}  # {room_code: {chunk_index: base64 chunk}}
+        self.prestage_chunks = 16  # Chunks encoded ahead of a seek target
+
+        # Set by run() if the listen socket could not be bound
+        self.listen_error: Optional[OSError] = None
+        self.address = None  # (host, port) actually bound, e.g. for port 0
 
         # Set up socket event handlers
         self.setup_socket_handlers()
@@ -101,6 +123,35 @@ class JamServer:
             with open(self.music_data_file, "r", encoding="utf-8") as file:
                 self.music_library = json.load(file)
 
+        for song in self.music_library:
+            self.index_library_song(song)
+
+    def index_library_song(self, metadata: Dict) -> Optional[SongRecord]:
+        """Build the wire record and cover entry for a library song."""
+        song_id = metadata.get("song_id")
+        if not song_id:
+            return None
+        record = SongRecord.from_metadata(metadata)
+        self.library_by_id[song_id] = metadata
+        self.song_records[song_id] = record
+        if record.cover_hash:
+            self.covers[record.cover_hash] = metadata["cover_image"]
+        return record
+
+    def add_to_library(self, metadata: Dict) -> Optional[SongRecord]:
+        """Add a downloaded song to the library and persist it."""
+        self.music_library.append(metadata)
+        self.save_music_library()
+        if hasattr(self.bus, "publish_server_event"):
+            self.bus.publish_server_event("library_added", metadata)
+        return self.index_library_song(metadata)
+
+    def on_library_added(self, metadata: Dict):
+        """Another worker downloaded a song (and already saved the library)."""
+        if metadata.get("song_id") not in self.library_by_id:
+            self.music_library.append(metadata)
+            self.index_library_song(metadata)
+
     def save_music_library(self):
         """Save the music library to file."""
         with open(self.music_data_file, "w", encoding="utf-8") as file:
@@ -163,7 +214,7 @@ class JamServer:
             # Check if file exists and extract proper metadata
             if os.path.exists(file_path):
                 # Extract full metadata from the downloaded MP3 file
-                full_metadata = get_song_metadata(file_path)
+                full_metadata = get_song_metadata(file_path, include_cover=True)
 
                 # Merge spotdl metadata with full metadata
                 merged_metadata = {
@@ -181,8 +232,7 @@ class JamServer:
                     merged_metadata["name"] = merged_metadata["title"]
 
                 # Add to music library
-                self.music_library.append(merged_metadata)
-                self.save_music_library()
+                self.add_to_library(merged_metadata)
 
                 print(
                     f"Successfully downloaded: {merged_metadata.get('name', 'Unknown')}"
@@ -197,15 +247,20 @@ class JamServer:
 
         return None
 
+    def event(self, handler):
+        """Register handler for the Socket.IO event named after it."""
+        self.transport.on(handler.__name__, handler)
+        return handler
+
     def setup_socket_handlers(self):
         """Set up socket.io event handlers for the server."""
 
-        @self.sio.event
+        @self.event
         def connect(sid, environ):
             print(f"Client connected: {sid}")
             print(f"[SERVER] Connect - Available rooms: {list(self.rooms.keys())}")
 
-        @self.sio.event
+        @self.event
         def disconnect(sid):
             print(f"Client disconnected: {sid}")
             print(
@@ -217,15 +272,15 @@ class JamServer:
                 f"[SERVER] Disconnect - Available rooms after cleanup: {list(self.rooms.keys())}"
             )
 
-        @self.sio.event
+        @self.event
         def test_event(sid, data):
             """Test event to verify server is receiving events."""
             print(f"[SERVER] Received test event from {sid}: {data}")
-            self.sio.emit(
+            self.transport.emit(
                 "test_response", {"message": "Server received test event"}, room=sid
             )
 
-        @self.sio.event
+        @self.event
         def create_room(sid, data):
             """Create a new jam room."""
             username = data.get("username")
@@ -247,20 +302,21 @@ class JamServer:
                 "queue": [],
                 "host": sid,
                 "current_idx": 0,
+                "queue_version": 0,
             }
 
             # Join the room
-            self.sio.enter_room(sid, room_code)
+            self.transport.enter_room(sid, room_code)
 
             print(f"Room created: {room_code} by {username}")
 
             # Send room code back to host
-            self.sio.emit("room_created", {"room_code": room_code}, to=sid)
+            self.transport.emit("room_created", {"room_code": room_code}, to=sid)
 
             # Send initial players list to host
             self.broadcast_players_update(room_code)
 
-        @self.sio.event
+        @self.event
         def join_room(sid, data):
             """Join an existing jam room."""
             room_code = data.get("room_code")
@@ -268,7 +324,7 @@ class JamServer:
             color_idx = data.get("color_idx")
 
             if room_code not in self.rooms:
-                self.sio.emit("error", {"message": "Room not found"}, room=sid)
+                self.transport.emit("error", {"message": "Room not found"}, room=sid)
                 return
 
             # Find next available position
@@ -293,12 +349,12 @@ class JamServer:
             )
 
             # Join the room
-            self.sio.enter_room(sid, room_code)
+            self.transport.enter_room(sid, room_code)
 
             print(f"User {username} joined room {room_code} at position {new_position}")
 
-            # Notify all users in the room
-            self.sio.emit(
+            # Notify the other users in the room
+            self.transport.emit(
                 "user_joined",
                 {
                     "username": username,
@@ -306,77 +362,39 @@ class JamServer:
                     "position_idx": new_position,
                 },
                 room=room_code,
+                skip_sid=sid,
             )
 
-            # Send current queue to new user
-            self.sio.emit(
-                "queue_updated", {"queue": self.rooms[room_code]["queue"]}, room=sid
+            # Send the new user everything in one message
+            self.transport.emit(
+                "room_snapshot", self.build_room_snapshot(room_code), room=sid
             )
 
-            # Send current index to new user
-            current_idx = self.rooms[room_code].get("current_idx", 0)
-            self.sio.emit(
-                "current_index_synced",
-                {
-                    "room_code": room_code,
-                    "current_idx": current_idx,
-                    "updated_by": "server",
-                },
-                room=sid,
-            )
-
-            # Send initial players list to new user
-            players_data = []
-            for user in self.rooms[room_code]["users"]:
-                players_data.append(
-                    {
-                        "username": user["username"],
-                        "color_idx": user["color_idx"],
-                        "position": user.get("position", 0),
-                    }
-                )
-
-            print(players_data)
-
-            self.sio.emit(
-                "room_joined",
-                {"room_code": room_code, "players": players_data},
-                room=sid,
-            )
-
-        @self.sio.event
-        def update_queue(sid, data):
-            """Update the queue for a room."""
-            room_code = data.get("room_code")
-            new_queue = data.get("queue", [])
-
-            if room_code in self.rooms:
-                self.rooms[room_code]["queue"] = new_queue
-
-                # Broadcast updated queue to all users in room
-                self.sio.emit("queue_updated", {"queue": new_queue}, room=room_code)
+            # Late joiner: start their stream at the room's live position
+            if room_code in self.current_audio_data and room_code in self.playheads:
+                self.emit_audio_stream_ready(room_code, to=sid)
 
-        @self.sio.event
+        @self.event
         def add_url_to_queue(sid, data):
             """Add a URL to the queue by downloading it first."""
             room_code = data.get("room_code")
             url = data.get("url")
 
             if not room_code or not url:
-                self.sio.emit(
+                self.transport.emit(
                     "error", {"message": "Missing room_code or url"}, room=sid
                 )
                 return
 
             if room_code not in self.rooms:
-                self.sio.emit("error", {"message": "Room not found"}, room=sid)
+                self.transport.emit("error", {"message": "Room not found"}, room=sid)
                 return
 
             print(f"Processing URL for room {room_code}: {url}")
 
             # Validate Spotify URL
             if not self.is_valid_spotify_url(url):
-                self.sio.emit(
+                self.transport.emit(
                     "url_processed",
                     {
                         "status": "error",
@@ -390,11 +408,7 @@ class JamServer:
             song_id = self.extract_song_id_from_url(url)
 
             # Check if song already exists in library using song_id
-            existing_song = None
-            for song in self.music_library:
-                if song.get("song_id") == song_id:
-                    existing_song = song
-                    break
+            existing_song = self.library_by_id.get(song_id)
 
             if existing_song:
                 # Song already downloaded, add to queue
@@ -405,17 +419,51 @@ class JamServer:
                     f"Cover image: {'Yes' if existing_song.get('cover_image') else 'No'}"
                 )
                 self.add_song_to_room_queue(sid, room_code, existing_song)
-                self.sio.emit(
+                self.transport.emit(
                     "url_processed",
                     {
                         "status": "success",
                         "message": "Song already in library",
-                        "song": existing_song,
+                        "song": self.song_records[song_id].to_wire(),
                     },
                     room=sid,
                 )
             else:
-                # Download the song asynchronously using eventlet
+
+                def reply(status, message):
+                    self.transport.call_soon(
+                        lambda: self.transport.emit(
+                            "url_processed",
+                            {"status": status, "message": message},
+                            room=sid,
+                        )
+                    )
+
+                def add_downloaded(merged_metadata):
+                    # Back on the loop: library, room queue and replies
+                    record = self.add_to_library(merged_metadata)
+
+                    print(
+                        f"Successfully downloaded: {merged_metadata.get('name', 'Unknown')}"
+                    )
+                    print(
+                        f"Cover image: {'Yes' if merged_metadata.get('cover_image') else 'No'}"
+                    )
+
+                    # Add to queue and notify
+                    self.add_song_to_room_queue(sid, room_code, merged_metadata)
+                    self.transport.emit(
+                        "url_processed",
+                        {
+                            "status": "success",
+                            "message": "Song downloaded and added to queue",
+                            "song": record.to_wire(),
+                        },
+                        room=sid,
+                    )
+
+                # Download the song in the background; only the download and
+                # the metadata read run there, everything else via call_soon
                 def download_and_notify():
                     try:
                         print(f"Starting download for: {url}")
@@ -453,23 +501,13 @@ class JamServer:
 
                         # Non-blocking wait for process completion
                         while process.poll() is None:
-                            eventlet.sleep(0)  # Yield control to eventlet
+                            self.transport.sleep(0.1)  # Let other work run
 
                         stdout, stderr = process.communicate()
 
                         if process.returncode != 0:
                             print(f"Download failed: {stderr}")
-                            eventlet.spawn_after(
-                                0,
-                                lambda: self.sio.emit(
-                                    "url_processed",
-                                    {
-                                        "status": "error",
-                                        "message": "Failed to download song",
-                                    },
-                                    room=sid,
-                                ),
-                            )
+                            reply("error", "Failed to download song")
                             return
 
                         # Read the metadata file
@@ -500,7 +538,9 @@ class JamServer:
                             # Check if file was found
                             if downloaded_file and os.path.exists(downloaded_file):
                                 # Extract full metadata from the downloaded MP3 file
-                                full_metadata = get_song_metadata(downloaded_file)
+                                full_metadata = get_song_metadata(
+                                    downloaded_file, include_cover=True
+                                )
 
                                 # Merge spotdl metadata with full metadata
                                 merged_metadata = {
@@ -523,90 +563,82 @@ class JamServer:
                                 ):
                                     merged_metadata["name"] = merged_metadata["title"]
 
-                                # Add to music library
-                                self.music_library.append(merged_metadata)
-                                self.save_music_library()
-
-                                print(
-                                    f"Successfully downloaded: {merged_metadata.get('name', 'Unknown')}"
-                                )
-                                print(
-                                    f"Cover image: {'Yes' if merged_metadata.get('cover_image') else 'No'}"
-                                )
-
-                                # Add to queue and notify
-                                self.add_song_to_room_queue(
-                                    sid, room_code, merged_metadata
-                                )
-                                eventlet.spawn_after(
-                                    0,
-                                    lambda: self.sio.emit(
-                                        "url_processed",
-                                        {
-                                            "status": "success",
-                                            "message": "Song downloaded and added to queue",
-                                            "song": merged_metadata,
-                                        },
-                                        room=sid,
-                                    ),
+                                self.transport.call_soon(
+                                    add_downloaded, merged_metadata
                                 )
                             else:
                                 print(
                                     f"Downloaded file not found for song: {metadata['name']}"
                                 )
-                                eventlet.spawn_after(
-                                    0,
-                                    lambda: self.sio.emit(
-                                        "url_processed",
-                                        {
-                                            "status": "error",
-                                            "message": "Downloaded file not found",
-                                        },
-                                        room=sid,
-                                    ),
-                                )
+                                reply("error", "Downloaded file not found")
                         else:
-                            eventlet.spawn_after(
-                                0,
-                                lambda: self.sio.emit(
-                                    "url_processed",
-                                    {
-                                        "status": "error",
-                                        "message": "Metadata file not found",
-                                    },
-                                    room=sid,
-                                ),
-                            )
+                            reply("error", "Metadata file not found")
 
                     except Exception as e:
                         print(f"Error processing URL: {e}")
-                        eventlet.spawn_after(
-                            0,
-                            lambda: self.sio.emit(
-                                "url_processed",
-                                {
-                                    "status": "error",
-                                    "message": f"Error processing URL",
-                                },
-                                room=sid,
-                            ),
-                        )
+                        reply("error", "Error processing URL")
 
-                # Start download in eventlet thread (non-blocking)
-                eventlet.spawn(download_and_notify)
+                # Start download in the background (non-blocking)
+                self.transport.spawn(download_and_notify)
 
                 # Notify client that download started
-                self.sio.emit(
+                self.transport.emit(
                     "url_processing", {"message": "Downloading song..."}, room=sid
                 )
 
-        @self.sio.event
-        def sync_queue_with_friends(sid, data):
-            """Sync queue changes with all users in the room."""
-            # Use eventlet to handle this event asynchronously
-            eventlet.spawn(self._handle_sync_queue_with_friends, sid, data)
+        @self.event
+        def queue_op(sid, data):
+            """Apply a single queue edit (insert/remove/move/shuffle)."""
+            room_code = data.get("room_code")
+            op = data.get("op")
 
-        @self.sio.event
+            if room_code not in self.rooms:
+                self.transport.emit("error", {"message": "Room not found"}, room=sid)
+                return
+
+            if not isinstance(op, dict):
+                print(f"[SERVER] Rejected malformed queue op from {sid}")
+                self.emit_queue_snapshot(room_code, to=sid)
+                return
+
+            if not self.apply_room_queue_op(
+                room_code, op, sid, base_version=data.get("base_version")
+            ):
+                # The sender's queue is out of date, resync it
+                self.emit_queue_snapshot(room_code, to=sid)
+
+        @self.event
+        def get_song_records(sid, data):
+            """Send the wire records for the requested song IDs."""
+            records = [
+                self.song_records[song_id].to_wire()
+                for song_id in data.get("song_ids", [])
+                if song_id in self.song_records
+            ]
+            self.transport.emit("song_records", {"records": records}, room=sid)
+
+        @self.event
+        def get_covers(sid, data):
+            """Send cover images for the requested cover hashes."""
+            hashes = data.get("hashes", [])
+            covers = {
+                cover_hash: self.covers[cover_hash]
+                for cover_hash in hashes
+                if cover_hash in self.covers
+            }
+            # Echo the request so the client can ask again for what's missing
+            self.transport.emit(
+                "covers", {"covers": covers, "hashes": hashes}, room=sid
+            )
+
+        @self.event
+        def request_queue_snapshot(sid, data):
+            """Client detected a gap in queue versions and wants a resync."""
+            room_code = data.get("room_code")
+            if room_code in self.rooms:
+                self.emit_queue_snapshot(room_code, to=sid)
+
+        @self.event
         def sync_current_index(sid, data):
             """Sync the current song index with all users in the room."""
             room_code = data.get("room_code")
@@ -617,7 +649,7 @@ class JamServer:
                 self.rooms[room_code]["current_idx"] = current_idx
 
                 # Broadcast to all users in the room
-                self.sio.emit(
+                self.transport.emit(
                     "current_index_synced",
                     {
                         "room_code": room_code,
@@ -627,44 +659,25 @@ class JamServer:
                     room=room_code,
                 )
 
-        @self.sio.event
+        @self.event
         def request_audio_chunk(sid, data):
-            """Client requests an audio chunk."""
-            room_code = data.get("room_code")
-            chunk_index = data.get("chunk_index", 0)
-
-            # Don't send audio chunks if room is paused
-            if room_code in self.paused_rooms:
-                print(f"Room {room_code} is paused, ignoring audio chunk request")
-                return
-
-            if room_code in self.current_audio_data:
-                print(f"Sending audio chunk {chunk_index} for room {room_code}")
-                audio_chunk = self.stream_audio_chunk(room_code, chunk_index)
-                if audio_chunk:
-                    # Send audio chunk as base64
-                    chunk_b64 = base64.b64encode(audio_chunk).decode("utf-8")
-                    self.sio.emit(
-                        "audio_chunk",
-                        {
-                            "room_code": room_code,
-                            "chunk_index": chunk_index,
-                            "audio_data": chunk_b64,
-                        },
-                        room=sid,
-                    )
-                else:
-                    print(f"No audio chunk available for chunk_index {chunk_index}")
-            else:
-                print(f"No audio data available for room {room_code}")
+            """Client requests an audio chunk (before its audio channel is up)."""
+            self.send_audio_chunk(sid, data)
+
+        # Chunks requested on the audio channel are answered there, so
+        # they stay off the connection that carries pause/seek/queue events
+        self.transport.on(
+            "request_audio_chunk",
+            lambda sid, data: self.send_audio_chunk(sid, data, AUDIO_NAMESPACE),
+            namespace=AUDIO_NAMESPACE,
+        )
 
-        @self.sio.event
+        @self.event
         def play_song(sid, data):
             """Start playing a song in a room."""
-            # Use eventlet to handle this event asynchronously
-            eventlet.spawn(self._handle_play_song, sid, data)
+            self._handle_play_song(sid, data)
 
-        @self.sio.event
+        @self.event
         def pause_stream(sid, data):
             """Pause audio streaming for a room."""
             room_code = data.get("room_code")
@@ -672,12 +685,15 @@ class JamServer:
             position = data.get("position", 0)
 
             if room_code in self.rooms:
-                # Add room to paused set
-                self.paused_rooms.add(room_code)
-                print(f"Room {room_code} added to paused rooms")
+                # The server's playhead is authoritative for the paused position
+                playhead = self.playheads.get(room_code)
+                if playhead:
+                    playhead.pause()
+                    position = playhead.position()
+                print(f"Room {room_code} paused")
 
                 # Broadcast pause event to all clients in room
-                self.sio.emit(
+                self.transport.emit(
                     "stream_paused",
                     {
                         "room_code": room_code,
@@ -688,7 +704,7 @@ class JamServer:
                 )
                 print(f"Stream paused for room {room_code} at position {position}")
 
-        @self.sio.event
+        @self.event
         def resume_stream(sid, data):
             """Resume audio streaming for a room."""
             room_code = data.get("room_code")
@@ -696,13 +712,14 @@ class JamServer:
             position = data.get("position", 0)
 
             if room_code in self.rooms:
-                # Remove room from paused set
-                if room_code in self.paused_rooms:
-                    self.paused_rooms.remove(room_code)
-                    print(f"Room {room_code} removed from paused rooms")
+                playhead = self.playheads.get(room_code)
+                if playhead:
+                    playhead.resume()
+                    position = playhead.position()
+                print(f"Room {room_code} resumed")
 
                 # Broadcast resume event to all clients in room
-                self.sio.emit(
+                self.transport.emit(
                     "stream_resumed",
                     {
                         "room_code": room_code,
@@ -713,49 +730,52 @@ class JamServer:
                 )
                 print(f"Stream resumed for room {room_code} at position {position}")
 
-        @self.sio.event
+        @self.event
         def seek_stream(sid, data):
-            """Seek to position in streaming audio."""
+            """Seek to position in streaming audio.
+
+            Optional "resume" (True/False) also resumes/pauses the room in
+            the same step, so a seek is one broadcast instead of three.
+            """
             room_code = data.get("room_code")
             song_index = data.get("song_index", 0)
             seek_position = data.get("position", 0)
+            resume = data.get("resume")
 
             if room_code in self.rooms:
-                # Convert seconds to chunk index
-                # Each sample is 2 bytes (16-bit), so we need to account for that
-                samples_per_chunk = self.chunk_size // 2  # 2 bytes per sample
-                chunk_index = int(seek_position * self.sample_rate / samples_per_chunk)
-
-                # Debug: Calculate the actual time this chunk represents
-                actual_time = chunk_index * samples_per_chunk / self.sample_rate
-                print(
-                    f"Seek request: {seek_position}s -> chunk {chunk_index} -> actual time: {actual_time:.2f}s"
-                )
-
-                # Update the current position for the room
-                if room_code in self.current_positions:
-                    self.current_positions[room_code] = chunk_index
-                    print(
-                        f"Updated server position for room {room_code}: chunk {chunk_index} (time: {seek_position}s)"
-                    )
+                chunk_index = self.position_to_chunk(seek_position)
+                print(f"Seek request: {seek_position}s -> chunk {chunk_index}")
+
+                # Update the room's playhead
+                playhead = self.playheads.get(room_code)
+                if playhead:
+                    playhead.seek(seek_position)
+                    if resume is True:
+                        playhead.resume()
+                    elif resume is False:
+                        playhead.pause()
                 else:
-                    print(f"Warning: room {room_code} not found in current_positions")
+                    print(f"Warning: room {room_code} has no playhead")
+
+                # Encode the target chunks before clients start asking for them
+                self.stage_chunks(room_code, chunk_index)
 
                 # Broadcast seek event to all clients in room
-                self.sio.emit(
+                self.transport.emit(
                     "stream_seeked",
                     {
                         "room_code": room_code,
                         "song_index": song_index,
                         "position": seek_position,
+                        "chunk_index": chunk_index,
+                        "is_paused": self.is_room_paused(room_code),
+                        "updated_by": sid,
                     },
                     room=room_code,
                 )
                 print(f"Stream seeked to {seek_position}s for room {room_code}")
 
-                # Don't send audio chunk here - let clients request it when ready
-
-        @self.sio.event
+        @self.event
         def user_talking_state(sid, data):
             """Handle user talking state updates and broadcast to room."""
             room_code = data.get("room_code")
@@ -765,81 +785,167 @@ class JamServer:
                 return
             # Optionally: update server-side state if you want to track who is talking
             # Broadcast to all users in the room
-            self.sio.emit(
+            self.transport.emit(
                 "user_talking_update",
                 {"username": username, "is_talking": is_talking},
                 room=room_code,
             )
 
-    def add_song_to_room_queue(self, sid, room_code: str, song_metadata: Dict):
-        """Add a song to a room's queue and broadcast the update."""
-        if room_code in self.rooms:
-
-            self.rooms[room_code]["queue"].append(song_metadata)
-            self._handle_sync_queue_with_friends(
-                sid, {"queue": self.rooms[room_code]["queue"], "room_code": room_code}
-            )
-
-    def _handle_sync_queue_with_friends(self, sid, data):
-        """Handle sync queue with friends in eventlet thread."""
+    def send_audio_chunk(self, sid, data: Dict, namespace=None):
+        """Answer a chunk request on the namespace it came in on."""
         room_code = data.get("room_code")
-        queue_data = data.get("queue", [])
+        chunk_index = data.get("chunk_index", 0)
 
-        print(
-            f"[SERVER] Received queue sync request from {sid} for room {room_code}: {len(queue_data)} songs"
-        )
-        print(f"[SERVER] Available rooms: {list(self.rooms.keys())}")
+        # Don't send audio chunks if room is paused
+        if self.is_room_paused(room_code):
+            print(f"Room {room_code} is paused, ignoring audio chunk request")
+            return
 
-        if room_code in self.rooms:
-            # Restore cover images from music library if needed
-            restored_queue = self._restore_cover_images_from_library(queue_data)
+        if room_code in self.current_audio_data:
+            print(f"Sending audio chunk {chunk_index} for room {room_code}")
+            # Chunks around a seek target are encoded before the seek goes out
+            chunk_b64 = self.staged_chunks.get(room_code, {}).get(chunk_index)
+            if chunk_b64 is None:
+                audio_chunk = self.stream_audio_chunk(room_code, chunk_index)
+                if audio_chunk:
+                    # Send audio chunk as base64
+                    chunk_b64 = base64.b64encode(audio_chunk).decode("utf-8")
+            if chunk_b64:
+                self.transport.emit_bulk(
+                    "audio_chunk",
+                    {
+                        "room_code": room_code,
+                        "chunk_index": chunk_index,
+                        "audio_data": chunk_b64,
+                    },
+                    room=sid,
+                    namespace=namespace,
+                )
+            else:
+                print(f"No audio chunk available for chunk_index {chunk_index}")
+        else:
+            print(f"No audio data available for room {room_code}")
 
-            # Update the room's queue
-            self.rooms[room_code]["queue"] = restored_queue
-            print(
-                f"[SERVER] Updated room {room_code} queue with {len(restored_queue)} songs"
+    def add_song_to_room_queue(self, sid, room_code: str, song_metadata: Dict):
+        """Add a song to a room's queue and broadcast the update."""
+        if room_code in self.rooms:
+            self.apply_room_queue_op(
+                room_code, make_insert_op(song_metadata["song_id"]), sid
             )
 
-            # Broadcast to all users in the room
-            self.sio.emit(
-                "queue_synced",
-                {"queue": restored_queue, "updated_by": sid},
-                room=room_code,
+    def apply_room_queue_op(
+        self, room_code: str, op: Dict, sid=None, base_version=None
+    ) -> bool:
+        """Apply a queue op to a room and broadcast it as a versioned delta.
+
+        base_version is the queue version the sender built op against.
+        Removes and moves name their song and appends need no position,
+        so those still apply to a newer queue; positional inserts and
+        shuffles built on an older queue are rejected.
+        """
+        room = self.rooms[room_code]
+        op_type = op.get("type")
+        if op_type == INSERT and op.get("song_id") not in self.song_records:
+            print(f"[SERVER] Rejected insert of unknown song {op.get('song_id')}")
+            return False
+        if not isinstance(base_version, int):
+            base_version = None
+        if base_version is not None and base_version != room["queue_version"]:
+            positional = op_type == SHUFFLE or (
+                op_type == INSERT and op.get("index") is not None
             )
-            print(
-                f"[SERVER] Broadcasted queue_synced event to room {room_code}: {len(restored_queue)} songs"
+            if positional or base_version > room["queue_version"]:
+                print(
+                    f"[SERVER] Rejected {op_type} built on queue v{base_version}"
+                    f" (room is at v{room['queue_version']})"
+                )
+                return False
+        if op_type == SHUFFLE and not self.shuffle_keeps_current(room, op):
+            print(f"[SERVER] Rejected shuffle from {op.get('start')} in {room_code}")
+            return False
+        try:
+            apply_queue_op(room["queue"], op)
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"[SERVER] Rejected queue op for room {room_code}: {e}")
+            return False
+
+        room["current_idx"] = shift_current_index(
+            room.get("current_idx", 0), op, len(room["queue"])
+        )
+        playhead = self.playheads.get(room_code)
+        if playhead:
+            playhead.song_index = shift_current_index(
+                playhead.song_index, op, len(room["queue"])
             )
-        else:
-            print(f"[SERVER] Room {room_code} not found for sync request")
-            print(f"[SERVER] Available rooms: {list(self.rooms.keys())}")
-
-    def _restore_cover_images_from_library(self, queue_data):
-        """Restore cover images from music library for songs in queue."""
-        restored_queue = []
-        for song in queue_data:
-            # Create a copy of the song
-            restored_song = song.copy()
-
-            # If song has a song_id and needs cover image restoration
-            if song.get("song_id") and song.get("has_cover_image", False):
-                # Find the song in the music library
-                for library_song in self.music_library:
-                    if library_song.get("song_id") == song["song_id"]:
-                        # Restore the cover image
-                        if library_song.get("cover_image"):
-                            restored_song["cover_image"] = library_song["cover_image"]
-                        break
-
-            # Remove the flag since we've handled it
-            if "has_cover_image" in restored_song:
-                del restored_song["has_cover_image"]
-
-            restored_queue.append(restored_song)
-
-        return restored_queue
+        room["queue_version"] += 1
+
+        self.transport.emit(
+            "queue_delta",
+            {
+                "room_code": room_code,
+                "version": room["queue_version"],
+                "op": op,
+                "current_idx": room["current_idx"],
+                "updated_by": sid,
+            },
+            room=room_code,
+        )
+        print(
+            f"[SERVER] Broadcasted queue_delta v{room['queue_version']} ({op.get('type')}) to room {room_code}"
+        )
+        return True
+
+    def shuffle_keeps_current(self, room: Dict, op: Dict) -> bool:
+        """A shuffle may only reorder the songs after the current one."""
+        start = op.get("start")
+        if not isinstance(start, int) or start < 0:
+            return False
+        current_idx = room.get("current_idx", 0)
+        # With no current song (past the end) the whole queue may shuffle
+        return current_idx >= len(room["queue"]) or start > current_idx
+
+    def position_to_chunk(self, position: float) -> int:
+        """Convert a position in seconds to an audio chunk index."""
+        # Each sample is 2 bytes (16-bit), so we need to account for that
+        samples_per_chunk = self.chunk_size // 2  # 2 bytes per sample
+        return int(position * self.sample_rate / samples_per_chunk)
+
+    def is_room_paused(self, room_code: str) -> bool:
+        playhead = self.playheads.get(room_code)
+        return playhead is not None and playhead.is_paused
+
+    def build_room_snapshot(self, room_code: str) -> Dict:
+        """Everything a joining client needs to render the room at once."""
+        room = self.rooms[room_code]
+        playhead = self.playheads.get(room_code)
+        return {
+            "room_code": room_code,
+            "version": room["queue_version"],
+            "players": self.get_players_data(room_code),
+            "queue": room["queue"],
+            "current_idx": room.get("current_idx", 0),
+            "playhead": {
+                **(playhead.to_wire() if playhead else Playhead.IDLE_WIRE),
+                "is_playing": room_code in self.current_audio_data,
+            },
+        }
+
+    def emit_queue_snapshot(self, room_code: str, to: str):
+        """Send the full queue with its version, used on join and for resyncs."""
+        room = self.rooms[room_code]
+        self.transport.emit(
+            "queue_snapshot",
+            {
+                "room_code": room_code,
+                "queue": room["queue"],
+                "version": room["queue_version"],
+                "current_idx": room.get("current_idx", 0),
+            },
+            room=to,
+        )
 
     def _handle_play_song(self, sid, data):
-        """Handle play song in eventlet thread."""
+        """Validate a play request and decode the song in the background."""
         room_code = data.get("room_code")
         song_index = data.get("song_index", 0)
 
@@ -848,23 +954,15 @@ class JamServer:
         print(f"[SERVER] Available rooms: {list(self.rooms.keys())}")
 
         if room_code in self.rooms and song_index < len(self.rooms[room_code]["queue"]):
-            song = self.rooms[room_code]["queue"][song_index]
+            song_id = self.rooms[room_code]["queue"][song_index]
+            song = self.library_by_id[song_id]
             print(
                 f"[SERVER] Starting audio stream for song: {song.get('name', 'Unknown')}"
             )
-
-            # Update the room's current index
-            self.rooms[room_code]["current_idx"] = song_index
-
-            self.start_audio_stream(room_code, song)
-
-            # Broadcast play event to all clients in room
-            self.sio.emit(
-                "song_started",
-                {"room_code": room_code, "song_index": song_index, "song": song},
-                room=room_code,
+            # Decoding the song is slow; keep it off the event loop
+            self.transport.spawn(
+                self._decode_song, room_code, song_index, song_id, song.get("filepath")
             )
-            print(f"[SERVER] Broadcasted song_started event to room {room_code}")
         else:
             print(
                 f"[SERVER] Invalid room or song index - room: {room_code}, song_index: {song_index}"
@@ -874,9 +972,51 @@ class JamServer:
             else:
                 print(f"[SERVER] Room not found")
 
+    def _decode_song(self, room_code, song_index, song_id, filepath):
+        """Spawned: decode the song, then start it back on the event loop."""
+        if not filepath or not os.path.exists(filepath):
+            print(f"Audio file not found: {filepath}")
+            audio_data = b""
+        else:
+            audio_data = self.load_audio_data(filepath)
+        self.transport.call_soon(
+            self.start_song, room_code, song_index, song_id, audio_data
+        )
+
+    def start_song(self, room_code, song_index, song_id, audio_data):
+        """Make a decoded song the room's current one and tell its clients."""
+        room = self.rooms.get(room_code)
+        queue = room["queue"] if room else []
+        if song_index >= len(queue) or queue[song_index] != song_id:
+            # The room or its queue changed while the song was decoding
+            print(f"[SERVER] Dropping stale play_song for room {room_code}")
+            return
+
+        # Update the room's current index
+        room["current_idx"] = song_index
+
+        if audio_data:
+            self.start_audio_stream(room_code, song_id, song_index, audio_data)
+
+        # Broadcast play event to all clients in room
+        self.transport.emit(
+            "song_started",
+            {
+                "room_code": room_code,
+                "song_index": song_index,
+                "song": self.song_records[song_id].to_wire(),
+            },
+            room=room_code,
+        )
+        print(f"[SERVER] Broadcasted song_started event to room {room_code}")
+
     def load_audio_data(self, filepath: str) -> bytes:
         """Load audio data from MP3 file and convert to PCM."""
         try:
+            # Decoding libraries are loaded with the first song, not at startup
+            import numpy as np
+            from pydub import AudioSegment
+
             # Load audio file using pydub
             audio = AudioSegment.from_mp3(filepath)
 
@@ -929,40 +1069,58 @@ class JamServer:
             return audio_data[start_pos:end_pos]
         return None
 
-    def start_audio_stream(self, room_code: str, song_metadata: Dict):
-        """Start streaming audio for a room."""
-        filepath = song_metadata.get("filepath")
-        if not filepath or not os.path.exists(filepath):
-            print(f"Audio file not found: {filepath}")
-            return
-
-        # Load audio data
-        audio_data = self.load_audio_data(filepath)
-        if audio_data:
-            self.current_audio_data[room_code] = audio_data
-            self.current_positions[room_code] = 0
-
-            # Notify clients that audio stream is ready
-            # Each sample is 2 bytes (16-bit), so we need to account for that
-            samples_per_chunk = self.chunk_size // 2  # 2 bytes per sample
-            total_chunks = len(audio_data) // self.chunk_size
-
-            self.sio.emit(
-                "audio_stream_ready",
-                {
-                    "room_code": room_code,
-                    "song": song_metadata,
-                    "total_chunks": total_chunks,
-                },
-                room=room_code,
-            )
-            print(f"Audio stream ready for room {room_code}")
+    def stage_chunks(self, room_code: str, chunk_index: int):
+        """Pre-encode the chunks following a seek target for the room."""
+        staged = {}
+        for index in range(chunk_index, chunk_index + self.prestage_chunks):
+            audio_chunk = self.stream_audio_chunk(room_code, index)
+            if not audio_chunk:
+                break
+            staged[index] = base64.b64encode(audio_chunk).decode("utf-8")
+        self.staged_chunks[room_code] = staged
+
+    def start_audio_stream(
+        self, room_code: str, song_id: str, song_index: int, audio_data: bytes
+    ):
+        """Start streaming decoded audio for a room."""
+        self.current_audio_data[room_code] = audio_data
+        self.staged_chunks.pop(room_code, None)
+        duration = len(audio_data) / 2 / self.sample_rate  # 2 bytes per sample
+        self.playheads[room_code] = Playhead(song_index, duration, song_id=song_id)
+
+        # Notify clients that audio stream is ready
+        self.emit_audio_stream_ready(room_code, to=room_code)
+        print(f"Audio stream ready for room {room_code}")
+
+    def emit_audio_stream_ready(self, room_code: str, to: str):
+        """Tell clients to start streaming from the room's live position."""
+        audio_data = self.current_audio_data[room_code]
+        playhead = self.playheads[room_code]
+        position = playhead.position()
+        total_chunks = len(audio_data) // self.chunk_size
+
+        self.transport.emit(
+            "audio_stream_ready",
+            {
+                "room_code": room_code,
+                "song": self.song_records[playhead.song_id].to_wire(),
+                "song_index": playhead.song_index,
+                "total_chunks": total_chunks,
+                "total_frames": len(audio_data) // 2,  # 16-bit mono
+                "start_chunk": self.position_to_chunk(position),
+                "position": position,
+                "is_paused": playhead.is_paused,
+            },
+            room=to,
+        )
 
     def generate_room_code(self) -> str:
         """Generate a unique 6-character room code."""
         while True:
             code = "".join(random.choices(string.ascii_uppercase + string.digits, k=6))
-            if code not in self.rooms:
+            if code in self.rooms:
+                continue
+            if room_worker(code, self.worker_count) == self.worker_index:
                 return code
 
     def remove_user_from_room(self, sid: str):
@@ -976,6 +1134,9 @@ class JamServer:
                     # If no users left, delete the room
                     if not room_data["users"]:
                         del self.rooms[room_code]
+                        self.current_audio_data.pop(room_code, None)
+                        self.playheads.pop(room_code, None)
+                        self.staged_chunks.pop(room_code, None)
                         print(f"Room {room_code} deleted (no users left)")
                     else:
                         # If host left, assign new host
@@ -983,7 +1144,7 @@ class JamServer:
                             room_data["host"] = room_data["users"][0]["sid"]
 
                         # Notify remaining users
-                        self.sio.emit(
+                        self.transport.emit(
                             "user_left", {"username": username}, room=room_code
                         )
 
@@ -993,20 +1154,27 @@ class JamServer:
                     print(f"User {username} removed from room {room_code}")
                     return
 
+    def get_players_data(self, room_code: str):
+        """Players list as sent to clients."""
+        players_data = []
+        for user in self.rooms[room_code]["users"]:
+            players_data.append(
+                {
+                    "username": user["username"],
+                    "color_idx": user["color_idx"],
+                    "position": user.get("position", 0),
+                }
+            )
+        return players_data
+
     def broadcast_players_update(self, room_code: str):
         """Broadcast the current players list to all users in a room."""
         if room_code in self.rooms:
-            players_data = []
-            for user in self.rooms[room_code]["users"]:
-                players_data.append(
-                    {
-                        "username": user["username"],
-                        "color_idx": user["color_idx"],
-                        "position": user.get("position", 0),
-                    }
-                )
+            players_data = self.get_players_data(room_code)
 
-            self.sio.emit("players_updated", {"players": players_data}, room=room_code)
+            self.transport.emit(
+                "players_updated", {"players": players_data}, room=room_code
+            )
             print(f"Broadcasted players update for room {room_code}: {players_data}")
 
     def get_room_info(self, room_code: str) -> Optional[Dict]:
@@ -1017,8 +1185,8 @@ class JamServer:
         """Get information about all rooms."""
         return self.rooms
 
-    def run(self, host="0.0.0.0", port=None):
-        """Start the server."""
+    def run(self, host="0.0.0.0", port=None, on_ready=None):
+        """Start the server; on_ready() is called once it accepts connections."""
         # Try to get the local IPv4 address for LAN access
         import socket
 
@@ -1036,8 +1204,19 @@ class JamServer:
         else:
             print(f"[INFO] Server accessible at http://{host}:{port}")
 
+        try:
+            listener = self.transport.listen(host, port)
+        except OSError as e:
+            print(f"[SERVER] Could not listen on {host}:{port}: {e}")
+            self.listen_error = e
+            return
+        self.address = listener.getsockname()[:2]
+        if on_ready:
+            on_ready()
+
         # Start Socket.IO server
-        wsgi.server(eventlet.listen((host, port)), self.app, log_output=False)
+        print(f"[SERVER] Serving with the {self.transport.name} backend")
+        self.transport.serve(listener)
 
 
 if __name__ == "__main__":
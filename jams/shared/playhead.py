@@ -0,0 +1,57 @@
+import time
+
+
+class Playhead:
+    """
+    Authoritative play position of a room's current song.
+    Position is derived from when playback started, the offset of the last
+    pause/seek and the wall clock, so it is correct whenever it is read.
+    Attributes:
+        song_index (int): queue index of the song being played.
+        song_id (str): ID of the song being played.
+        duration (float): song length in seconds (0 if unknown).
+        is_paused (bool): whether the room is paused.
+    """
+
+    # Wire form for a room with no song loaded yet
+    IDLE_WIRE = {"song_index": 0, "position": 0, "is_paused": False}
+
+    def __init__(self, song_index=0, duration=0.0, song_id=None, clock=time.monotonic):
+        self.song_index = song_index
+        self.song_id = song_id
+        self.duration = duration
+        self.is_paused = False
+        self._clock = clock
+        self._offset = 0.0  # position when the clock was last anchored
+        self._anchor = clock()
+
+    def position(self):
+        """Current position in seconds."""
+        if self.is_paused:
+            position = self._offset
+        else:
+            position = self._offset + (self._clock() - self._anchor)
+        if self.duration:
+            position = min(position, self.duration)
+        return max(position, 0.0)
+
+    def pause(self):
+        if not self.is_paused:
+            self._offset = self.position()
+            self.is_paused = True
+
+    def resume(self):
+        if self.is_paused:
+            self._anchor = self._clock()
+            self.is_paused = False
+
+    def seek(self, position):
+        self._offset = float(position)
+        self._anchor = self._clock()
+
+    def to_wire(self):
+        return {
+            "song_index": self.song_index,
+            "position": self.position(),
+            "is_paused": self.is_paused,
+        }
@@ -0,0 +1,104 @@
+import random
+
+# Queue edits travel as small op dicts instead of the whole queue. The server
+# applies each op to the room queue, bumps the room's queue version and
+# broadcasts the op as a delta; clients apply the same op to their copy.
+# Queues hold song IDs, see jams/shared/song_record.py.
+#
+#   {"type": "insert", "index": int | None, "song_id": str}   None appends
+#   {"type": "remove", "index": int, "song_id": str | None}
+#   {"type": "move", "from": int, "to": int, "song_id": str | None}
+#   {"type": "shuffle", "start": int, "seed": int}
+
+INSERT = "insert"
+REMOVE = "remove"
+MOVE = "move"
+SHUFFLE = "shuffle"
+
+
+def make_insert_op(song_id, index=None):
+    """Build an op that inserts a song (appends when index is None)."""
+    return {"type": INSERT, "index": index, "song_id": song_id}
+
+
+def make_remove_op(index, song_id=None):
+    """Build an op that removes the song at index."""
+    return {"type": REMOVE, "index": index, "song_id": song_id}
+
+
+def make_move_op(from_idx, to_idx, song_id=None):
+    """Build an op that moves the song at from_idx to to_idx."""
+    return {"type": MOVE, "from": from_idx, "to": to_idx, "song_id": song_id}
+
+
+def make_shuffle_op(start, seed=None):
+    """Build an op that shuffles queue[start:] with a seeded RNG."""
+    if seed is None:
+        seed = random.randrange(2**32)
+    return {"type": SHUFFLE, "start": start, "seed": seed}
+
+
+def _check_index(queue, idx):
+    if not isinstance(idx, int) or not 0 <= idx < len(queue):
+        raise ValueError(f"Index {idx} out of range for queue of {len(queue)}")
+
+
+def _check_song_id(queue, idx, song_id):
+    # Ops built from a stale queue point at the wrong song; refuse them
+    if song_id is not None and queue[idx] != song_id:
+        raise ValueError(f"Song at index {idx} is not {song_id}")
+
+
+def apply_queue_op(queue, op):
+    """Apply a queue op in place. Raises ValueError for invalid ops."""
+    op_type = op.get("type")
+
+    if op_type == INSERT:
+        index = op.get("index")
+        if not op.get("song_id"):
+            raise ValueError("Insert op without a song_id")
+        if index is None:
+            queue.append(op["song_id"])
+        else:
+            queue.insert(max(0, min(index, len(queue))), op["song_id"])
+    elif op_type == REMOVE:
+        _check_index(queue, op.get("index"))
+        _check_song_id(queue, op["index"], op.get("song_id"))
+        del queue[op["index"]]
+    elif op_type == MOVE:
+        _check_index(queue, op.get("from"))
+        _check_index(queue, op.get("to"))
+        _check_song_id(queue, op["from"], op.get("song_id"))
+        queue.insert(op["to"], queue.pop(op["from"]))
+    elif op_type == SHUFFLE:
+        start = max(0, op.get("start", 0))
+        tail = queue[start:]
+        # Same seed -> same order on the server and every client
+        random.Random(op["seed"]).shuffle(tail)
+        queue[start:] = tail
+    else:
+        raise ValueError(f"Unknown queue op: {op_type}")
+
+
+def shift_current_index(current_idx, op, queue_len):
+    """Return where the current song sits after op was applied."""
+    op_type = op.get("type")
+
+    if op_type == INSERT:
+        index = op.get("index")
+        if index is not None and index <= current_idx:
+            return current_idx + 1
+    elif op_type == REMOVE:
+        if op["index"] < current_idx:
+            return current_idx - 1
+        if op["index"] == current_idx:
+            return min(current_idx, max(queue_len - 1, 0))
+    elif op_type == MOVE:
+        from_idx, to_idx = op["from"], op["to"]
+        if from_idx == current_idx:
+            return to_idx
+        if from_idx < current_idx <= to_idx:
+            return current_idx - 1
+        if to_idx <= current_idx < from_idx:
+            return current_idx + 1
+    return current_idx
@@ -1,7 +1,17 @@
+from jams.shared.queue_ops import (
+    apply_queue_op,
+    make_shuffle_op,
+    shift_current_index,
+)
+from jams.shared.song_record import SongRecordCache
+
+
 class SongQueue:
     def __init__(self, queue):
-        self.queue = queue  # should be a list of dictinoaries
+        self.queue = queue  # list of song IDs
         self.current_idx = 0
+        self.version = 0  # Last queue version applied (from the server)
+        self.records = SongRecordCache()  # song_id -> SongRecord, fetched once
 
     # def add_song(self, song_data):
     #     """Add a song to the queue."""
@@ -17,37 +27,39 @@ class SongQueue:
 
     def shuffle_queue(self, app, client=None):
         """Shuffle the queue (excluding the current song)."""
-        import random
-
-        # Get the queue excluding the current song
+        # Shuffle the remaining songs after the current one
         if hasattr(self, "current_idx") and self.current_idx < len(self.queue):
-            # Shuffle the remaining songs after the current one
-            remaining_songs = self.queue[self.current_idx + 1 :]
-            random.shuffle(remaining_songs)
-            # Reconstruct the queue with current song + shuffled remaining songs
-            self.queue = self.queue[: self.current_idx + 1] + remaining_songs
+            op = make_shuffle_op(self.current_idx + 1)
         else:
             # If no current song, shuffle the entire queue
-            random.shuffle(self.queue)
+            op = make_shuffle_op(0)
 
-        # Update the UI if available
-        if hasattr(app, "queue_ui") and app.queue_ui:
-            app.queue_ui.display_queue()
+        if client and hasattr(client, "send_queue_op"):
+            # The server applies the op and broadcasts it back to everyone
+            client.send_queue_op(op)
+        else:
+            print("[SYNC] No client reference available, shuffling locally")
+            self.apply_op(op)
+            if hasattr(app, "queue_ui") and app.queue_ui:
+                app.queue_ui.display_queue()
 
-        # Call sync function with client reference
-        self.sync_queue_with_friends(self.queue, client)
+    def get_song(self, idx):
+        """Return the SongRecord at idx, or None if it hasn't arrived yet."""
+        if 0 <= idx < len(self.queue):
+            return self.records.get(self.queue[idx])
+        return None
 
-    def sync_queue_with_friends(self, queue, client=None):
-        """Sync queue with friends via Socket.IO."""
-        # Send queue to server for synchronization
-        if client and hasattr(client, "sync_queue_with_server"):
-            # Use the client's sync method
-            client.sync_queue_with_server(queue)
-        else:
-            # Fallback - the actual sync will be handled by the client
-            # when it receives queue updates from the server
-            print("[SYNC] Queue sync requested:", len(queue), "songs")
-            print("[SYNC] No client reference available for direct sync")
+    def apply_op(self, op):
+        """Apply a queue op locally and keep current_idx on the same song."""
+        apply_queue_op(self.queue, op)
+        self.current_idx = shift_current_index(self.current_idx, op, len(self.queue))
+
+    def set_snapshot(self, queue, version, current_idx=None):
+        """Replace the whole queue with a server snapshot."""
+        self.queue = queue
+        self.version = version
+        if current_idx is not None:
+            self.current_idx = current_idx
 
     def remove_from_queue(self, idx: int):
         if 0 <= idx < len(self.queue):
@@ -0,0 +1,124 @@
+import hashlib
+
+
+def compute_cover_hash(cover_image):
+    """Short content hash used to refer to a cover without sending it."""
+    if not cover_image:
+        return None
+    return hashlib.sha1(cover_image.encode("utf-8")).hexdigest()[:16]
+
+
+class SongRecord:
+    """
+    Compact description of a song as clients see it.
+    The server keeps the full spotdl + mutagen metadata (local filepath, cover
+    data, ...) in its library; only the wire projection below is sent out.
+    Attributes:
+        song_id (str): Spotify track ID, also the ID used in queues.
+        title (str), artist (str), album (str): display strings.
+        length (int): duration in whole seconds.
+        cover_hash (str): key of the cover image, None if there is no cover.
+    """
+
+    WIRE_FIELDS = ("song_id", "title", "artist", "album", "length", "cover_hash")
+
+    def __init__(
+        self,
+        song_id,
+        title="Unknown Title",
+        artist="Unknown Artist",
+        album="Unknown Album",
+        length=0,
+        cover_hash=None,
+    ):
+        self.song_id = song_id
+        self.title = title
+        self.artist = artist
+        self.album = album
+        self.length = length
+        self.cover_hash = cover_hash
+
+    @classmethod
+    def from_metadata(cls, metadata):
+        """Build a record from a merged library metadata dict."""
+        return cls(
+            song_id=metadata.get("song_id"),
+            title=metadata.get("title") or metadata.get("name") or "Unknown Title",
+            artist=metadata.get("artist") or "Unknown Artist",
+            album=metadata.get("album") or "Unknown Album",
+            length=int(metadata.get("length") or 0),
+            cover_hash=compute_cover_hash(metadata.get("cover_image")),
+        )
+
+    @classmethod
+    def from_wire(cls, data):
+        # Absent fields keep their defaults rather than becoming None
+        fields = {field: data[field] for field in cls.WIRE_FIELDS if field in data}
+        return cls(fields.pop("song_id", None), **fields)
+
+    def to_wire(self):
+        return {field: getattr(self, field) for field in self.WIRE_FIELDS}
+
+
+class SongRecordCache:
+    """
+    Client-side cache of song records and covers.
+    Each record is fetched from the server once and then reused for every
+    queue change that mentions its song ID. Covers are fetched separately by
+    hash, only when something on screen needs them.
+    """
+
+    def __init__(self):
+        self.records = {}  # {song_id: SongRecord}
+        self.covers = {}  # {cover_hash: base64 str}
+        self._requested = set()  # song_ids asked for but not received yet
+        self._requested_covers = set()  # cover hashes asked for
+
+    def get(self, song_id):
+        return self.records.get(song_id)
+
+    def get_cover(self, cover_hash):
+        return self.covers.get(cover_hash) if cover_hash else None
+
+    def missing(self, song_ids):
+        """Return IDs that still need fetching and mark them as requested."""
+        missing = []
+        for song_id in song_ids:
+            if song_id not in self.records and song_id not in self._requested:
+                self._requested.add(song_id)
+                missing.append(song_id)
+        return missing
+
+    def missing_covers(self, cover_hashes):
+        """Return cover hashes that still need fetching and mark them as requested."""
+        missing = []
+        for cover_hash in cover_hashes:
+            if (
+                cover_hash
+                and cover_hash not in self.covers
+                and cover_hash not in self._requested_covers
+            ):
+                self._requested_covers.add(cover_hash)
+                missing.append(cover_hash)
+        return missing
+
+    def add(self, wire_records):
+        """Store records received from the server."""
+        added = []
+        for data in wire_records:
+            record = SongRecord.from_wire(data)
+            self.records[record.song_id] = record
+            self._requested.discard(record.song_id)
+            added.append(record)
+        return added
+
+    def add_covers(self, covers, requested=None):
+        """Store covers received from the server.
+
+        requested lists the hashes the reply answers; any it lacks (e.g. a
+        song still downloading) may be asked for again later.
+        """
+        self.covers.update(covers)
+        self._requested_covers.difference_update(covers)
+        if requested:
+            self._requested_covers.difference_update(requested)
@@ -0,0 +1,163 @@
+import atexit
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from jams.serve import ADDRESS_IN_USE, READY_LINE
+
+# The server finds its downloads and library relative to the project root
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ServerSupervisor:
+    """
+    Runs the host's JamServer as a child process (python -m jams.serve).
+    The child prints READY on stdout once it is listening; every other
+    line it writes is forwarded to this process's output. If the child
+    dies unexpectedly it is restarted after a short backoff and the
+    restart listeners are told (its rooms are gone). It is stopped when
+    the host exits, and exits by itself when the host dies without
+    stopping it, since its stdin pipe then closes.
+    Attributes:
+        host (str), port (int): address the server listens on.
+        backend (str): "eventlet" or "asyncio", see jams.transport.
+        workers (int): worker processes, see jams.router (None: the default).
+        max_restarts (int): crashes tolerated before giving up.
+        restarts (int): times the server has been restarted.
+        restart_listeners (list): callables run when the server restarts.
+    """
+
+    def __init__(
+        self, host="0.0.0.0", port=None, max_restarts=5, backend=None, workers=None
+    ):
+        self.host = host
+        self.port = port
+        self.backend = backend  # None: the server's default
+        self.workers = workers
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self.restart_listeners = []
+        self.ready = threading.Event()
+        self.address_in_use = False
+        self._process = None
+        self._stopping = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Launch the server process; returns without waiting for it."""
+        with self._lock:
+            if self._stopping or self.is_running():
+                return
+            cmd = [
+                sys.executable,
+                "-u",
+                "-m",
+                "jams.serve",
+                "--host",
+                self.host,
+                "--exit-with-parent",
+            ]
+            if self.port is not None:
+                cmd += ["--port", str(self.port)]
+            if self.backend is not None:
+                cmd += ["--backend", self.backend]
+            if self.workers is not None:
+                cmd += ["--workers", str(self.workers)]
+            self.ready.clear()
+            self._process = subprocess.Popen(
+                cmd,
+                cwd=PROJECT_ROOT,
+                stdin=subprocess.PIPE,  # Held open for as long as we live
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+            print(f"[CLIENT] Started server process {self._process.pid}")
+            threading.Thread(
+                target=self._watch, args=(self._process,), daemon=True
+            ).start()
+
+    def add_restart_listener(self, listener):
+        if listener not in self.restart_listeners:
+            self.restart_listeners.append(listener)
+
+    def wait_ready(self, timeout=10.0):
+        """True once the server listens; False on timeout or a taken port."""
+        return self.ready.wait(timeout) and not self.address_in_use
+
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def stop(self, timeout=3.0):
+        """Stop the server process (and don't restart it)."""
+        with self._lock:
+            self._stopping = True
+            process = self._process
+        if process is None or process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        print("[CLIENT] Server process stopped")
+
+    def _watch(self, process):
+        # Forward the child's log and spot the readiness line
+        for line in process.stdout:
+            line = line.rstrip("\n")
+            if line.startswith(READY_LINE):
+                self.ready.set()
+            else:
+                print(line)
+        returncode = process.wait()
+        self.ready.clear()
+
+        if self._stopping:
+            return
+        if returncode == ADDRESS_IN_USE:
+            # Another server already has the port; use that one instead
+            self.address_in_use = True
+            self.ready.set()
+            return
+        if self.restarts >= self.max_restarts:
+            print(f"[CLIENT] Server exited ({returncode}), giving up after restarts")
+            return
+        self.restarts += 1
+        delay = min(0.5 * 2 ** (self.restarts - 1), 5.0)
+        print(f"[CLIENT] Server exited ({returncode}), restarting in {delay:.1f}s")
+        for listener in list(self.restart_listeners):
+            try:
+                listener()
+            except Exception as e:
+                print(f"[CLIENT] Restart listener failed: {e}")
+        time.sleep(delay)
+        self.start()
+
+
+_supervisor = None
+
+
+def start_server_process(host="0.0.0.0", port=None, timeout=10.0, on_restart=None):
+    """Start (or reuse) the supervised server and wait until it listens.
+
+    on_restart() is called whenever the server crashes and is restarted.
+    Returns the supervisor, or None if the port was already taken.
+    """
+    global _supervisor
+    if _supervisor is None:
+        _supervisor = ServerSupervisor(host, port)
+        atexit.register(_supervisor.stop)
+    if on_restart is not None:
+        _supervisor.add_restart_listener(on_restart)
+    _supervisor.start()
+    if not _supervisor.wait_ready(timeout):
+        if not _supervisor.address_in_use:
+            print(f"[CLIENT] Server not ready after {timeout}s")
+        return None
+    return _supervisor
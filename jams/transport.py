@@ -0,0 +1,200 @@
+import asyncio
+import socket
+import threading
+import time
+
+import socketio
+
+BACKENDS = ("eventlet", "asyncio")
+
+
+class EventletTransport:
+    """
+    Socket.IO over eventlet's WSGI server (the default backend).
+    Handlers and spawned work run as green threads on one hub, so a
+    blocking call in either stalls every connection until it returns.
+    Attributes:
+        sio (socketio.Server): the Socket.IO server handlers attach to.
+        app: the WSGI app served by serve().
+    """
+
+    name = "eventlet"
+
+    def __init__(self, client_manager=None):
+        # client_manager: e.g. a jams.bus manager when running as a worker
+        self.sio = socketio.Server(
+            client_manager=client_manager, cors_allowed_origins="*"
+        )
+        self.app = socketio.WSGIApp(self.sio)
+
+    def on(self, event, handler, namespace=None):
+        self.sio.on(event, handler, namespace=namespace)
+
+    def emit(self, event, data=None, **kwargs):
+        self.sio.emit(event, data, **kwargs)
+
+    def emit_bulk(self, event, data=None, **kwargs):
+        """emit() for audio chunks, after control events that are ready to go."""
+        import eventlet
+
+        # Handlers woken by a pause or seek run (and emit) before this send
+        eventlet.sleep(0)
+        self.sio.emit(event, data, **kwargs)
+
+    def enter_room(self, sid, room):
+        self.sio.enter_room(sid, room)
+
+    def leave_room(self, sid, room):
+        self.sio.leave_room(sid, room)
+
+    def spawn(self, fn, *args):
+        """Run fn(*args) in the background."""
+        import eventlet
+
+        eventlet.spawn(fn, *args)
+
+    def call_soon(self, fn, *args):
+        """Run fn(*args) on the event loop; spawned work already runs there."""
+        fn(*args)
+
+    def sleep(self, seconds):
+        import eventlet
+
+        eventlet.sleep(seconds)
+
+    def listen(self, host, port):
+        import eventlet
+
+        # No SO_REUSEPORT: a second server on the port would split rooms
+        listener = eventlet.listen((host, port), reuse_port=False)
+        if not self.sio.manager_initialized:
+            # Start a bus listener now, not on the first connection
+            self.sio.manager_initialized = True
+            self.sio.manager.initialize()
+        return listener
+
+    def serve(self, listener):
+        from eventlet import wsgi
+
+        wsgi.server(listener, self.app, log_output=False)
+
+
+class AsyncioTransport:
+    """
+    Socket.IO on socketio.AsyncServer, served over ASGI by uvicorn.
+    The server's handlers are plain functions and run on the event loop
+    thread, as they would on eventlet's hub. Work handed to spawn() (song
+    decoding, downloads) runs through asyncio.to_thread, so it no longer
+    holds up other connections; it must hand room state changes back to
+    the loop with call_soon(), so they and their emits stay in order.
+    Requires the 'uvicorn' package. Install with: pip install uvicorn
+    Attributes:
+        sio (socketio.AsyncServer): the Socket.IO server handlers attach to.
+        app: the ASGI app served by serve().
+        loop: the running event loop, once serve() started.
+    """
+
+    name = "asyncio"
+
+    def __init__(self):
+        self.sio = socketio.AsyncServer(async_mode="asgi", cors_allowed_origins="*")
+        self.app = socketio.ASGIApp(self.sio)
+        self.loop = None
+        self._loop_thread = None
+        self._tasks = set()  # Keeps scheduled emits alive until they finish
+        self._early = []  # Coroutines submitted before the loop started
+
+    def on(self, event, handler, namespace=None):
+        # AsyncServer calls plain (non-async) handlers directly on the loop
+        self.sio.on(event, handler, namespace=namespace)
+
+    def emit(self, event, data=None, **kwargs):
+        self._submit(self.sio.emit(event, data, **kwargs))
+
+    def emit_bulk(self, event, data=None, **kwargs):
+        """emit() for audio chunks, after control emits already scheduled."""
+
+        async def later():
+            await asyncio.sleep(0)
+            await self.sio.emit(event, data, **kwargs)
+
+        self._submit(later())
+
+    def enter_room(self, sid, room):
+        self.sio.enter_room(sid, room)
+
+    def leave_room(self, sid, room):
+        self.sio.leave_room(sid, room)
+
+    def spawn(self, fn, *args):
+        """Run fn(*args) on a worker thread."""
+        self._submit(asyncio.to_thread(fn, *args))
+
+    def call_soon(self, fn, *args):
+        """Run fn(*args) on the loop thread, e.g. from spawned work."""
+        if self.loop is None:
+
+            async def later():
+                fn(*args)
+
+            self._early.append(later())
+        elif threading.get_ident() == self._loop_thread:
+            fn(*args)
+        else:
+            self.loop.call_soon_threadsafe(fn, *args)
+
+    def sleep(self, seconds):
+        # Only spawned work sleeps, and that runs on worker threads
+        time.sleep(seconds)
+
+    def listen(self, host, port):
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            listener.bind((host, port))
+            listener.listen(128)
+        except OSError:
+            listener.close()
+            raise
+        return listener
+
+    def serve(self, listener):
+        try:
+            import uvicorn
+        except ImportError:
+            raise RuntimeError(
+                "The asyncio backend needs uvicorn. Install with: pip install uvicorn"
+            ) from None
+
+        config = uvicorn.Config(self.app, log_level="warning", lifespan="off")
+        server = uvicorn.Server(config)
+
+        async def main():
+            self.loop = asyncio.get_running_loop()
+            self._loop_thread = threading.get_ident()
+            for coro in self._early:
+                self._submit(coro)
+            self._early = []
+            await server.serve(sockets=[listener])
+
+        asyncio.run(main())
+
+    def _submit(self, coro):
+        if self.loop is None:
+            self._early.append(coro)
+        elif threading.get_ident() == self._loop_thread:
+            task = self.loop.create_task(coro)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+
+def make_transport(backend="eventlet", client_manager=None):
+    if backend == "eventlet":
+        return EventletTransport(client_manager)
+    if backend == "asyncio":
+        if client_manager is not None:
+            raise ValueError("Worker mode (a shared client manager) needs eventlet")
+        return AsyncioTransport()
+    raise ValueError(f"Unknown server backend {backend!r}, expected one of {BACKENDS}")
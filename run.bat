@@ -19,4 +19,6 @@ if %errorlevel%==0 (
     )
 )
 
+REM Pre-scale the UI images into the asset pack (no-op when up to date)
+%PYTHON_CMD% -m utils.asset_pack
 %PYTHON_CMD% main.py 
\ No newline at end of file
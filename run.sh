@@ -16,4 +16,6 @@ if ! command -v $PYTHON_CMD >/dev/null 2>&1; then
   PYTHON_CMD="python"
 fi
 
+# Pre-scale the UI images into the asset pack (no-op when up to date)
+$PYTHON_CMD -m utils.asset_pack
 $PYTHON_CMD main.py 
\ No newline at end of file
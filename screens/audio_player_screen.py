@@ -2,22 +2,26 @@ import time
 import tkinter as tk
 from tkinter import messagebox
 from PIL import Image, ImageTk
-from utils.song import get_random_song_metadata, get_song_metadata, base64_to_image
+from utils.song import get_random_song_metadata, get_song_metadata
 from .queue_screen import FireSideRadioQueueUI
 from jams.shared.song_queue import SongQueue
-from .constants import WOOD_ENGRAVING_COLOR
+from jams.shared.song_record import SongRecord
+from .constants import WOOD_ENGRAVING_COLOR, PLAYER_WINDOW_SIZE
 from utils.voice_detector import VoiceDetector, dB_to_amplitude
 from utils.tkinter_compat import set_window_transparency
+from utils.thumbnail_cache import ThumbnailCache
+from utils.ui_dispatcher import UIDispatcher
+from utils.frame_scheduler import FrameScheduler
+from utils.asset_pack import get_sprite, player_sprite_name
 import threading
-from pydub import AudioSegment
-import pyaudio
+from jams.audio.mixer import load_pcm_cached
 
 
 class AudioPlayerScreen:
     def __init__(self, root, metadata=None, client=None):
         self.root = root
         self.transparent_color = "black"
-        self.root.geometry("550x400")
+        self.root.geometry("{}x{}".format(*PLAYER_WINDOW_SIZE))
         self.root.overrideredirect(True)
         set_window_transparency(self.root, color=self.transparent_color, alpha=0.8)
         self.root.wm_attributes("-topmost", True)
@@ -27,31 +31,21 @@ class AudioPlayerScreen:
         self.client = client
         self.local_username = getattr(client, "username", None)
 
-        self.queue_manager = SongQueue([])
-
-        # Load fire animation images
-        self.fire_images = []
-        try:
-            for i in range(1, 4):
-                fire_img = Image.open(f"assets/fire/Fire_{i}.png")
-                # Resize fire images to fit better (157x210 original size)
-                fire_img = fire_img.resize((157, 210))
-                fire_tk = ImageTk.PhotoImage(fire_img)
-                self.fire_images.append(fire_tk)
-        except Exception as e:
-            print(f"Could not load fire images: {e}")
-            self.fire_images = []
+        # The client owns the queue so it can sync before this screen exists
+        self.queue_manager = client.queue_manager if client else SongQueue([])
+        # Cover thumbnails shared by the player and the queue window
+        self.thumbnail_cache = ThumbnailCache(
+            client.ui if client else UIDispatcher(self.root)
+        )
+        self._no_cover_img = None
 
-        # Load notes animation images
-        self.notes_images = []
-        try:
-            for i in range(1, 4):
-                notes_img = Image.open(f"assets/notes/Notes_{i}.png")
-                notes_tk = ImageTk.PhotoImage(notes_img)
-                self.notes_images.append(notes_tk)
-        except Exception as e:
-            print(f"Could not load notes images: {e}")
-            self.notes_images = []
+        # Animation frames come from the shared sprite cache
+        self.fire_images = [
+            img for img in (get_sprite(f"fire_{i}") for i in range(1, 4)) if img
+        ]
+        self.notes_images = [
+            img for img in (get_sprite(f"notes_{i}") for i in range(1, 4)) if img
+        ]
 
         # Initialize streaming state
         self.is_playing = False
@@ -59,7 +53,7 @@ class AudioPlayerScreen:
         self.stream_start_time = None
         self.paused_position = 0
         self.current_duration = 0
-        self.metadata = metadata or {}
+        self.metadata = metadata  # SongRecord of the current song
         self.is_loading = False  # Flag to prevent seeking during load
 
         # Seek debouncing
@@ -85,7 +79,8 @@ class AudioPlayerScreen:
             2: -2,
             3: 2,
         }  # Array index to relative position
-        self.player_images = {}  # Cache for player images
+        # (color_idx, side, mouth_open) -> PhotoImage, built once
+        self.player_sprites = self._load_player_sprites()
 
         self.is_talking = False  # Track if local user is talking
         # Voice detection threshold in dB (adjust as needed)
@@ -100,16 +95,61 @@ class AudioPlayerScreen:
 
         self.build_ui()
         self.root.bind("<KeyPress-space>", lambda event: self.toggle_play())
-        self.update_progress()
+        # End-of-track detection has to keep running while minimized
+        self.frames.add("progress", self.update_progress, 200, while_hidden=True)
+        self.frames.start()
         # Start fire sound loop in background thread
         self.start_fire_sound()
 
     def _get_metadata_from_queue(self, idx):
         if 0 <= idx < len(self.queue_manager.queue):
-            item = self.queue_manager.queue[idx]
-            return item  # Return the metadata directly from queue
+            record = self.queue_manager.get_song(idx)
+            if record is None:
+                # Record not fetched yet, show a placeholder until it arrives
+                record = SongRecord(self.queue_manager.queue[idx], title="Loading...")
+            return record
         return None
 
+    def _album_photo(self):
+        """Cover of the current song as a 50x50 PhotoImage (gray if not ready)."""
+        photo = None
+        if self.metadata and self.metadata.cover_hash:
+            cover_hash = self.metadata.cover_hash
+            # Album image is a base64 string from the record cache, decoded off-thread
+            photo = self.thumbnail_cache.get(
+                cover_hash,
+                (50, 50),
+                self.queue_manager.records.get_cover(cover_hash),
+                on_ready=lambda _: self.refresh_album_art(),
+            )
+        if photo is None:
+            if self._no_cover_img is None:
+                self._no_cover_img = ImageTk.PhotoImage(
+                    Image.new("RGB", (50, 50), "gray")
+                )
+            photo = self._no_cover_img
+        return photo
+
+    def refresh_album_art(self):
+        """Swap in the current song's cover once it has been fetched."""
+        if hasattr(self, "album_label"):
+            self.album_img = self._album_photo()
+            self.album_label.config(image=self.album_img)
+
+    def _controller_title(self, max_title_chars=10):
+        title = self.metadata.title if self.metadata else ""
+        if len(title) > max_title_chars:
+            title = title[: max_title_chars - 3] + "..."
+        return title
+
+    def update_player_controller(self):
+        """Show the current song in the (already built) player controller."""
+        self.refresh_album_art()
+        self.song_title_label.config(text=self._controller_title())
+        self.song_artist_label.config(
+            text=self.metadata.artist if self.metadata else ""
+        )
+
     def build_player_controller_ui(self, parent, x=None, y=None, width=275, height=180):
         bg_color = "#7C3F30"
         frame = tk.Frame(
@@ -124,22 +164,7 @@ class AudioPlayerScreen:
         top_frame = tk.Frame(frame, bg=bg_color, highlightthickness=0, bd=0)
         top_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
 
-        # Handle album image (could be base64 string or PIL Image)
-        if self.metadata and self.metadata.get("cover_image"):
-            cover_image = self.metadata["cover_image"]
-            if isinstance(cover_image, str):
-                # It's a base64 string, convert to PIL Image
-                img = base64_to_image(cover_image)
-                if img is None:
-                    img = Image.new("RGB", (50, 50), "gray")
-            else:
-                # It's already a PIL Image
-                img = cover_image
-        else:
-            img = Image.new("RGB", (50, 50), "gray")
-
-        img = img.resize((50, 50))
-        self.album_img = ImageTk.PhotoImage(img)
+        self.album_img = self._album_photo()
         self.album_label = tk.Label(
             top_frame, image=self.album_img, bg=bg_color, highlightthickness=0, bd=0
         )
@@ -148,34 +173,28 @@ class AudioPlayerScreen:
         self.album_label.bind("<B1-Motion>", self.do_move)
         text_frame = tk.Frame(top_frame, bg=bg_color, highlightthickness=0, bd=0)
         text_frame.pack(side=tk.LEFT, padx=10)
-        max_title_chars = 10
-        title = (
-            self.metadata.get("title", self.metadata.get("name", ""))
-            if self.metadata
-            else ""
-        )
-        if len(title) > max_title_chars:
-            title = title[: max_title_chars - 3] + "..."
-        tk.Label(
+        self.song_title_label = tk.Label(
             text_frame,
-            text=title,
+            text=self._controller_title(),
             fg="white",
             bg=bg_color,
             font=("Helvetica", 10, "bold"),
             anchor="w",
             justify="left",
             wraplength=height,
-        ).pack(anchor="w")
-        tk.Label(
+        )
+        self.song_title_label.pack(anchor="w")
+        self.song_artist_label = tk.Label(
             text_frame,
-            text=self.metadata.get("artist", "") if self.metadata else "",
+            text=self.metadata.artist if self.metadata else "",
             fg="gray",
             bg=bg_color,
             font=("Helvetica", 9),
             anchor="w",
             justify="left",
             wraplength=height,
-        ).pack(anchor="w")
+        )
+        self.song_artist_label.pack(anchor="w")
         close_btn = tk.Button(
             top_frame,
             text="❎",
@@ -302,6 +321,11 @@ class AudioPlayerScreen:
             on_shuffle_queue=lambda: self.queue_manager.shuffle_queue(
                 self, client=self.client
             ),
+            on_remove_from_queue=(
+                self.client.remove_song_from_queue if self.client else None
+            ),
+            on_request_covers=self.client.request_covers if self.client else None,
+            thumbnail_cache=self.thumbnail_cache,
         )
         self.queue_ui.show()
 
@@ -328,9 +352,9 @@ class AudioPlayerScreen:
             bg=self.transparent_color,
         )
         self.canvas.place(x=0, y=0, relwidth=1, relheight=1)
-        frame_img = Image.open("assets/stage_clean.png")
-        self.frame_img_tk = ImageTk.PhotoImage(frame_img)
-        self.canvas.create_image(0, 0, anchor="nw", image=self.frame_img_tk)
+        self.frame_img_tk = get_sprite("stage")
+        if self.frame_img_tk:
+            self.canvas.create_image(0, 0, anchor="nw", image=self.frame_img_tk)
 
         # Position fire at top-left coordinate (188, 199)
         fire_x = 188
@@ -353,14 +377,9 @@ class AudioPlayerScreen:
             self.notes_image_id = None
 
         # Load and position the box image
-        try:
-            box_img = Image.open("assets/other/Box.png")
-            # Resize box image if needed
-            box_img = box_img.resize((60, 67))  # Adjust size as needed
-            self.box_img_tk = ImageTk.PhotoImage(box_img)
+        self.box_img_tk = get_sprite("box")
+        if self.box_img_tk:
             self.canvas.create_image(296, 311, anchor="nw", image=self.box_img_tk)
-        except Exception as e:
-            print(f"Could not load box image: {e}")
 
         self.player_controller = self.build_player_controller_ui(
             self.canvas, x=160, y=29, width=230, height=140
@@ -370,10 +389,10 @@ class AudioPlayerScreen:
         )
         self.build_fire_radio_button()
 
-        # Start fire animation
-        self.animate_fire()
-        # Start notes animation
-        self.animate_notes()
+        # Fire and notes animations share one frame clock
+        self.frames = FrameScheduler(self.root, self.canvas)
+        self.frames.add("fire", self.animate_fire, 200)
+        self.frames.add("notes", self.animate_notes, 200)
 
     def start_move(self, event):
         self._drag_start_pointer_x = self.root.winfo_pointerx()
@@ -428,8 +447,25 @@ class AudioPlayerScreen:
             print(f"Set stream_start_time to: {self.stream_start_time}")
         self.root.update_idletasks()
 
+    def show_play_state(self, playing, position):
+        """Reflect a room pause/resume/seek in the player controls."""
+        self.is_playing = playing
+        self.paused_position = position
+        self.stream_start_time = time.time() - position if playing else None
+        if hasattr(self, "play_btn"):
+            self.play_btn.config(text="⏸️" if playing else "▶")
+        if hasattr(self, "progress"):
+            self.progress.set(position)
+        if hasattr(self, "time_label_start"):
+            self.time_label_start.config(text=self.format_time(position))
+
     def get_current_pos(self):
         """Get current playback position for streaming."""
+        if self.is_playing and self.client:
+            # Frames the output device actually played, so stalls don't run ahead
+            position = self.client.playback_position()
+            if position is not None:
+                return position
         if self.is_playing and self.stream_start_time is not None:
             current_pos = time.time() - self.stream_start_time
             # print(f"Playing - current_pos: {current_pos}")
@@ -438,29 +474,45 @@ class AudioPlayerScreen:
         # print(f"Paused - paused_position: {self.paused_position}")
         return self.paused_position
 
-    def update_progress(self):
-        """Update progress bar for streaming audio."""
+    def update_progress(self, step=0):
+        """Update progress bar for streaming audio; returns the next delay in ms."""
         # Don't update progress if user is actively seeking
-        if self.is_user_seeking:
-            self.root.after(200, self.update_progress)
-            return
+        if self.is_user_seeking or not self.is_playing:
+            return 200
 
         current_pos = self.get_current_pos()
 
-        if self.is_playing and current_pos < self.current_duration:
-            # Debug: Check if progress bar exists before updating
-            if hasattr(self, "progress") and self.progress:
-                self.progress.set(current_pos)
-            if hasattr(self, "time_label_start") and self.time_label_start:
-                self.time_label_start.config(text=self.format_time(current_pos))
-        elif current_pos >= self.current_duration and self.current_duration > 0:
+        if self.client:
+            finished = self.client.track_finished()
+        else:
+            finished = 0 < self.current_duration <= current_pos
+
+        if finished:
             # Song finished, play next
             self.is_playing = False
             if hasattr(self, "play_btn"):
                 self.play_btn.config(text="▶")
             self.auto_play_next_from_queue()
-
-        self.root.after(200, self.update_progress)
+            return 200
+
+        # Only touch the widgets when what they show actually changes
+        if hasattr(self, "progress") and self.progress:
+            self.progress.set(current_pos)
+        time_text = self.format_time(current_pos)
+        if hasattr(self, "time_label_start") and self.time_label_start:
+            if self.time_label_start.cget("text") != time_text:
+                self.time_label_start.config(text=time_text)
+
+        return self._progress_interval(current_pos)
+
+    def _progress_interval(self, position):
+        """Milliseconds until the time label or slider would visibly move."""
+        until_next_second = 1.0 - (position % 1.0)
+        interval = until_next_second
+        if self.current_duration > 0 and hasattr(self, "progress_bar"):
+            width = max(self.progress_bar.winfo_width(), 1)
+            interval = min(interval, self.current_duration / width)
+        return int(min(max(interval, 0.05), 1.0) * 1000)
 
     def update_progress_bar(self, duration):
         """Update the progress bar with new duration."""
@@ -482,9 +534,9 @@ class AudioPlayerScreen:
     def _load_and_play_song(self, idx):
         print(f"_load_and_play_song called with index {idx}")
         if 0 <= idx < len(self.queue_manager.queue):
-            item = self.queue_manager.queue[idx]
+            item = self._get_metadata_from_queue(idx)
             if item:
-                print(f"Loading song: {item.get('title', item.get('name', 'Unknown'))}")
+                print(f"Loading song: {item.title}")
 
                 self.is_loading = True
 
@@ -495,21 +547,15 @@ class AudioPlayerScreen:
                 self.metadata = item
                 self.queue_manager.current_idx = idx
                 self.current_song_index = idx
+                if self.client:
+                    # Cover arrives lazily, see refresh_album_art
+                    self.client.request_covers([item.cover_hash])
 
-                self.player_controller = self.build_player_controller_ui(
-                    self.canvas, x=160, y=29, width=230, height=140
-                )
-                self.canvas.create_window(
-                    160,
-                    29,
-                    anchor="nw",
-                    window=self.player_controller,
-                    width=220,
-                    height=140,
-                )
+                # The controller is built once in build_ui; just refill it
+                self.update_player_controller()
 
-                # Update progress bar with new duration after UI rebuild
-                duration = item.get("length", 0)
+                # Update progress bar with new duration
+                duration = item.length
                 print(f"Updating progress bar with duration: {duration}s")
                 self.update_progress_bar(duration)
 
@@ -524,6 +570,19 @@ class AudioPlayerScreen:
 
                 self.root.update_idletasks()
 
+    def show_song_at(self, idx, position, paused):
+        """Show a song that is already playing in the room at position."""
+        self._load_and_play_song(idx)
+        self.progress.set(position)
+        self.time_label_start.config(text=self.format_time(position))
+        self.paused_position = position
+        if paused:
+            self.is_playing = False
+            self.stream_start_time = None
+            self.play_btn.config(text="▶")
+        else:
+            self.stream_start_time = time.time() - position
+
     def play_song_from_queue(self, idx):
         self._load_and_play_song(idx)
         if hasattr(self, "queue_ui") and self.queue_ui:
@@ -591,8 +650,8 @@ class AudioPlayerScreen:
         # Store the current position
         self.last_seek_position = val
 
-        # Set a timer to perform the actual seek after 500ms of no movement
-        self.seek_debounce_timer = self.root.after(500, self.perform_seek)
+        # Set a timer to perform the actual seek after 150ms of no movement
+        self.seek_debounce_timer = self.root.after(150, self.perform_seek)
 
         # Update UI immediately for responsive feel (without sending to server)
         self.update_seek_ui(val)
@@ -605,40 +664,13 @@ class AudioPlayerScreen:
         position = self.last_seek_position
         print(f"Performing debounced seek to {position}s")
 
-        # If we're playing, pause first, then seek, then resume
-        was_playing = self.is_playing
-        if was_playing:
-            self.toggle_play()
-
-        # Send seek event to server
-        self.client.sio.emit(
-            "seek_stream",
-            {
-                "room_code": self.client.room_code,
-                "song_index": self.current_song_index,
-                "position": position,
-            },
-        )
-
-        # Update local state immediately for responsive UI
-        if self.is_playing:
-            self.stream_start_time = time.time() - position
-        else:
-            self.paused_position = position
-
-        # Update progress bar and time label
-        self.progress.set(position)
-        if hasattr(self, "time_label_start"):
-            self.time_label_start.config(text=self.format_time(position))
+        # Seek and keep playing (or stay paused) in one server op; the
+        # client updates the progress bar and player state right away
+        self.client.seek(position, resume=self.is_playing)
 
         # Clear the seeking flag to allow progress updates to resume
         self.is_user_seeking = False
 
-        # If we were playing, resume after a short delay
-        if was_playing:
-            print("Resuming after seek")
-            self.root.after(100, self.toggle_play)
-
     def update_seek_ui(self, position):
         """Update UI elements during seeking without sending to server."""
         # Update time label immediately for responsive feel
@@ -650,33 +682,30 @@ class AudioPlayerScreen:
         secs = int(seconds) % 60
         return f"{mins:02}:{secs:02}"
 
-    def animate_fire(self, frame=0):
+    def animate_fire(self, frame):
         """Animate the fire by cycling through the fire images."""
         if self.fire_images and self.fire_image_id:
             # Cycle through the 3 fire images
             current_frame = frame % len(self.fire_images)
-            self.canvas.itemconfig(
+            self.frames.set_item(
                 self.fire_image_id, image=self.fire_images[current_frame]
             )
-            self.root.update()
-
-        # Continue animation
-        self.root.after(200, lambda: self.animate_fire(frame + 1))
 
-    def animate_notes(self, frame=0):
+    def animate_notes(self, frame):
         """Animate the notes by cycling through the notes images."""
         if self.notes_images and self.notes_image_id:
             current_frame = frame % len(self.notes_images)
-            self.canvas.itemconfig(
+            self.frames.set_item(
                 self.notes_image_id, image=self.notes_images[current_frame]
             )
-            self.root.update()
-        self.root.after(200, lambda: self.animate_notes(frame + 1))
 
     def add_player(self, username, color_idx, position_idx):
-        """Add a player to the room."""
+        """Add a player to the room (at the next free seat if position_idx is None)."""
         from custom_classes.custom_color import Color
 
+        if position_idx is None:
+            position_idx = len(self.players)
+
         color = Color(color_idx)
         player = {
             "username": username,
@@ -711,17 +740,44 @@ class AudioPlayerScreen:
         for player in self.players:
             if player.get("username") == username:
                 player["is_talking"] = is_talking
-                # Remove old image/text
-                if player.get("canvas_id"):
-                    self.canvas.delete(player["canvas_id"])
-                if player.get("text_id"):
-                    self.canvas.delete(player["text_id"])
-                # Re-render with new mouth state
-                self.render_player(player)
+                self._update_player_sprite(player)
                 break
 
+    def _load_player_sprites(self):
+        """All player sprites: 7 colors x 2 sides x 2 mouth states."""
+        from custom_classes.custom_color import COLOR_NAMES
+
+        sprites = {}
+        for color_idx in range(len(COLOR_NAMES)):
+            for side in ("L", "R"):
+                for mouth_open in (False, True):
+                    sprite = get_sprite(player_sprite_name(color_idx, side, mouth_open))
+                    if sprite is not None:
+                        sprites[(color_idx, side, mouth_open)] = sprite
+        return sprites
+
+    def _player_mouth_open(self, player):
+        # Local mouth follows the voice detector, remote ones the server relay
+        if player.get("username") == self.local_username:
+            return self.is_talking
+        return player.get("is_talking", False)
+
+    def _update_player_sprite(self, player):
+        """Swap the player's image in place when the mouth state changed."""
+        if not player.get("canvas_id"):
+            return
+        mouth_open = self._player_mouth_open(player)
+        if player.get("mouth_open") == mouth_open:
+            return
+        sprite = self.player_sprites.get(
+            (player["color"].color_index, player["side"], mouth_open)
+        )
+        if sprite is not None:
+            self.canvas.itemconfig(player["canvas_id"], image=sprite)
+            player["mouth_open"] = mouth_open
+
     def render_player(self, player):
-        """Render a player on the canvas."""
+        """Create a player's canvas items; they live until the player leaves."""
         position_idx = player["position_idx"]
         color = player["color"]
 
@@ -735,62 +791,33 @@ class AudioPlayerScreen:
 
         # Get relative position for image selection
         rel_pos = self.position_mapping.get(position_idx, 0)
-        if rel_pos < 0:
-            image_type = "L"  # Left
-        else:
-            image_type = "R"  # Right
+        side = "L" if rel_pos < 0 else "R"
+        mouth_open = self._player_mouth_open(player)
 
-        # Determine mouth state for local user or remote
-        is_local = player.get("username") == self.local_username
-        # For remote, use player['is_talking'] if present
-        if is_local:
-            mouth = "O" if self.is_talking else "C"
-        else:
-            mouth = "O" if player.get("is_talking", False) else "C"
-
-        import random
-
-        sample = random.sample(["H", "A"], k=1)
-
-        image_name = f"H{image_type}{mouth}{color.color_index + 1}"
-        # image_path = (
-        #     f"assets/players/{color.color_name}/{image_name}-removebg-preview.png"
-        # )
-        image_path = f"assets/allplayers/{image_name}.png"
-
-        try:
-            # Load and cache image
-            if image_path not in self.player_images:
-                img = Image.open(image_path)
-                self.player_images[image_path] = ImageTk.PhotoImage(img)
-
-            # Create image on canvas
-            player["canvas_id"] = self.canvas.create_image(
-                x, y, anchor="nw", image=self.player_images[image_path]
-            )
-
-            # Create username text above the player
-            # Position text above the player image (assuming player images are roughly 100px tall)
-            if image_type == "L":
-                text_x = x + 40  # Center horizontally on the player
-            else:
-                text_x = x + 50  # Center horizontally on the player
-            text_y = y - 10  # Position above the player
-            player["text_id"] = self.canvas.create_text(
-                text_x,
-                text_y,
-                text=player["username"],
-                fill="#D3D3D3",  # Light gray color
-                font=("Helvetica", 10, "bold"),
-                anchor="s",  # Anchor at bottom so text appears above player
-            )
+        sprite = self.player_sprites.get((color.color_index, side, mouth_open))
+        if sprite is None:
+            print(f"Error rendering player {player['username']}: no sprite")
+            return
 
-            # print(
-            #     f"Rendered {player['username']} at ({x}, {y}) with image {image_name}"
-            # )
+        player["side"] = side
+        player["mouth_open"] = mouth_open
+        player["canvas_id"] = self.canvas.create_image(x, y, anchor="nw", image=sprite)
 
-        except Exception as e:
-            print(f"Error rendering player {player['username']}: {e}")
+        # Create username text above the player
+        # Position text above the player image (assuming player images are roughly 100px tall)
+        if side == "L":
+            text_x = x + 40  # Center horizontally on the player
+        else:
+            text_x = x + 50  # Center horizontally on the player
+        text_y = y - 10  # Position above the player
+        player["text_id"] = self.canvas.create_text(
+            text_x,
+            text_y,
+            text=player["username"],
+            fill="#D3D3D3",  # Light gray color
+            font=("Helvetica", 10, "bold"),
+            anchor="s",  # Anchor at bottom so text appears above player
+        )
 
     def update_players(self, players_data):
         """Update all players based on server data."""
@@ -829,8 +856,11 @@ class AudioPlayerScreen:
 
     def _on_voice_state_change(self, is_talking):
         self.is_talking = is_talking
-        # Redraw local player with new mouth state
-        self._update_local_player_mouth()
+        # Swap the local player's sprite; this runs on the detector thread
+        if self.client and hasattr(self.client, "ui"):
+            self.client.ui.post(self._update_local_player_mouth, key="talking:local")
+        else:
+            self._update_local_player_mouth()
         # Emit talking state to server for relay
         if (
             self.client
@@ -851,43 +881,29 @@ class AudioPlayerScreen:
         # Find local user by username
         player = self.get_local_player()
         if player:
-            if player.get("canvas_id"):
-                self.canvas.delete(player["canvas_id"])
-            if player.get("text_id"):
-                self.canvas.delete(player["text_id"])
-            self.render_player(player)
+            self._update_player_sprite(player)
 
     def start_fire_sound(self):
-        """Start looping fire sound in a background thread."""
-        self._fire_sound_stop_event = threading.Event()
-        self._fire_sound_thread = threading.Thread(
-            target=self._play_fire_sound_loop, daemon=True
-        )
-        self._fire_sound_thread.start()
+        """Start the looping fire sound in the client's audio mixer."""
+        if not self.client:
+            return
+        # Decoding (first launch only) happens off the UI thread
+        threading.Thread(target=self._load_fire_sound, daemon=True).start()
 
-    def _play_fire_sound_loop(self):
+    def _load_fire_sound(self):
         try:
-            fire_sound = AudioSegment.from_mp3("assets/fire-sound.mp3")
-            p = pyaudio.PyAudio()
-            stream = p.open(
-                format=p.get_format_from_width(fire_sound.sample_width),
-                channels=fire_sound.channels,
-                rate=fire_sound.frame_rate,
-                output=True,
+            output = self.client.audio_output
+            pcm = load_pcm_cached(
+                "assets/fire-sound.mp3", output.sample_rate, output.channels
             )
-            raw_data = fire_sound.raw_data
-            while not self._fire_sound_stop_event.is_set():
-                stream.write(raw_data)
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
+            output.start_ambience(pcm)
         except Exception as e:
             print(f"Error playing fire sound: {e}")
 
     def stop_fire_sound(self):
         """Stop the fire sound loop."""
-        if hasattr(self, "_fire_sound_stop_event"):
-            self._fire_sound_stop_event.set()
+        if self.client:
+            self.client.audio_output.stop_ambience()
 
     def on_close(self):
         # Disconnect client if possible, then destroy window
@@ -900,8 +916,11 @@ class AudioPlayerScreen:
                 self.client.sio.disconnect()
         except Exception as e:
             print(f"Error during disconnect: {e}")
+        if self.client is not None and hasattr(self.client, "close_audio"):
+            self.client.close_audio()
         if hasattr(self, "voice_detector"):
             self.voice_detector.stop()
         # Stop fire sound loop
         self.stop_fire_sound()
+        self.frames.stop()
         self.root.destroy()
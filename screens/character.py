@@ -11,6 +11,7 @@ from .constants import (
 from custom_classes.custom_color import Color
 from .joinhostcode import JoinHostCodeScreen
 from utils.tkinter_compat import set_window_transparency
+from utils.asset_pack import get_sprite
 
 import random
 
@@ -70,25 +71,11 @@ class CharacterScreen:
         self.canvas.place(x=0, y=0, relwidth=1, relheight=1)
 
         # Display the correct background image
-        try:
-            from PIL import Image, ImageTk
-            import os
-
-            if self.is_host:
-                bg_path = os.path.join(
-                    "assets", "signs", "character_selection_host.png"
-                )
-            else:
-                bg_path = os.path.join("assets", "signs", "character_join_thing.png")
-
-            if os.path.exists(bg_path):
-                bg_img = Image.open(bg_path)
-                self.bg_img_tk = ImageTk.PhotoImage(bg_img)
-                self.canvas.create_image(0, 0, anchor="nw", image=self.bg_img_tk)
-            else:
-                print(f"Image file not found: {bg_path}")
-        except Exception as e:
-            print(f"Could not load character screen image: {e}")
+        self.bg_img_tk = get_sprite(
+            "character_host" if self.is_host else "character_join"
+        )
+        if self.bg_img_tk:
+            self.canvas.create_image(0, 0, anchor="nw", image=self.bg_img_tk)
 
         # Close button (top right, inside canvas)
         self.close_btn = tk.Button(
@@ -301,3 +288,5 @@ class CharacterScreen:
         except Exception as e:
             print(f"Error during disconnect: {e}")
         self.root.destroy()
+        if hasattr(self.client, "close_before_room"):
+            self.client.close_before_room()
@@ -1,5 +1,6 @@
 WOOD_COLOR = "#7C3F30"
 WOOD_ENGRAVING_COLOR = "#502319"
+PLAYER_WINDOW_SIZE = (550, 400)
 COLOR_HEXS = [
     "#41EBAE",
     "#708AF5",
@@ -64,3 +65,5 @@ nouns = [
 
 LOCAL_IP = "192.168.86.111"
 LOCAL_PORT = 5000
+# Audio chunks travel on their own connection in this namespace
+AUDIO_NAMESPACE = "/audio"
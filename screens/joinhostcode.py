@@ -7,6 +7,7 @@ from .constants import (
     LOCAL_PORT,
 )
 from utils.tkinter_compat import set_window_transparency
+from utils.asset_pack import get_sprite
 
 
 class JoinHostCodeScreen:
@@ -63,21 +64,14 @@ class JoinHostCodeScreen:
         if self.is_host:
             # Set up callback for when room is created
             print("Setting up room_created callback...")
-            self.client.sio.on("room_created", self.on_room_created)
+            # Listen through the client: its own handler must still run
+            self.client.add_room_created_listener(self.on_room_created)
             print("Callback set up successfully")
 
         # Display the correct background image
-        try:
-            from PIL import Image, ImageTk
-
-            if self.is_host:
-                bg_img = Image.open("assets/signs/host_code_thing.png")
-            else:
-                bg_img = Image.open("assets/signs/join_code_enter_png.png")
-            self.bg_img_tk = ImageTk.PhotoImage(bg_img)
+        self.bg_img_tk = get_sprite("host_code" if self.is_host else "join_code")
+        if self.bg_img_tk:
             self.canvas.create_image(0, 0, anchor="nw", image=self.bg_img_tk)
-        except Exception as e:
-            print(f"Could not load joinhostcode screen image: {e}")
 
         # Close button (top right, inside canvas)
         self.close_btn = tk.Button(
@@ -274,42 +268,34 @@ class JoinHostCodeScreen:
         # Show loading state
         self.update_join_status("Connecting to server...")
 
-        # First, connect to the server if not already connected
-        if not self.client.is_connected():
-            print(f"Client not connected, attempting to connect...")
-
-            # Try to connect to existing server first
-            if not self.client.connect_to_server(f"http://{LOCAL_IP}:{LOCAL_PORT}"):
-                print("No existing server found, starting new server...")
-                self.update_join_status("Starting server...")
-
-                # Start server in background
-                import threading
-                import time
-                from jams.server import JamServer
-
-                def start_server():
-                    try:
-                        server = JamServer()
-                        server.run(host="0.0.0.0", port=5000)
-                    except Exception as e:
-                        print(f"Server error: {e}")
-
-                server_thread = threading.Thread(target=start_server, daemon=True)
-                server_thread.start()
-
-                # Wait for server to start
-                time.sleep(2)
-
-                # Try connecting again
-                if not self.client.connect_to_server(f"http://{LOCAL_IP}:{LOCAL_PORT}"):
-                    self.update_join_status("Failed to connect to server")
-                    print("Failed to connect to server")
-                    return
-                else:
-                    print("Successfully connected to server")
+        # Connect with the room code in the URL (an existing connection to
+        # the same URL is kept), so a multi-worker server routes it right
+        if not self.client.connect_to_server(
+            f"http://{LOCAL_IP}:{LOCAL_PORT}", room_code
+        ):
+            print("No existing server found, starting new server...")
+            self.update_join_status("Starting server...")
+
+            # Returns as soon as the server process is listening
+            from jams.supervisor import start_server_process
+
+            start_server_process(
+                host="0.0.0.0",
+                port=LOCAL_PORT,
+                on_restart=self.client.on_server_restarted,
+            )
+
+            # Try connecting again
+            if not self.client.connect_with_backoff(
+                f"http://{LOCAL_IP}:{LOCAL_PORT}", room_code=room_code
+            ):
+                self.update_join_status("Failed to connect to server")
+                print("Failed to connect to server")
+                return
             else:
-                print("Successfully connected to existing server")
+                print("Successfully connected to server")
+        else:
+            print("Successfully connected to existing server")
 
         self.update_join_status("Joining room...")
         print(f"Attempting to join room: {room_code}")
@@ -341,8 +327,8 @@ class JoinHostCodeScreen:
         room_code = data.get("room_code")
         if room_code:
             print(f"Setting room code to: {room_code}")
-            # Use after to schedule UI update on main thread
-            self.root.after(0, lambda: self._update_room_code(room_code))
+            # Schedule the UI update on the Tk thread
+            self.client.ui.post(self._update_room_code, room_code)
             print(f"Room created with code: {room_code}")
         else:
             print("No room_code in data")
@@ -375,3 +361,5 @@ class JoinHostCodeScreen:
         except Exception as e:
             print(f"Error during disconnect: {e}")
         self.root.destroy()
+        if hasattr(self.client, "close_before_room"):
+            self.client.close_before_room()
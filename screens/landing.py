@@ -1,7 +1,8 @@
 import tkinter as tk
-from .constants import WOOD_COLOR, WOOD_ENGRAVING_COLOR
+from .constants import WOOD_COLOR, WOOD_ENGRAVING_COLOR, PLAYER_WINDOW_SIZE
 from .character import CharacterScreen
 from utils.tkinter_compat import set_window_transparency
+from utils.asset_pack import get_sprite
 
 
 class LandingScreen:
@@ -20,8 +21,8 @@ class LandingScreen:
             app_root.update_idletasks()
             app_x = app_root.winfo_x()
             app_y = app_root.winfo_y()
-            app_w = app_root.winfo_width()
-            app_h = app_root.winfo_height()
+            # The root stays withdrawn (and unsized) until a room is entered
+            app_w, app_h = PLAYER_WINDOW_SIZE
             landing_w, landing_h = 250, 300
             center_x = app_x + app_w // 2
             center_y = app_y + app_h // 2
@@ -59,14 +60,9 @@ class LandingScreen:
         self.canvas.place(x=0, y=0, relwidth=1, relheight=1)
 
         # Display the title screen image at the top-left
-        try:
-            from PIL import Image, ImageTk
-
-            title_img = Image.open("assets/signs/title_screen.png")
-            self.title_img_tk = ImageTk.PhotoImage(title_img)
+        self.title_img_tk = get_sprite("title_screen")
+        if self.title_img_tk:
             self.canvas.create_image(0, 0, anchor="nw", image=self.title_img_tk)
-        except Exception as e:
-            print(f"Could not load title image: {e}")
 
         # Close button (top right, inside canvas)
         self.close_btn = tk.Button(
@@ -163,7 +159,7 @@ class LandingScreen:
         # Destroy landing and spawn character screen at same x/y
         x, y = self.get_window_position()
         self.root.destroy()
-        CharacterScreen(self.app.audio_player, self.app, is_host, x, y)
+        CharacterScreen(self.app, self.app, is_host, x, y)
 
     def on_join(self, event=None):
         self.go_to_character_screen(is_host=False)
@@ -174,12 +170,10 @@ class LandingScreen:
     def on_close(self):
         # Disconnect client if possible, then destroy window
         try:
-            if (
-                hasattr(self.app, "client")
-                and hasattr(self.app.client, "sio")
-                and self.app.client.sio.connected
-            ):
-                self.app.client.sio.disconnect()
+            if hasattr(self.app, "sio") and self.app.sio.connected:
+                self.app.sio.disconnect()
         except Exception as e:
             print(f"Error during disconnect: {e}")
         self.root.destroy()
+        if hasattr(self.app, "close_before_room"):
+            self.app.close_before_room()
@@ -2,6 +2,8 @@ import tkinter as tk
 from .constants import WOOD_COLOR, WOOD_ENGRAVING_COLOR, LOCAL_IP, LOCAL_PORT
 from .joinhostcode import JoinHostCodeScreen
 from utils.tkinter_compat import set_window_transparency
+from utils.frame_scheduler import FrameScheduler
+from utils.asset_pack import get_sprite
 
 
 class LoadingScreen:
@@ -32,21 +34,12 @@ class LoadingScreen:
         self._drag_start_win_x = 0
         self._drag_start_win_y = 0
         self._dragging = False
-        self.server_thread = None
+        self.server = None  # ServerSupervisor of the hosted server
 
-        self.fire_images = []
-        try:
-            from PIL import Image, ImageTk
-
-            for i in range(1, 4):
-                fire_img = Image.open(f"assets/fire/Fire_{i}.png")
-                # Resize fire images to fit better (157x210 original size)
-                fire_img = fire_img.resize((157, 210))
-                fire_tk = ImageTk.PhotoImage(fire_img)
-                self.fire_images.append(fire_tk)
-        except Exception as e:
-            print(f"Could not load fire images: {e}")
-            self.fire_images = []
+        # Same PhotoImages as the player screen's fire
+        self.fire_images = [
+            img for img in (get_sprite(f"fire_{i}") for i in range(1, 4)) if img
+        ]
 
         self.build_ui()
         self.start_loading()
@@ -139,124 +132,67 @@ class LoadingScreen:
 
     def update_progress(self, text):
         """Update the progress text."""
-        self.canvas.itemconfig(self.progress_text, text=text)
-        self.root.update()
+        self.frames.set_item(self.progress_text, text=text)
 
-    def animate_dots(self, count=0):
+    def animate_dots(self, count):
         """Animate the loading dots."""
         dots = "." * (count % 4)
-        self.canvas.itemconfig(self.dots_text, text=dots)
-        self.root.update()
-
-        # Continue animation until loading is complete
-        if hasattr(self, "loading_complete") and self.loading_complete:
-            return
-
-        self.root.after(500, lambda: self.animate_dots(count + 1))
+        self.frames.set_item(self.dots_text, text=dots)
 
-    def animate_fire(self, frame=0):
+    def animate_fire(self, frame):
         """Animate the fire by cycling through the fire images."""
-        if hasattr(self, "loading_complete") and self.loading_complete:
-            return
-
         if self.fire_images and self.fire_image_id:
             # Cycle through the 3 fire images
             current_frame = frame % len(self.fire_images)
-            self.canvas.itemconfig(
+            self.frames.set_item(
                 self.fire_image_id, image=self.fire_images[current_frame]
             )
-            self.root.update()
-
-        # Continue animation
-        self.root.after(200, lambda: self.animate_fire(frame + 1))
 
     def start_loading(self):
         """Start the loading process."""
         import threading
-        import time
-        from jams.server import JamServer
-        from .joinhostcode import JoinHostCodeScreen
 
         # Start animations
-        self.animate_dots()
-        self.animate_fire()
+        self.frames = FrameScheduler(self.root, self.canvas)
+        self.frames.add("dots", self.animate_dots, 500)
+        self.frames.add("fire", self.animate_fire, 200)
+        self.frames.start()
+
+        def progress(text):
+            self.client.ui.post(self.update_progress, text)
 
         def loading_process():
             try:
-                # Step 1: Start server
-                self.root.after(0, lambda: self.update_progress("Starting server..."))
-                time.sleep(0.5)
-
-                def start_server():
-                    try:
-                        server = JamServer()
-                        server.run(host="0.0.0.0", port=5000)
-                    except Exception as e:
-                        print(f"Server error: {e}")
-
-                self.server_thread = threading.Thread(target=start_server, daemon=True)
-                self.server_thread.start()
-
-                # Step 2: Wait for server to start
-                self.root.after(
-                    0, lambda: self.update_progress("Waiting for server...")
+                # Step 1: Start the server process and wait until it listens
+                progress("Starting server...")
+                from jams.supervisor import start_server_process
+
+                self.server = start_server_process(
+                    host="0.0.0.0",
+                    port=LOCAL_PORT,
+                    on_restart=self.client.on_server_restarted,
                 )
-                time.sleep(3)  # Increased wait time to ensure server is ready
 
-                # Step 3: Connect client
-                self.root.after(
-                    0, lambda: self.update_progress("Connecting to server...")
-                )
-                max_retries = 5  # Increased retries
-                for attempt in range(max_retries):
-                    try:
-                        if self.client.connect_to_server(
-                            f"http://{LOCAL_IP}:{LOCAL_PORT}"
-                        ):
-                            self.root.after(
-                                0, lambda: self.update_progress("Connected to server")
-                            )
-                            time.sleep(1)  # Increased wait time
-
-                            # Step 4: Create room
-                            self.root.after(
-                                0, lambda: self.update_progress("Creating room...")
-                            )
-                            if self.client.create_room(self.username, self.color):
-                                self.root.after(
-                                    0, lambda: self.update_progress("Room created!")
-                                )
-                                time.sleep(0.5)
-
-                                # Step 5: Navigate to joinhostcode screen
-                                self.root.after(0, self.complete_loading)
-                                return
-                            else:
-                                self.root.after(
-                                    0,
-                                    lambda: self.update_progress(
-                                        "Failed to create room"
-                                    ),
-                                )
-                        else:
-                            self.root.after(
-                                0,
-                                lambda: self.update_progress(
-                                    f"Connection failed (attempt {attempt + 1})"
-                                ),
-                            )
-                    except Exception as e:
-                        self.root.after(
-                            0, lambda: self.update_progress(f"Connection error: {e}")
-                        )
-
-                    if attempt < max_retries - 1:
-                        time.sleep(2)  # Increased wait time between retries
-
-                self.root.after(0, lambda: self.update_progress("Failed to connect"))
+                # Step 2: Connect client (retries quickly if it isn't up yet)
+                progress("Connecting to server...")
+                if not self.client.connect_with_backoff(
+                    f"http://{LOCAL_IP}:{LOCAL_PORT}"
+                ):
+                    progress("Failed to connect")
+                    return
+                progress("Connected to server")
+
+                # Step 3: Create room
+                progress("Creating room...")
+                if self.client.create_room(self.username, self.color):
+                    progress("Room created!")
+                    # Step 4: Navigate to joinhostcode screen
+                    self.client.ui.post(self.complete_loading)
+                else:
+                    progress("Failed to create room")
 
             except Exception as e:
-                self.root.after(0, lambda: self.update_progress(f"Error: {e}"))
+                progress(f"Error: {e}")
 
         # Start loading in background thread
         loading_thread = threading.Thread(target=loading_process, daemon=True)
@@ -265,6 +201,7 @@ class LoadingScreen:
     def complete_loading(self):
         """Complete loading and navigate to joinhostcode screen."""
         self.loading_complete = True
+        self.frames.stop()
 
         # Navigate to joinhostcode screen
         x, y = self.root.winfo_x(), self.root.winfo_y()
@@ -286,4 +223,7 @@ class LoadingScreen:
                 self.client.sio.disconnect()
         except Exception as e:
             print(f"Error during disconnect: {e}")
+        self.frames.stop()
         self.root.destroy()
+        if hasattr(self.client, "close_before_room"):
+            self.client.close_before_room()
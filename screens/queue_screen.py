@@ -1,10 +1,139 @@
 import tkinter as tk
-from PIL import Image, ImageTk
-import os
-from utils.song import get_song_metadata, base64_to_image
 from .constants import *
 from jams.shared.song_queue import SongQueue
 
+ROW_HEIGHT = 44  # 40px thumbnail + 2px padding above and below
+
+
+class QueueRow:
+    """
+    One recyclable row of the queue list.
+    Rows are built once and re-bound to whichever queue index scrolls into
+    their slot; bind() only touches the widgets whose content changed.
+    """
+
+    def __init__(self, ui):
+        self.ui = ui
+        self.queue_idx = None
+        self.slot = None  # List position the row is placed at
+        self.shown = None  # (song_id, title, artist, thumbnail) currently displayed
+        self.frame = tk.Frame(ui.canvas, bg=WOOD_COLOR, cursor="hand2")
+        self.window_id = ui.canvas.create_window(
+            0, 0, window=self.frame, anchor="nw", height=ROW_HEIGHT - 4
+        )
+        # --- Spotify-style thumbnail with overlay and play icon ---
+        thumb_container = tk.Frame(self.frame, width=40, height=40, bg=WOOD_COLOR)
+        thumb_container.pack_propagate(False)
+        thumb_container.pack(side=tk.LEFT, padx=(0, 6))
+        self.thumb_label = tk.Label(thumb_container, bg=WOOD_COLOR)
+        self.thumb_label.place(x=0, y=0, width=40, height=40)
+        overlay = tk.Label(thumb_container, bg="#FFFFFF", width=40, height=40)
+        overlay.place(x=0, y=0, width=40, height=40)
+        overlay.lower()  # Hide overlay by default
+        overlay.place_forget()
+        play_icon = tk.Label(
+            overlay,
+            text="     ▶️",
+            bg="#FFFFFF",
+            fg="black",
+            font=("Helvetica", 16),
+            bd=0,
+        )
+        play_icon.place(relx=0.5, rely=0.5, anchor="center", width=40, height=40)
+        play_icon.lower()
+        play_icon.place_forget()
+
+        def show_overlay(event=None):
+            overlay.place(x=0, y=0, width=40, height=40)
+            overlay.lift()
+            play_icon.place(relx=0.5, rely=0.5, anchor="center", width=40, height=40)
+            play_icon.lift()
+
+        def hide_overlay(event=None):
+            overlay.place_forget()
+            play_icon.place_forget()
+
+        for widget in (thumb_container, self.thumb_label, overlay, play_icon):
+            widget.bind("<Enter>", show_overlay)
+            widget.bind("<Leave>", hide_overlay)
+
+        # Info (title, author)
+        info_frame = tk.Frame(self.frame, bg=WOOD_COLOR)
+        info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.title_label = tk.Label(
+            info_frame,
+            fg="white",
+            bg=WOOD_COLOR,
+            font=("Helvetica", 11, "bold"),
+            anchor="w",
+            justify="left",
+        )
+        self.title_label.pack(anchor="w", pady=0, fill="x")
+        self.author_label = tk.Label(
+            info_frame,
+            fg="gray",
+            bg=WOOD_COLOR,
+            font=("Helvetica", 9),
+            anchor="w",
+            justify="left",
+        )
+        self.author_label.pack(anchor="w", pady=0, fill="x")
+        # Thumbnail click: play and remove
+        play_icon.bind(
+            "<Button-1>", lambda e: ui.handle_thumbnail_click(self.queue_idx)
+        )
+        overlay.bind("<Button-1>", lambda e: ui.handle_thumbnail_click(self.queue_idx))
+        # Three-dot menu button (anchor right)
+        menu_btn = tk.Button(
+            self.frame,
+            text="⋮",
+            bg=WOOD_COLOR,
+            fg="white",
+            bd=0,
+            font=("Helvetica", 12),
+            activebackground="#5A2B1A",
+            activeforeground="white",
+            highlightthickness=0,
+            takefocus=0,
+            cursor="hand2",
+        )
+        menu_btn.pack(side=tk.RIGHT, padx=(30, 0), anchor="e")
+        menu_btn.bind(
+            "<Button-1>",
+            lambda e: ui.show_context_menu(e, self.queue_idx, menu_btn),
+        )
+
+    def show(self, queue_idx, slot, item, thumbnail):
+        """Show item in list slot; widgets are only updated on change."""
+        self.queue_idx = queue_idx
+        if slot != self.slot:
+            self.ui.canvas.coords(self.window_id, 4, slot * ROW_HEIGHT + 2)
+            self.ui.canvas.itemconfigure(self.window_id, state="normal")
+            self.slot = slot
+
+        if item is None:
+            # Record still on its way
+            shown = (None, "Loading...", "", None)
+        else:
+            shown = (item.song_id, item.title, item.artist, thumbnail)
+        if shown == self.shown:
+            return
+
+        _, title, author, thumbnail = shown
+        if self.shown is None or title != self.shown[1]:
+            self.title_label.config(text=self.ui.truncate(title))
+        if self.shown is None or author != self.shown[2]:
+            self.author_label.config(text=self.ui.truncate(author))
+        if self.shown is None or thumbnail is not self.shown[3]:
+            self.thumb_label.config(image=thumbnail or "")
+            self.thumb_label.image = thumbnail  # Keep a reference
+        self.shown = shown
+
+    def hide(self):
+        self.queue_idx = None
+        self.slot = None
+        self.ui.canvas.itemconfigure(self.window_id, state="hidden")
+
 
 class FireSideRadioQueueUI:
     def __init__(
@@ -14,11 +143,18 @@ class FireSideRadioQueueUI:
         on_thumbnail_click=None,
         on_add_url=None,
         on_shuffle_queue=None,
+        on_remove_from_queue=None,
+        on_request_covers=None,
+        thumbnail_cache=None,
     ):
         self.queue_manager = queue_manager
         self.on_thumbnail_click = on_thumbnail_click
         self.on_add_url = on_add_url
         self.on_shuffle_queue = on_shuffle_queue
+        self.on_remove_from_queue = on_remove_from_queue
+        self.on_request_covers = on_request_covers
+        self.thumbnail_cache = thumbnail_cache
+        self._redraw_pending = False
         self.win = tk.Toplevel(master)
         self.win.geometry("200x300")
         self.win.configure(bg=WOOD_COLOR)
@@ -74,16 +210,18 @@ class FireSideRadioQueueUI:
         # Search bar
         self.build_add_bar()
 
-        # Scrollable content frame for queue
-        self.canvas = tk.Canvas(self.win, bg=WOOD_COLOR, highlightthickness=0)
-        self.scrollable_frame = tk.Frame(self.canvas, bg=WOOD_COLOR)
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")),
+        # Virtualized queue list: only visible rows have widgets, and those
+        # rows are recycled as the list scrolls
+        self.canvas = tk.Canvas(
+            self.win,
+            bg=WOOD_COLOR,
+            highlightthickness=0,
+            yscrollincrement=ROW_HEIGHT,
         )
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.thumbnail_images = []  # Keep references to avoid garbage collection
+        self.canvas.bind("<Configure>", lambda e: self.display_queue())
+        self.rows = {}  # queue index -> QueueRow currently showing it
+        self.spare_rows = []  # Built rows not showing anything
         self.display_queue()
         # Bind mouse wheel to scroll
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
@@ -107,6 +245,19 @@ class FireSideRadioQueueUI:
             self.canvas.yview_scroll(-1, "units")
         elif event.num == 5:
             self.canvas.yview_scroll(1, "units")
+        self.display_queue()
+
+    def request_visible_covers(self):
+        """Ask for covers of the rows that are scrolled into view."""
+        if not self.on_request_covers:
+            return
+        hashes = []
+        for idx in self.rows:
+            record = self.queue_manager.get_song(idx)
+            if record and record.cover_hash:
+                hashes.append(record.cover_hash)
+        if hashes:
+            self.on_request_covers(hashes)
 
     def build_add_bar(self):
         self.add_bar = tk.Frame(self.win, bg=WOOD_COLOR)
@@ -169,156 +320,68 @@ class FireSideRadioQueueUI:
             self.on_shuffle_queue()
 
     def display_queue(self):
-        # Clear previous widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-
+        """Bring the visible rows in line with the queue, reusing row widgets."""
         start_idx = (
             self.queue_manager.current_idx + 1
             if hasattr(self.queue_manager, "current_idx")
             else 0
         )
+        count = max(len(self.queue_manager.queue) - start_idx, 0)
+        width = self.canvas.winfo_width()
+        self.canvas.configure(scrollregion=(0, 0, width, count * ROW_HEIGHT))
 
-        for pp in range(start_idx, len(self.queue_manager.queue)):
-            item = self.queue_manager.queue[pp]
-            self.create_list_tile(pp, item)
+        # Slots that are on screen, plus one row of overscan
+        top = max(self.canvas.canvasy(0), 0)
+        height = max(self.canvas.winfo_height(), ROW_HEIGHT)
+        first_slot = int(top // ROW_HEIGHT)
+        last_slot = min(int((top + height) // ROW_HEIGHT) + 1, count - 1)
+        visible = range(start_idx + first_slot, start_idx + last_slot + 1)
 
-    def create_list_tile(self, idx, item):
-        max_title_chars = 13
-        max_author_chars = 13
-        row = tk.Frame(self.scrollable_frame, bg=WOOD_COLOR, cursor="hand2")
-        row.pack(fill=tk.X, pady=2, padx=4)
-        # --- Spotify-style thumbnail with overlay and play icon ---
-        thumb_container = tk.Frame(row, width=40, height=40, bg=WOOD_COLOR)
-        thumb_container.pack_propagate(False)
-        thumb_container.pack(side=tk.LEFT, padx=(0, 6))
-        thumb_label = tk.Label(thumb_container, bg=WOOD_COLOR)
-        thumb_label.place(x=0, y=0, width=40, height=40)
-        overlay = tk.Label(thumb_container, bg="#FFFFFF", width=40, height=40)
-        overlay.place(x=0, y=0, width=40, height=40)
-        overlay.lower()  # Hide overlay by default
-        overlay.place_forget()
-        play_icon = tk.Label(
-            overlay,
-            text="     ▶️",
-            bg="#FFFFFF",
-            fg="black",
-            font=("Helvetica", 16),
-            bd=0,
-        )
-        play_icon.place(relx=0.5, rely=0.5, anchor="center", width=40, height=40)
-        play_icon.lower()
-        play_icon.place_forget()
+        # Free the rows that scrolled out (or whose song left the queue)
+        for idx in [idx for idx in self.rows if idx not in visible]:
+            row = self.rows.pop(idx)
+            row.hide()
+            self.spare_rows.append(row)
 
-        def show_overlay(event=None):
-            overlay.place(x=0, y=0, width=40, height=40)
-            overlay.lift()
-            play_icon.place(relx=0.5, rely=0.5, anchor="center", width=40, height=40)
-            play_icon.lift()
+        for idx in visible:
+            row = self.rows.get(idx)
+            if row is None:
+                row = self.spare_rows.pop() if self.spare_rows else QueueRow(self)
+                self.rows[idx] = row
+            item = self.queue_manager.get_song(idx)
+            thumbnail = self.get_thumbnail(item.cover_hash) if item else None
+            row.show(idx, idx - start_idx, item, thumbnail)
+            self.canvas.itemconfigure(row.window_id, width=max(width - 8, 1))
 
-        def hide_overlay(event=None):
-            overlay.place_forget()
-            play_icon.place_forget()
+        # Covers are fetched lazily, only for the rows on screen
+        self.win.after_idle(self.request_visible_covers)
 
-        thumb_container.bind("<Enter>", show_overlay)
-        thumb_container.bind("<Leave>", hide_overlay)
-        thumb_label.bind("<Enter>", show_overlay)
-        thumb_label.bind("<Leave>", hide_overlay)
-        overlay.bind("<Enter>", show_overlay)
-        overlay.bind("<Leave>", hide_overlay)
-        play_icon.bind("<Enter>", show_overlay)
-        play_icon.bind("<Leave>", hide_overlay)
-
-        # Thumbnail image logic
-        title = ""
-        author = ""
-
-        # Use metadata from the queue item (from server)
-        if item.get("cover_image"):
-            # Cover image is base64 string from server, convert back to PIL Image
-            try:
-                img = base64_to_image(item["cover_image"])
-                if img:
-                    img = img.resize((40, 40))
-                    thumb_img = ImageTk.PhotoImage(img)
-                    thumb_label.config(image=thumb_img)
-                    self.thumbnail_images.append(thumb_img)
-                title = item.get("title", item.get("name", ""))
-                author = item.get("artist", "")
-            except Exception as e:
-                print(f"Error converting base64 image: {e}")
-                title = item.get("title", item.get("name", ""))
-                author = item.get("artist", "")
-        elif "filepath" in item and os.path.exists(item["filepath"]):
-            # Fallback: extract from local file
-            try:
-                meta = get_song_metadata(item["filepath"])
-                if meta.get("cover_image"):
-                    # Convert base64 back to image
-                    img = base64_to_image(meta["cover_image"])
-                    if img:
-                        img = img.resize((40, 40))
-                        thumb_img = ImageTk.PhotoImage(img)
-                        thumb_label.config(image=thumb_img)
-                        self.thumbnail_images.append(thumb_img)
-                title = meta.get("title", "")
-                author = meta.get("artist", "")
-            except Exception:
-                title = os.path.basename(item["filepath"])
-                author = "Unknown Artist"
-        elif "url" in item:
-            thumb_label.config(text="🌐", font=("Helvetica", 7))
-            title = "Online Stream"
-            author = "DJ Web"
-        # Info (title, author)
-        info_frame = tk.Frame(row, bg=WOOD_COLOR)
-        info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        if len(title) > max_title_chars:
-            title = title[: max_title_chars - 3] + "..."
-        title_label = tk.Label(
-            info_frame,
-            text=title,
-            fg="white",
-            bg=WOOD_COLOR,
-            font=("Helvetica", 11, "bold"),
-            anchor="w",
-            justify="left",
-        )
-        title_label.pack(anchor="w", pady=0, fill="x")
-        if len(author) > max_author_chars:
-            author = author[: max_author_chars - 3] + "..."
-        author_label = tk.Label(
-            info_frame,
-            text=author,
-            fg="gray",
-            bg=WOOD_COLOR,
-            font=("Helvetica", 9),
-            anchor="w",
-            justify="left",
-        )
-        author_label.pack(anchor="w", pady=0, fill="x")
-        # Thumbnail click: play and remove
-        play_icon.bind("<Button-1>", lambda e, i=idx: self.handle_thumbnail_click(i))
-        overlay.bind("<Button-1>", lambda e, i=idx: self.handle_thumbnail_click(i))
-        # Three-dot menu button (anchor right)
-        menu_btn = tk.Button(
-            row,
-            text="⋮",
-            bg=WOOD_COLOR,
-            fg="white",
-            bd=0,
-            font=("Helvetica", 12),
-            activebackground="#5A2B1A",
-            activeforeground="white",
-            highlightthickness=0,
-            takefocus=0,
-            cursor="hand2",
-        )
-        menu_btn.pack(side=tk.RIGHT, padx=(30, 0), anchor="e")
-        menu_btn.bind(
-            "<Button-1>", lambda e, i=idx, b=menu_btn: self.show_context_menu(e, i, b)
+    def truncate(self, text, max_chars=13):
+        if len(text) > max_chars:
+            return text[: max_chars - 3] + "..."
+        return text
+
+    def get_thumbnail(self, cover_hash):
+        """40x40 cover from the shared cache; the row updates once it's decoded."""
+        if not cover_hash or self.thumbnail_cache is None:
+            return None
+        return self.thumbnail_cache.get(
+            cover_hash,
+            (40, 40),
+            self.queue_manager.records.get_cover(cover_hash),
+            on_ready=lambda _: self.schedule_redraw(),
         )
 
+    def schedule_redraw(self):
+        """Redraw once after a burst of thumbnails finished decoding."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.win.after_idle(self._redraw)
+
+    def _redraw(self):
+        self._redraw_pending = False
+        self.display_queue()
+
     def show_context_menu(self, event, idx, btn):
         menu = tk.Menu(self.win, tearoff=0)
         menu.add_command(
@@ -327,12 +390,11 @@ class FireSideRadioQueueUI:
         menu.tk_popup(event.x_root, event.y_root)
 
     def remove_from_queue(self, idx):
+        # Sync with server if possible; the list redraws when the delta comes back
+        if self.on_remove_from_queue:
+            self.on_remove_from_queue(idx)
+            return
         self.queue_manager.remove_from_queue(idx)
-        # Sync with server if possible
-        app = getattr(self, "app", None)
-        client = getattr(app, "client", None) if app else None
-        if client and hasattr(client, "sync_queue_with_server"):
-            client.sync_queue_with_server(self.queue_manager.queue)
         self.display_queue()
 
     def handle_thumbnail_click(self, idx):
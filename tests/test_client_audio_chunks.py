@@ -0,0 +1,59 @@
+import base64
+
+from jams.client import Client
+
+
+class _Root:
+    """Stands in for the Tk root; the client only schedules and hides it."""
+
+    def after(self, ms, fn):
+        pass
+
+    def withdraw(self):
+        pass
+
+
+def _streaming_client():
+    client = Client(_Root())
+    client.connected = True
+    client.is_streaming = True
+    client.written = []
+    client.requested = []
+    client.play_audio_chunk = client.written.append
+    client.request_next_chunk = lambda room_code, index: client.requested.append(index)
+    return client
+
+
+def _chunk(index):
+    audio = bytes([index]) * 8
+    return {
+        "room_code": "ROOM",
+        "chunk_index": index,
+        "audio_data": base64.b64encode(audio).decode("utf-8"),
+    }
+
+
+def test_consecutive_chunks_all_play():
+    client = _streaming_client()
+    client.play_from_chunk("ROOM", 0)
+    audio_chunk = client.sio.handlers["/"]["audio_chunk"]
+
+    for index in range(4):
+        audio_chunk(_chunk(index))
+
+    assert client.requested == [0, 1, 2, 3, 4]
+    assert client.written == [bytes([index]) * 8 for index in range(4)]
+
+
+def test_chunk_from_before_a_seek_is_dropped():
+    client = _streaming_client()
+    client.play_from_chunk("ROOM", 0)
+    audio_chunk = client.sio.handlers["/"]["audio_chunk"]
+
+    audio_chunk(_chunk(0))
+    client.play_from_chunk("ROOM", 50)
+    audio_chunk(_chunk(1))
+    audio_chunk(_chunk(50))
+
+    assert client.requested == [0, 1, 50, 51]
+    assert client.written == [bytes([0]) * 8, bytes([50]) * 8]
@@ -0,0 +1,205 @@
+import json
+import os
+import struct
+import zlib
+
+from PIL import Image, ImageTk
+
+from custom_classes.custom_color import COLOR_NAMES
+
+PACK_PATH = "assets/.cache/sprites.pack"
+PACK_MAGIC = b"JPK1"
+
+
+def player_sprite_name(color_idx, side, mouth_open):
+    """Name of a player sprite: side is "L" or "R"."""
+    return f"player_H{side}{'O' if mouth_open else 'C'}{color_idx + 1}"
+
+
+def _asset_specs():
+    """name -> (candidate source paths, size to scale to or None)."""
+    specs = {
+        "stage": (["assets/stage_clean.png"], None),
+        "box": (["assets/other/Box.png"], (60, 67)),
+        "title_screen": (["assets/signs/title_screen.png"], None),
+        "host_code": (["assets/signs/host_code_thing.png"], None),
+        "join_code": (["assets/signs/join_code_enter_png.png"], None),
+        "character_host": (["assets/signs/character_selection_host.png"], None),
+        "character_join": (["assets/signs/character_join_thing.png"], None),
+    }
+    for i in range(1, 4):
+        specs[f"fire_{i}"] = ([f"assets/fire/Fire_{i}.png"], (157, 210))
+        specs[f"notes_{i}"] = ([f"assets/notes/Notes_{i}.png"], None)
+    for color_idx, color_name in enumerate(COLOR_NAMES):
+        for side in ("L", "R"):
+            for mouth_open in (False, True):
+                name = player_sprite_name(color_idx, side, mouth_open)
+                file_name = name[len("player_") :]
+                specs[name] = (
+                    [
+                        f"assets/allplayers/{file_name}.png",
+                        f"assets/players/{color_name}/{file_name}-removebg-preview.png",
+                    ],
+                    None,
+                )
+    return specs
+
+
+ASSET_SPECS = _asset_specs()
+
+
+def _source_path(name):
+    paths, _ = ASSET_SPECS[name]
+    return next((p for p in paths if os.path.exists(p)), None)
+
+
+def _specs_version():
+    # Changing a size or path in ASSET_SPECS invalidates old packs
+    return zlib.crc32(repr(sorted(ASSET_SPECS.items())).encode())
+
+
+def load_source_image(name):
+    """Decode (and scale) one asset straight from its PNG."""
+    path = _source_path(name)
+    if path is None:
+        raise FileNotFoundError(f"No source image for asset {name}")
+    img = Image.open(path).convert("RGBA")
+    size = ASSET_SPECS[name][1]
+    if size and img.size != size:
+        img = img.resize(size)
+    return img
+
+
+def pack_is_fresh(pack_path=PACK_PATH):
+    if not os.path.exists(pack_path):
+        return False
+    pack_mtime = os.path.getmtime(pack_path)
+    for name in ASSET_SPECS:
+        path = _source_path(name)
+        if path is not None and os.path.getmtime(path) > pack_mtime:
+            return False
+    return True
+
+
+def build_pack(pack_path=PACK_PATH):
+    """Write every asset, pre-scaled and decoded to raw RGBA, into one file.
+
+    Layout: magic, header length (u32), JSON header, then the pixel data.
+    The header maps each name to [width, height, offset, length].
+    """
+    entries = {}
+    blobs = []
+    offset = 0
+    for name in ASSET_SPECS:
+        try:
+            img = load_source_image(name)
+        except Exception as e:
+            print(f"Skipping asset {name}: {e}")
+            continue
+        data = img.tobytes()
+        entries[name] = [img.width, img.height, offset, len(data)]
+        blobs.append(data)
+        offset += len(data)
+
+    header = json.dumps({"version": _specs_version(), "entries": entries}).encode()
+    os.makedirs(os.path.dirname(pack_path), exist_ok=True)
+    tmp_path = pack_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(PACK_MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for data in blobs:
+            f.write(data)
+    os.replace(tmp_path, pack_path)
+    print(f"Wrote {len(entries)} assets ({offset // 1024} KiB) to {pack_path}")
+    return len(entries)
+
+
+class SpriteCache:
+    """
+    Process-wide store of the UI's PhotoImages.
+    Images come from the pre-scaled asset pack when it is up to date, and
+    from the source PNGs otherwise. Each asset is turned into a PhotoImage
+    once and then shared by every screen that asks for it.
+    Attributes:
+        pack_path (str): the asset pack written by build_pack().
+        from_pack (int), from_source (int): images loaded each way.
+    """
+
+    def __init__(self, pack_path=PACK_PATH):
+        self.pack_path = pack_path
+        self.from_pack = 0
+        self.from_source = 0
+        self._photos = {}
+        self._entries = None  # None until the pack was looked at
+        self._data = None
+
+    def get(self, name):
+        """Shared PhotoImage for an asset, or None if it can't be loaded."""
+        photo = self._photos.get(name)
+        if photo is None:
+            try:
+                photo = ImageTk.PhotoImage(self.image(name))
+            except Exception as e:
+                print(f"Could not load asset {name}: {e}")
+                return None
+            self._photos[name] = photo
+        return photo
+
+    def image(self, name):
+        """The asset as a PIL image (pack first, source PNG as fallback)."""
+        if self._entries is None:
+            self._open_pack()
+        entry = self._entries.get(name)
+        if entry is not None:
+            width, height, offset, length = entry
+            self.from_pack += 1
+            return Image.frombuffer(
+                "RGBA",
+                (width, height),
+                self._data[offset : offset + length],
+                "raw",
+                "RGBA",
+                0,
+                1,
+            )
+        self.from_source += 1
+        return load_source_image(name)
+
+    def _open_pack(self):
+        self._entries = {}
+        if not pack_is_fresh(self.pack_path):
+            print(
+                "Asset pack missing or stale, loading PNGs (run python -m utils.asset_pack)"
+            )
+            return
+        try:
+            with open(self.pack_path, "rb") as f:
+                if f.read(4) != PACK_MAGIC:
+                    raise ValueError("bad magic")
+                (header_len,) = struct.unpack("<I", f.read(4))
+                header = json.loads(f.read(header_len))
+                data = f.read()
+        except (OSError, ValueError) as e:
+            print(f"Could not read asset pack {self.pack_path}: {e}")
+            return
+        if header.get("version") != _specs_version():
+            print("Asset pack was built for other assets, loading PNGs")
+            return
+        self._entries = header["entries"]
+        self._data = memoryview(data)
+
+
+_sprite_cache = SpriteCache()
+
+
+def get_sprite(name):
+    """Shared PhotoImage for a packed asset (see ASSET_SPECS)."""
+    return _sprite_cache.get(name)
+
+
+if __name__ == "__main__":
+    if pack_is_fresh():
+        print(f"{PACK_PATH} is up to date")
+    else:
+        build_pack()
@@ -0,0 +1,177 @@
+"""
+Chunk streaming benchmark for the server backends (see jams.transport).
+For each backend a server process is started with a synthetic song
+loaded, and the same set of clients pulls chunks from it the way the
+player does: request a chunk, wait for it, request the next. Reports
+chunk round-trip latency and total throughput, optionally while the
+server also runs periodic CPU-bound jobs (like decoding a song).
+
+    python -m utils.bench_backends [--clients N] [--chunks N] [--burst-ms MS]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOM = "BENCH"
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _serve(backend, port, burst_ms):
+    """Child process: a JamServer with a minute of silence to stream."""
+    if backend == "eventlet":
+        import eventlet
+
+        eventlet.monkey_patch()
+    from jams.server import JamServer
+
+    server = JamServer(backend)
+    server.current_audio_data[ROOM] = bytes(60 * server.sample_rate * 2)
+
+    def burn(ms):
+        end = time.perf_counter() + ms / 1000
+        while time.perf_counter() < end:
+            pass
+
+    def bursts():
+        while True:
+            server.transport.sleep(1.0)
+            server.transport.spawn(burn, burst_ms)
+
+    def on_ready():
+        print("READY", flush=True)
+        # The server logs every chunk; keep that out of the measurement
+        sys.stdout = open(os.devnull, "w")
+        if burst_ms:
+            server.transport.spawn(bursts)
+
+    server.run(host="127.0.0.1", port=port, on_ready=on_ready)
+
+
+def _client(url, chunks, latencies, errors):
+    import socketio
+
+    sio = socketio.Client()
+    done = threading.Event()
+    sent = {}
+
+    def request(index):
+        sent[index] = time.perf_counter()
+        sio.emit("request_audio_chunk", {"room_code": ROOM, "chunk_index": index})
+
+    @sio.on("audio_chunk")
+    def on_chunk(data):
+        index = data["chunk_index"]
+        latencies.append(time.perf_counter() - sent.pop(index))
+        if index + 1 < chunks:
+            request(index + 1)
+        else:
+            done.set()
+
+    try:
+        sio.connect(url, wait_timeout=10)
+        request(0)
+        if not done.wait(120):
+            errors.append("timed out")
+    except Exception as e:
+        errors.append(str(e))
+    finally:
+        sio.disconnect()
+
+
+def run_backend(backend, port, clients, chunks, burst_ms):
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    with tempfile.TemporaryDirectory() as workdir:
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "utils.bench_backends",
+                "--serve",
+                backend,
+                "--port",
+                str(port),
+                "--burst-ms",
+                str(burst_ms),
+            ],
+            cwd=workdir,
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            for line in process.stdout:
+                if line.startswith("READY"):
+                    break
+            else:
+                raise RuntimeError(f"{backend} server exited before it was ready")
+
+            latencies, errors = [], []
+            threads = [
+                threading.Thread(
+                    target=_client,
+                    args=(f"http://127.0.0.1:{port}", chunks, latencies, errors),
+                )
+                for _ in range(clients)
+            ]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+        finally:
+            process.terminate()
+            process.wait()
+
+    latencies.sort()
+    count = len(latencies)
+    if not count:
+        raise RuntimeError(f"{backend}: no chunks received ({errors})")
+    return {
+        "chunks": count,
+        "errors": len(errors),
+        "p50_ms": latencies[count // 2] * 1000,
+        "p99_ms": latencies[min(count - 1, int(count * 0.99))] * 1000,
+        "max_ms": latencies[-1] * 1000,
+        "chunks_per_s": count / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--chunks", type=int, default=500)
+    parser.add_argument("--burst-ms", type=int, default=0)
+    parser.add_argument("--port", type=int, default=5099)
+    parser.add_argument("--serve", choices=("eventlet", "asyncio"))
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve, args.port, args.burst_ms)
+        return
+
+    print(
+        f"{args.clients} clients x {args.chunks} chunks, CPU burst {args.burst_ms}ms/s"
+    )
+    for backend in ("eventlet", "asyncio"):
+        try:
+            r = run_backend(
+                backend, args.port, args.clients, args.chunks, args.burst_ms
+            )
+        except Exception as e:
+            print(f"{backend:>8}: failed ({e})")
+            continue
+        print(
+            f"{backend:>8}: p50 {r['p50_ms']:.2f}ms  p99 {r['p99_ms']:.2f}ms"
+            f"  max {r['max_ms']:.1f}ms  {r['chunks_per_s']:.0f} chunks/s"
+            f"  ({r['chunks']} chunks, {r['errors']} errors)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Control-event latency while audio streams.
+A server process is started with a synthetic song loaded. Every client
+streams it the way the player does - request a chunk, hand it to an
+output that only takes about half a second of audio ahead, request the
+next - while one of them also times control round trips (a queue
+snapshot request and its reply) on its main connection. Run once with
+chunks on the main connection, as before the audio channel existed, and
+once with chunks on the audio channel (AUDIO_NAMESPACE).
+
+    python -m utils.bench_control [--clients N] [--seconds S] [--backend NAME]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOM = "BENCH"
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_RATE = 44100
+CHUNK_SECONDS = 4096 / 2 / SAMPLE_RATE
+OUTPUT_AHEAD = 0.5  # Seconds of audio the simulated device accepts in advance
+
+
+def _serve(backend, port):
+    """Child process: a JamServer with a room holding ten minutes of silence."""
+    if backend == "eventlet":
+        import eventlet
+
+        eventlet.monkey_patch()
+    from jams.server import JamServer
+
+    server = JamServer(backend)
+    server.rooms[ROOM] = {
+        "users": [],
+        "queue": [],
+        "host": None,
+        "current_idx": 0,
+        "queue_version": 0,
+    }
+    server.current_audio_data[ROOM] = bytes(600 * server.sample_rate * 2)
+
+    def on_ready():
+        print("READY", flush=True)
+        # The server logs every chunk; keep that out of the measurement
+        sys.stdout = open(os.devnull, "w")
+
+    server.run(host="127.0.0.1", port=port, on_ready=on_ready)
+
+
+class _Output:
+    """Paced like the real output: write() blocks while it is full."""
+
+    def __init__(self):
+        self.end = None
+
+    def write(self, seconds):
+        now = time.perf_counter()
+        self.end = max(self.end or now, now) + seconds
+        wait = self.end - now - OUTPUT_AHEAD
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _client(url, split, seconds, probe, latencies, errors):
+    import socketio
+    from screens.constants import AUDIO_NAMESPACE
+
+    sio = socketio.Client()
+    audio = socketio.Client() if split else sio
+    namespace = AUDIO_NAMESPACE if split else "/"
+    output = _Output()
+    stop = time.perf_counter() + seconds
+    replied = threading.Event()
+
+    def request(index):
+        audio.emit(
+            "request_audio_chunk",
+            {"room_code": ROOM, "chunk_index": index},
+            namespace=namespace,
+        )
+
+    def on_chunk(data):
+        output.write(CHUNK_SECONDS)
+        if time.perf_counter() < stop:
+            request(data["chunk_index"] + 1)
+
+    @sio.on("queue_snapshot")
+    def on_snapshot(data):
+        replied.set()
+
+    audio.on("audio_chunk", on_chunk, namespace=namespace)
+    try:
+        sio.connect(url, wait_timeout=10)
+        if split:
+            audio.connect(url, namespaces=[namespace], wait_timeout=10)
+        request(0)
+        # Let every client get its stream going before probing
+        time.sleep(1.0)
+        while probe and time.perf_counter() < stop - 1.0:
+            replied.clear()
+            sent = time.perf_counter()
+            sio.emit("request_queue_snapshot", {"room_code": ROOM})
+            if not replied.wait(5):
+                errors.append("no reply")
+                continue
+            latencies.append(time.perf_counter() - sent)
+            time.sleep(0.05)
+        time.sleep(max(0.0, stop - time.perf_counter()))
+    except Exception as e:
+        errors.append(str(e))
+    finally:
+        sio.disconnect()
+        if split:
+            audio.disconnect()
+
+
+def run_mode(backend, port, split, clients, seconds):
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    with tempfile.TemporaryDirectory() as workdir:
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "utils.bench_control",
+                "--serve",
+                backend,
+                "--port",
+                str(port),
+            ],
+            cwd=workdir,
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            for line in process.stdout:
+                if line.startswith("READY"):
+                    break
+            else:
+                raise RuntimeError(f"{backend} server exited before it was ready")
+
+            latencies, errors = [], []
+            threads = [
+                threading.Thread(
+                    target=_client,
+                    args=(
+                        f"http://127.0.0.1:{port}",
+                        split,
+                        seconds,
+                        i == 0,
+                        latencies,
+                        errors,
+                    ),
+                )
+                for i in range(clients)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            process.terminate()
+            process.wait()
+
+    latencies.sort()
+    count = len(latencies)
+    if not count:
+        raise RuntimeError(f"no control replies ({errors})")
+    return {
+        "probes": count,
+        "errors": len(errors),
+        "p50_ms": latencies[count // 2] * 1000,
+        "p99_ms": latencies[min(count - 1, int(count * 0.99))] * 1000,
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=15.0)
+    parser.add_argument(
+        "--backend", choices=("eventlet", "asyncio"), default="eventlet"
+    )
+    parser.add_argument("--port", type=int, default=5098)
+    parser.add_argument("--serve", choices=("eventlet", "asyncio"))
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve, args.port)
+        return
+
+    print(f"{args.clients} streaming clients, {args.seconds:.0f}s, {args.backend}")
+    for label, split in (("shared", False), ("split", True)):
+        try:
+            r = run_mode(args.backend, args.port, split, args.clients, args.seconds)
+        except Exception as e:
+            print(f"{label:>8}: failed ({e})")
+            continue
+        print(
+            f"{label:>8}: control p50 {r['p50_ms']:.2f}ms  p99 {r['p99_ms']:.2f}ms"
+            f"  max {r['max_ms']:.1f}ms  ({r['probes']} probes, {r['errors']} errors)"
+        )
+
+
+if __name__ == "__main__":
+    main()
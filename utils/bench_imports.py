@@ -0,0 +1,128 @@
+"""
+Import budget for the app's entry points.
+Each entry point is imported in a fresh interpreter under -X importtime.
+The check is on which heavy packages (HEAVY) it pulls in: the run fails
+when an entry point starts importing one its baseline doesn't list.
+Wall-clock import times (median of RUNS) are shown next to the recorded
+ones for information only; they vary too much between machines and
+runs to fail on.
+
+    python -m utils.bench_imports            # check against the baseline
+    python -m utils.bench_imports --update   # record a new baseline
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+
+ENTRY_POINTS = ["main", "jams.client", "screens.landing", "jams.server"]
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "importtime_baseline.json")
+RUNS = 5
+# Packages that are slow to import or only needed once a room is entered
+HEAVY = (
+    "PIL",
+    "eventlet",
+    "mutagen",
+    "numpy",
+    "pyaudio",
+    "pydub",
+    "pygame",
+    "sounddevice",
+    "uvicorn",
+)
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)")
+
+
+def _importtime(code):
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if out.returncode != 0:
+        error = out.stderr.strip().splitlines()[-1:] or ["import failed"]
+        raise RuntimeError(error[0])
+    for line in out.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            yield match.group(2), int(match.group(1))
+
+
+def measure(module):
+    """Import time (ms) of module and its imports, plus the modules it loaded."""
+    # Modules the interpreter loads before running anything are not ours
+    startup = {name for name, _ in _importtime("pass")}
+    total_us = 0
+    modules = []
+    for name, self_us in _importtime(f"import {module}"):
+        if name not in startup:
+            total_us += self_us
+            modules.append(name)
+    return total_us / 1000, modules
+
+
+def measure_median(module, runs=RUNS):
+    times = []
+    modules = []
+    for _ in range(runs):
+        elapsed_ms, modules = measure(module)
+        times.append(elapsed_ms)
+    times.sort()
+    return times[len(times) // 2], modules
+
+
+def heavy_packages(modules):
+    return sorted({name.split(".")[0] for name in modules} & set(HEAVY))
+
+
+def load_baseline():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(update=False):
+    baseline = load_baseline()
+    results = {}
+    failed = []
+    for module in ENTRY_POINTS:
+        try:
+            elapsed_ms, modules = measure_median(module)
+        except RuntimeError as e:
+            print(f"{module:>16}: could not import ({e})")
+            failed.append(module)
+            continue
+        heavy = heavy_packages(modules)
+        results[module] = {"heavy": heavy, "ms": round(elapsed_ms, 1)}
+
+        recorded = baseline.get(module)
+        if recorded is None:
+            print(
+                f"{module:>16}: {elapsed_ms:7.1f}ms, heavy: {', '.join(heavy) or '-'}"
+            )
+            continue
+        new = sorted(set(heavy) - set(recorded["heavy"]))
+        status = f"NEW HEAVY IMPORTS: {', '.join(new)}" if new else "ok"
+        print(
+            f"{module:>16}: {elapsed_ms:7.1f}ms (recorded {recorded['ms']:.1f}ms),"
+            f" heavy: {', '.join(heavy) or '-'} {status}"
+        )
+        if new:
+            failed.append(module)
+
+    if update:
+        baseline.update(results)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+        return 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(update="--update" in sys.argv[1:]))
@@ -0,0 +1,71 @@
+"""
+Startup benchmark: time to the first drawn frame with every UI image
+loaded, once from the source PNGs and once from the asset pack. Each run
+happens in a fresh interpreter so nothing is warm.
+
+    python -m utils.bench_startup [runs]
+"""
+
+import subprocess
+import sys
+import time
+
+from utils.asset_pack import PACK_PATH, build_pack, pack_is_fresh
+
+
+def _first_frame(pack_path):
+    start = time.perf_counter()
+    import tkinter as tk
+
+    from utils.asset_pack import ASSET_SPECS, SpriteCache
+
+    root = tk.Tk()
+    canvas = tk.Canvas(root, width=550, height=400, highlightthickness=0)
+    canvas.pack()
+    cache = SpriteCache(pack_path)
+    for name in ASSET_SPECS:
+        photo = cache.get(name)
+        if photo is not None:
+            canvas.create_image(0, 0, anchor="nw", image=photo)
+    root.update()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    root.destroy()
+    print(f"{elapsed_ms:.1f} {cache.from_pack} {cache.from_source}")
+
+
+def _run(pack_path):
+    out = subprocess.run(
+        [sys.executable, "-m", "utils.bench_startup", "--child", pack_path],
+        capture_output=True,
+        text=True,
+    )
+    last = out.stdout.strip().splitlines()[-1:] or [""]
+    try:
+        elapsed_ms, from_pack, from_source = last[0].split()
+    except ValueError:
+        raise RuntimeError(out.stderr.strip() or "benchmark child failed")
+    return float(elapsed_ms), int(from_pack), int(from_source)
+
+
+def main(runs=5):
+    if not pack_is_fresh():
+        build_pack()
+    # A pack path that does not exist makes SpriteCache decode the PNGs
+    modes = [("png", PACK_PATH + ".none"), ("pack", PACK_PATH)]
+    for label, pack_path in modes:
+        times = []
+        for _ in range(runs):
+            elapsed_ms, from_pack, from_source = _run(pack_path)
+            times.append(elapsed_ms)
+        times.sort()
+        print(
+            f"{label:>4}: median {times[len(times) // 2]:.1f}ms"
+            f" min {times[0]:.1f}ms ({from_pack} packed, {from_source} PNG)"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        _first_frame(sys.argv[2])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,116 @@
+import time
+import tkinter as tk
+
+
+class FrameScheduler:
+    """
+    One animation clock per window.
+    Registered animations are ticked from a single after() loop at the
+    target FPS. They stage canvas changes with set_item(); at the end of a
+    frame only items whose options actually changed get an itemconfig.
+    Frames are skipped while the window is hidden (except for animations
+    added with while_hidden=True), and each frame's cost is recorded (see
+    stats()).
+    Attributes:
+        fps (int): target frames per second.
+        last_frame_ms (float): cost of the most recent frame.
+        slow_frames (int): frames that took longer than the frame budget.
+    """
+
+    def __init__(self, window, canvas, fps=10):
+        self.window = window
+        self.canvas = canvas
+        self.fps = fps
+        self.frame_ms = 1000 // fps
+        self.frames = 0
+        self.skipped_frames = 0
+        self.slow_frames = 0
+        self.last_frame_ms = 0.0
+        self.max_frame_ms = 0.0
+        self._total_frame_ms = 0.0
+        # name -> [fn, every_ms, next_due, step, while_hidden]
+        self._animations = {}
+        self._applied = {}  # canvas item -> options last sent to Tk
+        self._dirty = {}  # canvas item -> options to send this frame
+        self._after_id = None
+
+    def add(self, name, fn, every_ms, while_hidden=False):
+        """Call fn(step) every every_ms; fn may return a new delay in ms.
+
+        step counts the calls of this animation, starting at 0.
+        """
+        self._animations[name] = [fn, every_ms, time.monotonic(), 0, while_hidden]
+
+    def remove(self, name):
+        self._animations.pop(name, None)
+
+    def set_item(self, item, **options):
+        """Stage canvas item options; unchanged options cost nothing."""
+        applied = self._applied.get(item, {})
+        changed = {k: v for k, v in options.items() if applied.get(k) != v}
+        if changed:
+            self._dirty.setdefault(item, {}).update(changed)
+
+    def start(self):
+        if self._after_id is None:
+            self._after_id = self.window.after(self.frame_ms, self._tick)
+
+    def stop(self):
+        if self._after_id is not None:
+            try:
+                self.window.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def stats(self):
+        return {
+            "fps": self.fps,
+            "frames": self.frames,
+            "skipped_frames": self.skipped_frames,
+            "slow_frames": self.slow_frames,
+            "last_frame_ms": self.last_frame_ms,
+            "avg_frame_ms": self._total_frame_ms / self.frames if self.frames else 0.0,
+            "max_frame_ms": self.max_frame_ms,
+        }
+
+    def _tick(self):
+        self._after_id = self.window.after(self.frame_ms, self._tick)
+        visible = self.window.winfo_viewable()
+        if not visible:
+            self.skipped_frames += 1
+
+        start = time.monotonic()
+        for name, animation in list(self._animations.items()):
+            fn, every_ms, next_due, step, while_hidden = animation
+            if start < next_due or not (visible or while_hidden):
+                continue
+            try:
+                delay = fn(step)
+            except Exception as e:
+                print(f"[UI] Animation {name} failed: {e}")
+                delay = None
+            animation[2] = start + (delay or every_ms) / 1000
+            animation[3] = step + 1
+
+        # Taken before applying, so a failed item is not retried next frame
+        dirty, self._dirty = self._dirty, {}
+        for item, options in dirty.items():
+            try:
+                self.canvas.itemconfig(item, **options)
+            except tk.TclError:
+                # The item was deleted mid-frame (e.g. a player left)
+                self._applied.pop(item, None)
+                continue
+            self._applied.setdefault(item, {}).update(options)
+        if not visible:
+            return
+
+        cost_ms = (time.monotonic() - start) * 1000
+        self.frames += 1
+        self.last_frame_ms = cost_ms
+        self.max_frame_ms = max(self.max_frame_ms, cost_ms)
+        self._total_frame_ms += cost_ms
+        if cost_ms > self.frame_ms:
+            self.slow_frames += 1
+            print(f"[UI] Slow frame: {cost_ms:.1f}ms (budget {self.frame_ms}ms)")
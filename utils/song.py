@@ -1,7 +1,9 @@
 import os
 import random
+import threading
+from collections import OrderedDict
 from mutagen.mp3 import MP3
-from mutagen.id3 import ID3
+from mutagen.id3 import ID3, ID3NoHeaderError
 from mutagen.id3._frames import APIC, TIT2, TPE1, TALB
 from PIL import Image
 import io
@@ -35,7 +37,62 @@ def base64_to_image(base64_str):
         return None
 
 
-def get_song_metadata(filepath):
+class SongMetadataCache:
+    """
+    Memoizes MP3 tag parsing by (path, size, mtime).
+    Only the text fields are cached, for at most max_entries files (least
+    recently used go first); a file that changed on disk replaces its old
+    entry. Album art is read from the file whenever a caller asks for it,
+    since the server keeps covers in its own library. Safe to share
+    between threads; tags are read outside the lock.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._fields = OrderedDict()  # (path, size, mtime) -> text metadata
+        self._keys = {}  # path -> its current key in _fields
+        self._lock = threading.Lock()
+
+    def _key(self, filepath):
+        stat = os.stat(filepath)
+        return (os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns)
+
+    def get(self, filepath, include_cover=False):
+        key = self._key(filepath)
+        with self._lock:
+            metadata = self._fields.get(key)
+            if metadata is not None:
+                self._fields.move_to_end(key)
+        if metadata is None:
+            metadata = _read_song_fields(filepath)
+            with self._lock:
+                self._store(key, metadata)
+        metadata = {**metadata, "filepath": filepath}
+        if include_cover:
+            metadata["cover_image"] = _read_cover_image(filepath)
+        return metadata
+
+    def _store(self, key, metadata):
+        stale = self._keys.get(key[0])
+        if stale is not None:
+            self._fields.pop(stale, None)
+        self._fields[key] = metadata
+        self._keys[key[0]] = key
+        while len(self._fields) > self.max_entries:
+            evicted, _ = self._fields.popitem(last=False)
+            if self._keys.get(evicted[0]) == evicted:
+                del self._keys[evicted[0]]
+
+
+_metadata_cache = SongMetadataCache()
+
+
+def get_song_metadata(filepath, include_cover=False):
+    """Title/artist/album/length of an mp3, plus cover_image if include_cover."""
+    return _metadata_cache.get(filepath, include_cover=include_cover)
+
+
+def _read_song_fields(filepath):
     # Extract metadata from a given mp3 file path
     audio = MP3(filepath, ID3=ID3)
     tags = audio.tags
@@ -46,26 +103,27 @@ def get_song_metadata(filepath):
             "artist": "Unknown Artist",
             "album": "Unknown Album",
             "length": int(audio.info.length),
-            "filepath": filepath,
-            "cover_image": None,
         }
-    metadata = {
+    return {
         "title": tags.get("TIT2", TIT2(encoding=3, text=["Unknown Title"])).text[0],
         "artist": tags.get("TPE1", TPE1(encoding=3, text=["Unknown Artist"])).text[0],
         "album": tags.get("TALB", TALB(encoding=3, text=["Unknown Album"])).text[0],
         "length": int(audio.info.length),
-        "filepath": filepath,
     }
+
+
+def _read_cover_image(filepath):
     # Extract album art
-    album_art = tags.getall("APIC") if hasattr(tags, "getall") else []
-    if album_art:
-        image_data = album_art[0].data
-        img = Image.open(io.BytesIO(image_data))
-        # Convert to base64 for JSON serialization
-        metadata["cover_image"] = image_to_base64(img)
-    else:
-        metadata["cover_image"] = None
-    return metadata
+    try:
+        tags = ID3(filepath)
+    except ID3NoHeaderError:
+        return None
+    album_art = tags.getall("APIC")
+    if not album_art:
+        return None
+    img = Image.open(io.BytesIO(album_art[0].data))
+    # Convert to base64 for JSON serialization
+    return image_to_base64(img)
 
 
 def get_random_song_metadata(song_dir):
@@ -76,7 +134,7 @@ def get_random_song_metadata(song_dir):
 
     song_file = random.choice(songs)
     full_path = os.path.join(song_dir, song_file)
-    return get_song_metadata(full_path)
+    return get_song_metadata(full_path, include_cover=True)
 
 
 # Example usage
@@ -0,0 +1,89 @@
+import queue
+import threading
+from collections import OrderedDict
+
+from PIL import ImageTk
+
+from utils.song import base64_to_image
+
+
+class ThumbnailCache:
+    """
+    LRU cache of cover thumbnails, keyed by (cover key, size).
+    Misses are decoded and resized on a worker thread; only the final
+    PhotoImage is created on the Tk thread (through the UI dispatcher),
+    after which the caller's on_ready callback runs.
+    Attributes:
+        max_bytes (int): approximate memory budget for cached images.
+        hits (int), misses (int): lookup counters, see stats().
+    """
+
+    def __init__(self, dispatcher, max_bytes=8 * 1024 * 1024):
+        self.dispatcher = dispatcher
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict()  # (key, size) -> (PhotoImage, bytes)
+        self._bytes = 0
+        self._pending = {}  # (key, size) -> [on_ready callbacks]
+        self._jobs = queue.SimpleQueue()
+        threading.Thread(target=self._decode_loop, daemon=True).start()
+
+    def get(self, key, size, cover_b64, on_ready=None):
+        """Return the PhotoImage, or None and call on_ready(photo) once decoded."""
+        if not key:
+            return None
+        cache_key = (key, size)
+        entry = self._images.get(cache_key)
+        if entry is not None:
+            self.hits += 1
+            self._images.move_to_end(cache_key)
+            return entry[0]
+
+        self.misses += 1
+        if not cover_b64:
+            return None
+        callbacks = self._pending.get(cache_key)
+        if callbacks is None:
+            self._pending[cache_key] = callbacks = []
+            self._jobs.put((cache_key, cover_b64))
+        if on_ready:
+            callbacks.append(on_ready)
+        return None
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._images),
+            "bytes": self._bytes,
+        }
+
+    def _decode_loop(self):
+        while True:
+            cache_key, cover_b64 = self._jobs.get()
+            img = base64_to_image(cover_b64)
+            if img is not None:
+                try:
+                    img = img.convert("RGB").resize(cache_key[1])
+                except Exception as e:
+                    print(f"Error resizing cover {cache_key[0]}: {e}")
+                    img = None
+            self.dispatcher.post(self._finish, cache_key, img)
+
+    def _finish(self, cache_key, img):
+        # Tk thread
+        callbacks = self._pending.pop(cache_key, [])
+        if img is None:
+            return
+        photo = ImageTk.PhotoImage(img)
+        size = img.width * img.height * 4
+        self._images[cache_key] = (photo, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes and len(self._images) > 1:
+            _, (_, evicted) = self._images.popitem(last=False)
+            self._bytes -= evicted
+        for on_ready in callbacks:
+            on_ready(photo)
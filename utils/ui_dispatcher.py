@@ -0,0 +1,51 @@
+import queue
+
+
+class UIDispatcher:
+    """
+    Runs callbacks posted from any thread on the Tk main loop.
+    Socket.IO handlers run on a background thread and must not touch Tk
+    widgets; they post() work here instead. The Tk loop drains the queue
+    once per frame. Calls posted with the same key inside one batch
+    collapse into the last one, so a burst of queue updates redraws once.
+    Attributes:
+        interval_ms (int): time between drains (one frame).
+        coalesced (int): calls skipped because a later call had the same key.
+    """
+
+    def __init__(self, root, interval_ms=16):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.coalesced = 0
+        self._calls = queue.SimpleQueue()
+        self.root.after(self.interval_ms, self._drain)
+
+    def post(self, fn, *args, key=None):
+        """Queue fn(*args) for the Tk thread. Safe to call from any thread."""
+        self._calls.put((key, fn, args))
+
+    def _drain(self):
+        batch = []
+        while True:
+            try:
+                batch.append(self._calls.get_nowait())
+            except queue.Empty:
+                break
+
+        # Keyed calls only run at their last position in the batch
+        last_index = {key: i for i, (key, _, _) in enumerate(batch) if key}
+        for i, (key, fn, args) in enumerate(batch):
+            if key and last_index[key] != i:
+                self.coalesced += 1
+                continue
+            try:
+                fn(*args)
+            except Exception as e:
+                print(
+                    f"[CLIENT] Error in UI callback {getattr(fn, '__name__', fn)}: {e}"
+                )
+                import traceback
+
+                traceback.print_exc()
+
+        self.root.after(self.interval_ms, self._drain)
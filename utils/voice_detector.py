@@ -1,8 +1,6 @@
 # Requires the 'sounddevice' package. Install with: pip install sounddevice
 import threading
 import time
-import numpy as np
-import sounddevice as sd
 
 
 def dB_to_amplitude(dB):
@@ -39,6 +37,10 @@ class VoiceDetector:
 
     def _run(self):
         try:
+            # Imported on the detector thread so startup never loads PortAudio
+            import numpy as np
+            import sounddevice as sd
+
             with sd.InputStream(
                 channels=1, samplerate=self.sample_rate, blocksize=self.chunk_size
             ) as stream: